@@ -13,14 +13,59 @@ class Settings(BaseSettings):
     static_dir: Path = base_dir / "app" / "static"
     data_dir: Path = base_dir / "app" / "data"
 
+    # Seconds between content_dir polls for new/edited markdown. 0 disables
+    # file polling; scheduled posts are still promoted at their publish time.
+    content_reload_seconds: int = 30
+
+    # Seconds between write-behind flushes of buffered blog like toggles.
+    like_flush_seconds: float = 2.0
+
+    # Seconds between writes of buffered LLM call telemetry (llm_calls table).
+    llm_telemetry_flush_seconds: float = 10.0
+
+    # Background jobs (feed refresh, brief generation); see app/services/job_runner.py.
+    job_workers: int = 2
+    job_max_attempts: int = 3  # an interrupted job is failed after this many runs
+    feed_fetch_interval_seconds: int = 6 * 3600
+
+    # Text-to-speech (daily brief, deep dives); see app/services/tts_pipeline.py.
+    tts_concurrency: int = 4
+    tts_retries: int = 2
+    tts_cache_dir: Path = base_dir / ".tts_cache"
+
+    # Marketplace analytics demo: multiplies the synthetic marketplace
+    # (1 = 12 sellers / ~650 sales; 2000 = ~1.3M sales).
+    marketplace_scale: int = 1
+
     # Database
     database_url: str = "sqlite:///./fullstackpm.db"
+    db_pool_size: int = 8
+    db_max_overflow: int = 8
+    # Serve read-heavy routes from a second, read-only SQLite engine.
+    db_read_only_engine: bool = False
+
+    # SQLite tuning, applied to every new connection (ignored for other databases).
+    sqlite_wal: bool = True
+    sqlite_synchronous: str = "NORMAL"  # safe with WAL; FULL fsyncs every commit
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kib: int = 64 * 1024
 
     # OpenAI API (for interview coach)
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
     openai_max_tokens: int = 2000
 
+    # Interview coach evaluation cache: resubmitted (or near-identical, by
+    # MinHash similarity) answers to the same question reuse the evaluation.
+    eval_cache_ttl_seconds: int = 7 * 24 * 3600
+    eval_cache_max_entries: int = 2000
+    # Near-duplicate answer matching (MinHash similarity); 0 = exact matches only.
+    eval_cache_near_threshold: float = 0.0
+
+    # SDE prep dashboard stats, cached per user until one of their writes.
+    sde_stats_cache_ttl_seconds: int = 300
+
     # Anthropic API (for feed AI processing)
     anthropic_api_key: str = ""
     anthropic_model: str = "claude-haiku-4-5-20251001"
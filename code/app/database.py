@@ -1,20 +1,175 @@
 # app/database.py
 """Database setup for blog comments."""
-from sqlalchemy import create_engine
+import logging
+import threading
+from typing import AsyncGenerator, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import StaticPool
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+def _sqlite_pragmas(read_only: bool = False) -> list:
+    pragmas = [
+        f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size = {settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size = -{settings.sqlite_cache_size_kib}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+    elif settings.sqlite_wal:
+        # WAL lets readers proceed while one writer commits; it persists in the file.
+        pragmas.insert(0, "PRAGMA journal_mode = WAL")
+    return pragmas
+
+
+def _install_pragmas(engine: Engine, read_only: bool) -> None:
+    pragmas = _sqlite_pragmas(read_only)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _sqlite_file(url: str):
+    """Database path for a file-backed SQLite URL, else None."""
+    if not url.startswith("sqlite"):
+        return None
+    database = make_url(url).database
+    return None if not database or database == ":memory:" else database
+
+
+def create_db_engine(url: str, read_only: bool = False) -> Engine:
+    """Engine for `url`. SQLite files get a connection pool (one connection
+    per concurrent checkout, never shared between threads) and the tuning
+    pragmas above on every new connection; in-memory SQLite keeps a single
+    shared connection since each connection would otherwise see its own
+    empty database."""
+    if not url.startswith("sqlite"):
+        return create_engine(url, pool_pre_ping=True)
+
+    database = _sqlite_file(url)
+    if database is None:
+        return create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+    if read_only:
+        url = f"sqlite:///file:{database}?mode=ro&uri=true"
+    engine = create_engine(
+        url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        connect_args={"check_same_thread": False},
+    )
+    _install_pragmas(engine, read_only)
+    return engine
+
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+aiosqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgresql+asyncpg": "postgresql+asyncpg",
+}
+
+
+def _async_url(url: str) -> str:
+    """Swap the sync driver for its asyncio counterpart (aiosqlite / asyncpg,
+    both in requirements.txt)."""
+    scheme, sep, rest = url.partition("://")
+    driver = _ASYNC_DRIVERS.get(scheme)
+    if driver is None:
+        raise ValueError(
+            f"DATABASE_URL scheme {scheme!r} has no supported async driver; use sqlite:// or postgresql://"
+        )
+    return f"{driver}{sep}{rest}"
+
+
+def create_async_db_engine(url: str, read_only: bool = False) -> AsyncEngine:
+    """Async counterpart of create_db_engine(), with the same pooling and pragmas."""
+    if not url.startswith("sqlite"):
+        return create_async_engine(_async_url(url), pool_pre_ping=True)
+
+    database = _sqlite_file(url)
+    if database is None:
+        return create_async_engine(_async_url(url), poolclass=StaticPool)
+
+    async_url = f"sqlite+aiosqlite:///file:{database}?mode=ro&uri=true" if read_only else _async_url(url)
+    engine = create_async_engine(
+        async_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    _install_pragmas(engine.sync_engine, read_only)
+    return engine
+
+
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    poolclass=StaticPool if "sqlite" in settings.database_url else None,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+engine = create_db_engine(settings.database_url)
+
+# Optional read-only engine for read-heavy routes (home, blog listings). It
+# shares the database file, so with WAL its readers never wait on writers.
+read_engine = (
+    create_db_engine(settings.database_url, read_only=True)
+    if settings.db_read_only_engine and settings.database_url.startswith("sqlite")
+    else engine
 )
 
+# Async engines for routes that run on the event loop (home, feed, blog,
+# likes, JoSAA scenarios): queries await the driver instead of blocking it.
+# They are created on first use, so a DATABASE_URL without an async driver
+# only fails those routes instead of the whole app at import.
+_async_engines: Dict[bool, AsyncEngine] = {}
+_async_engines_lock = threading.Lock()
+
+if settings.database_url.partition("://")[0] not in _ASYNC_DRIVERS:
+    logger.warning(
+        "DATABASE_URL has no supported async driver; async routes will fail, sync routes are unaffected"
+    )
+
+
+def get_async_engine(read_only: bool = False) -> AsyncEngine:
+    """The shared async engine (read_only: the read-only one, which is the
+    primary engine when DB_READ_ONLY_ENGINE is off)."""
+    read_only = read_only and read_engine is not engine
+    with _async_engines_lock:
+        if read_only not in _async_engines:
+            _async_engines[read_only] = create_async_db_engine(settings.database_url, read_only=read_only)
+        return _async_engines[read_only]
+
+
+class _LazyAsyncSessionmaker:
+    """async_sessionmaker whose engine is created on the first session."""
+
+    def __init__(self, read_only: bool = False) -> None:
+        self.read_only = read_only
+        self._factory = None
+
+    def __call__(self, **kwargs) -> AsyncSession:
+        if self._factory is None:
+            self._factory = async_sessionmaker(
+                get_async_engine(self.read_only), class_=AsyncSession, expire_on_commit=False, autoflush=False
+            )
+        return self._factory(**kwargs)
+
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+AsyncSessionLocal = _LazyAsyncSessionmaker()
+AsyncReadSessionLocal = _LazyAsyncSessionmaker(read_only=True)
 
 # Base class for models
 Base = declarative_base()
@@ -29,6 +184,36 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """Dependency for a session on the read-only engine (falls back to the
+    primary engine when DB_READ_ONLY_ENGINE is off)."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for an async database session."""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async session on the read-only engine (the primary one when it's off)."""
+    async with AsyncReadSessionLocal() as session:
+        yield session
+
+
+async def close_async_db() -> None:
+    """Dispose async connection pools on shutdown."""
+    with _async_engines_lock:
+        engines = list(_async_engines.values())
+    for async_engine in engines:
+        await async_engine.dispose()
+
+
 def init_db():
     """Create all tables."""
     Base.metadata.create_all(bind=engine)
@@ -51,16 +236,84 @@ def ensure_feed_layer2_columns() -> None:
         "ai_article_analysis": "ALTER TABLE feed_articles ADD COLUMN ai_article_analysis TEXT",
         "display_title": "ALTER TABLE feed_articles ADD COLUMN display_title VARCHAR(300)",
         "source_type": "ALTER TABLE feed_articles ADD COLUMN source_type VARCHAR(50)",
+        "canonical_url": "ALTER TABLE feed_articles ADD COLUMN canonical_url VARCHAR(1000)",
+        "simhash": "ALTER TABLE feed_articles ADD COLUMN simhash VARCHAR(16)",
+        "duplicate_of": "ALTER TABLE feed_articles ADD COLUMN duplicate_of INTEGER",
+        "sync_hash": "ALTER TABLE feed_articles ADD COLUMN sync_hash VARCHAR(32)",
     }
     with engine.begin() as conn:
         for column, statement in new_columns.items():
             if column not in existing:
                 conn.execute(text(statement))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_feed_articles_canonical_url ON feed_articles (canonical_url)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_feed_articles_duplicate_of ON feed_articles (duplicate_of)"))
 
 
 def ensure_pipeline_tables() -> None:
     """Create the pipeline audit tables (extracts, analyses, editorials, deep_dives)
     if they don't exist. Safe to call on every startup."""
     # Importing the models registers them on Base.metadata.
+    from sqlalchemy import inspect, text
+
     from app.models import pipeline_models  # noqa: F401
     Base.metadata.create_all(bind=engine)
+
+    existing = {col["name"] for col in inspect(engine).get_columns("article_extracts")}
+    if "simhash" not in existing:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE article_extracts ADD COLUMN simhash VARCHAR(16)"))
+
+
+def ensure_sde_prep_indexes() -> None:
+    """Idempotent migration: composite indexes behind the SDE prep dashboard
+    stats (see app/services/sde_prep_stats.py) on tables created before them."""
+    from sqlalchemy import inspect, text
+
+    indexes = {
+        "sde_leetcode_problems": [
+            ("ix_sde_problems_user_status", "user_id, status"),
+            ("ix_sde_problems_user_difficulty", "user_id, difficulty"),
+        ],
+        "sde_system_design_topics": [("ix_sde_topics_user_status", "user_id, status")],
+        "sde_daily_logs": [("ix_sde_daily_logs_user_date", "user_id, date")],
+    }
+    existing = set(inspect(engine).get_table_names())
+    with engine.begin() as conn:
+        for table, table_indexes in indexes.items():
+            if table not in existing:
+                continue
+            for name, columns in table_indexes:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def ensure_engagement_tables() -> None:
+    """Idempotent migration for blog likes/comments: enforce one like per
+    visitor with a unique (slug, user_id) index, index comments by
+    (slug, created_at), and rebuild the post_stats counters from the source
+    rows so they can never drift across restarts."""
+    from sqlalchemy import inspect, text
+
+    from app.models.post_stats import PostStats  # noqa: F401
+    Base.metadata.create_all(bind=engine)
+
+    inspector = inspect(engine)
+    unique_columns = [c["column_names"] for c in inspector.get_unique_constraints("likes")]
+    unique_columns += [i["column_names"] for i in inspector.get_indexes("likes") if i.get("unique")]
+    with engine.begin() as conn:
+        if ["blog_post_slug", "user_id"] not in unique_columns:
+            # Tables created before the constraint may hold duplicate likes.
+            conn.execute(text(
+                "DELETE FROM likes WHERE id NOT IN "
+                "(SELECT MIN(id) FROM likes GROUP BY blog_post_slug, user_id)"
+            ))
+            conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ux_likes_slug_user ON likes (blog_post_slug, user_id)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_comments_slug_created ON comments (blog_post_slug, created_at)"))
+        conn.execute(text("DELETE FROM post_stats"))
+        conn.execute(text(
+            "INSERT INTO post_stats (blog_post_slug, like_count, comment_count) "
+            "SELECT slug, SUM(is_like), SUM(is_comment) FROM ("
+            "  SELECT blog_post_slug AS slug, 1 AS is_like, 0 AS is_comment FROM likes"
+            "  UNION ALL"
+            "  SELECT blog_post_slug AS slug, 0 AS is_like, 1 AS is_comment FROM comments"
+            ") AS engagement GROUP BY slug"
+        ))
@@ -1,5 +1,6 @@
 # app/main.py
 import asyncio
+import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
 
@@ -9,23 +10,44 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from app.config import settings
-from app.database import SessionLocal, ensure_feed_layer2_columns, init_db
+from app.database import (
+    SessionLocal,
+    close_async_db,
+    ensure_engagement_tables,
+    ensure_feed_layer2_columns,
+    ensure_sde_prep_indexes,
+    init_db,
+)
 from app.models.like import Like  # noqa: F401 — ensures table is created by init_db
+from app.models.post_stats import PostStats  # noqa: F401 — ensures table is created by init_db
 from app.models.episode import Episode  # noqa: F401 — ensures table is created by init_db
 from app.models.narada_override import NaradaOverride  # noqa: F401 — ensures table is created by init_db
 from app.models.josaa_scenario import JosaaScenario  # noqa: F401 — ensures table is created by init_db
 from app.models.feed_article import FeedArticle  # noqa: F401 — ensures table is created by init_db
 from app.models.options_intel import OptionsIntelNotification  # noqa: F401 — ensures table is created by init_db
+from app.models.llm_call import LLMCall  # noqa: F401 — ensures table is created by init_db
+from app.models.background_job import BackgroundJob  # noqa: F401 — ensures table is created by init_db
 from app.routers import auth, backstory, blog, comments, daily_brief, feed, interview_coach, josaa_tool, learning_brief, likes, marketplace, narada_admin, newsletter, options_intel, pages, pm_multiverse, pm_prep, podcast, projects, resources, sde_prep, seo
 from app.services.content import ContentService
+from app.services.engagement import like_buffer
+from app.services.feed_jobs import REFRESH_JOB
 from app.services.feed_service import feed_service
+from app.services.intensive_progress import import_legacy_files
+from app.services.job_runner import job_runner
+from app.services.llm_clients import llm_clients
+from app.services.llm_telemetry import telemetry
 from app.services.reading_service import ReadingService
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
     ensure_feed_layer2_columns()
+    ensure_engagement_tables()
+    ensure_sde_prep_indexes()
+    import_legacy_files(SessionLocal, settings.data_dir)
 
     content_service = ContentService(settings.content_dir)
     content_service.load()
@@ -42,20 +64,70 @@ async def lifespan(app: FastAPI):
     finally:
         _sync_db.close()
 
+    # Slow work (feed refresh, brief generation) runs on the job runner;
+    # jobs left over from before a restart are picked up here.
+    await job_runner.start()
+
     # Background RSS fetch every 6 hours catches articles published between
-    # local feed pipeline runs. No AI processing — just URL capture.
+    # local feed pipeline runs. No AI processing — just URL capture. Goes
+    # through the job runner, so it merges with any refresh already queued.
     async def _fetch_loop():
         while True:
-            await asyncio.sleep(6 * 3600)
-            db = SessionLocal()
+            await asyncio.sleep(settings.feed_fetch_interval_seconds)
+            try:
+                await job_runner.submit(REFRESH_JOB)
+            except Exception as exc:
+                logger.warning("Scheduling feed refresh failed: %s", exc)
+
+    # Pick up new/edited posts without a restart, and publish scheduled
+    # (future-dated) posts at their publish time rather than at next boot.
+    # content_reload_seconds=0 turns off the directory polling and leaves
+    # only the publish timer (re-checked hourly when nothing is scheduled).
+    async def _content_watch_loop():
+        polling = settings.content_reload_seconds > 0
+        while True:
+            delay = settings.content_reload_seconds if polling else 3600
+            until_publish = content_service.seconds_until_next_publish()
+            if until_publish is not None:
+                delay = min(delay, max(until_publish, 1))
+            await asyncio.sleep(delay)
+            try:
+                await asyncio.to_thread(content_service.refresh, polling)
+            except Exception as exc:
+                logger.warning("Content reload failed: %s", exc)
+
+    # Write buffered like toggles in batches; see app/services/engagement.py.
+    async def _like_flush_loop():
+        while True:
+            await asyncio.sleep(settings.like_flush_seconds)
+            try:
+                await asyncio.to_thread(like_buffer.flush)
+            except Exception as exc:
+                logger.warning("Like flush failed: %s", exc)
+
+    # Write buffered LLM call telemetry; see app/services/llm_telemetry.py.
+    async def _telemetry_flush_loop():
+        while True:
+            await asyncio.sleep(settings.llm_telemetry_flush_seconds)
             try:
-                feed_service.fetch_all(db)
-            finally:
-                db.close()
+                await asyncio.to_thread(telemetry.flush)
+            except Exception as exc:
+                logger.warning("LLM telemetry flush failed: %s", exc)
 
     task = asyncio.create_task(_fetch_loop())
+    content_task = asyncio.create_task(_content_watch_loop())
+    like_task = asyncio.create_task(_like_flush_loop())
+    telemetry_task = asyncio.create_task(_telemetry_flush_loop())
     yield
     task.cancel()
+    content_task.cancel()
+    like_task.cancel()
+    telemetry_task.cancel()
+    await job_runner.stop()
+    like_buffer.flush()
+    telemetry.flush()
+    await llm_clients.aclose()
+    await close_async_db()
 
 
 app = FastAPI(
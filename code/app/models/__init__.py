@@ -9,6 +9,8 @@ from app.models.episode import Episode
 from app.models.josaa_scenario import JosaaScenario
 from app.models.feed_article import FeedArticle
 from app.models.options_intel import OptionsIntelNotification
+from app.models.llm_call import LLMCall
+from app.models.intensive_progress import IntensiveActivity, IntensiveNote, IntensiveProgress
 from app.models.sde_prep import (
     LeetCodeProblem,
     PracticeSession,
@@ -37,4 +39,8 @@ __all__ = [
     "JosaaScenario",
     "FeedArticle",
     "OptionsIntelNotification",
+    "LLMCall",
+    "IntensiveProgress",
+    "IntensiveActivity",
+    "IntensiveNote",
 ]
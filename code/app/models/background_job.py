@@ -0,0 +1,31 @@
+# app/models/background_job.py
+"""Persistent queue rows for app.services.job_runner."""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class BackgroundJob(Base):
+    """One queued, running or finished background job.
+
+    `active_key` holds the job's de-duplication key while it is queued or
+    running and is cleared when it finishes; the unique index on it is what
+    collapses concurrent submissions of the same work into one job.
+    """
+
+    __tablename__ = "background_jobs"
+    __table_args__ = (Index("ix_background_jobs_status_created", "status", "created_at"),)
+
+    id = Column(String(32), primary_key=True)
+    kind = Column(String(64), nullable=False)
+    status = Column(String(16), nullable=False, default="queued")  # queued | running | succeeded | failed
+    active_key = Column(String(128), nullable=True, unique=True)
+    params = Column(Text, nullable=True)   # JSON
+    result = Column(Text, nullable=True)   # JSON
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
@@ -2,7 +2,7 @@
 """Comment model for blog posts."""
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, Integer
+from sqlalchemy import Column, String, DateTime, Index, Integer
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -12,6 +12,7 @@ class Comment(Base):
     """Blog post comment."""
 
     __tablename__ = "comments"
+    __table_args__ = (Index("ix_comments_slug_created", "blog_post_slug", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     blog_post_slug = Column(String, index=True, nullable=False)
@@ -31,3 +31,11 @@ class FeedArticle(Base):
     ai_article_analysis = Column(Text, nullable=True)
     display_title = Column(String(300), nullable=True)  # cleaned headline, falls back to title
     source_type = Column(String(50), nullable=True)     # pm_practice | engineering | vc_essay | ai_research | vendor
+
+    # Near-duplicate clustering (see services/feed_dedup.py)
+    canonical_url = Column(String(1000), nullable=True, index=True)
+    simhash = Column(String(16), nullable=True)         # title+excerpt fingerprint, hex
+    duplicate_of = Column(Integer, nullable=True, index=True)  # cluster representative's id
+
+    # Content hash of the last payload received via /api/feed/sync (see services/feed_sync.py)
+    sync_hash = Column(String(32), nullable=True)
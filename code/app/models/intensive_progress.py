@@ -0,0 +1,64 @@
+# app/models/intensive_progress.py
+"""Progress, activity and notes for the private 8-week intensive tracker.
+
+Rows are keyed by `user_key`, the raw user_id cookie ("anonymous" when
+absent), as the JSON files they replace were. See
+app/services/intensive_progress.py.
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class IntensiveProgress(Base):
+    """Running totals for one user; counters are only ever incremented in SQL."""
+
+    __tablename__ = "intensive_progress"
+
+    user_key = Column(String(64), primary_key=True)
+    problems_solved = Column(Integer, default=0, nullable=False)
+    applications_submitted = Column(Integer, default=0, nullable=False)
+    interviews_completed = Column(Integer, default=0, nullable=False)
+    stories_written = Column(Integer, default=0, nullable=False)
+    designs_mastered = Column(Integer, default=0, nullable=False)
+    offers_received = Column(Integer, default=0, nullable=False)
+    weekly_stats = Column(Text, nullable=True)  # JSON object, as sent by the tracker
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class IntensiveActivity(Base):
+    """Append-only activity feed; trimmed to the newest rows per user."""
+
+    __tablename__ = "intensive_activity"
+    __table_args__ = (Index("ix_intensive_activity_user_id", "user_key", "id"),)
+
+    id = Column(Integer, primary_key=True)
+    user_key = Column(String(64), nullable=False)
+    message = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+
+class IntensiveNote(Base):
+    __tablename__ = "intensive_notes"
+    __table_args__ = (Index("ix_intensive_notes_user_id", "user_key", "id"),)
+
+    id = Column(Integer, primary_key=True)  # page cursor
+    note_id = Column(String(36), unique=True, nullable=False)  # public id (uuid4)
+    user_key = Column(String(64), nullable=False)
+    category = Column(String(50), nullable=False, default="other")
+    week = Column(String(20), nullable=True)
+    content = Column(Text, nullable=False, default="")
+    mood = Column(String(50), nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.note_id,
+            "category": self.category,
+            "week": self.week,
+            "content": self.content,
+            "mood": self.mood,
+            "timestamp": self.created_at.isoformat() if self.created_at else None,
+        }
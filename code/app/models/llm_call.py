@@ -0,0 +1,33 @@
+# app/models/llm_call.py
+"""Per-call LLM telemetry."""
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class LLMCall(Base):
+    """One LLM API call: who served it, what it cost, how long it took.
+
+    Written by app.services.llm_telemetry from both the web app and the
+    editorial pipeline. `stage` names the caller (e.g. "interview_coach",
+    "pipeline.analyse", "deep_dive") so spend and latency can be broken down
+    per feature.
+    """
+
+    __tablename__ = "llm_calls"
+    __table_args__ = (Index("ix_llm_calls_stage_created", "stage", "created_at"),)
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    stage = Column(String(64), nullable=False)
+    provider = Column(String(32), nullable=False)
+    model = Column(String(100), nullable=False)
+    input_tokens = Column(Integer, nullable=False, default=0)
+    output_tokens = Column(Integer, nullable=False, default=0)
+    latency_ms = Column(Float, nullable=False, default=0.0)
+    retries = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=False, default=0.0)
+    success = Column(Boolean, nullable=False, default=True)
+    error = Column(Text, nullable=True)
@@ -25,6 +25,7 @@ class ArticleExtract(Base):
     fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     success = Column(Boolean, default=False, nullable=False)
     error = Column(Text, nullable=True)
+    simhash = Column(String(16), nullable=True)     # full-text fingerprint, hex
 
 
 class ArticleAnalysis(Base):
@@ -0,0 +1,22 @@
+# app/models/post_stats.py
+"""Denormalized per-post engagement counters."""
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class PostStats(Base):
+    """Like and comment counts per blog post slug.
+
+    Maintained in the same transaction as the likes/comments rows they
+    count, so reads are a primary-key lookup instead of a COUNT(*).
+    ensure_engagement_tables() rebuilds it from the source tables on startup.
+    """
+
+    __tablename__ = "post_stats"
+
+    blog_post_slug = Column(String, primary_key=True)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -14,6 +14,7 @@ from sqlalchemy import (
     Enum as SqlEnum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -63,6 +64,10 @@ class LeetCodeProblem(Base):
     """LeetCode problem tracker."""
 
     __tablename__ = "sde_leetcode_problems"
+    __table_args__ = (
+        Index("ix_sde_problems_user_status", "user_id", "status"),
+        Index("ix_sde_problems_user_difficulty", "user_id", "difficulty"),
+    )
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     id = Column(Integer, primary_key=True, index=True)
@@ -152,6 +157,7 @@ class SystemDesignTopic(Base):
     """System design topic tracker."""
 
     __tablename__ = "sde_system_design_topics"
+    __table_args__ = (Index("ix_sde_topics_user_status", "user_id", "status"),)
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     id = Column(Integer, primary_key=True, index=True)
@@ -344,6 +350,7 @@ class DailyLog(Base):
     """Daily progress log."""
 
     __tablename__ = "sde_daily_logs"
+    __table_args__ = (Index("ix_sde_daily_logs_user_date", "user_id", "date"),)
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     id = Column(Integer, primary_key=True, index=True)
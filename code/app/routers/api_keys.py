@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/keys", tags=["api-keys"])
 
 # Constants
-SUPPORTED_PROVIDERS = list(PROVIDER_PRICING.keys())
+SUPPORTED_PROVIDERS = [p for p in PROVIDER_PRICING if p != "xai"]  # xai is pipeline-only
 SESSION_COOKIE_NAME = "llm_api_key"
 
 
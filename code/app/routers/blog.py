@@ -1,33 +1,21 @@
 # app/routers/blog.py
 from datetime import datetime
-from typing import List
+from typing import Optional
 
 from fastapi import APIRouter, Cookie, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy import select
 
 from app.config import settings
-from app.database import SessionLocal
+from app.database import AsyncReadSessionLocal
 from app.models.comment import Comment
-from app.models.like import Like
+from app.services.engagement import like_buffer
 
 router = APIRouter()
 templates = Jinja2Templates(directory=str(settings.templates_dir))
 
 
-def _group_by_month(posts: List) -> List[dict]:
-    """Group posts into [{month: 'March 2026', posts: [...]}] preserving sort order."""
-    grouped: List[dict] = []
-    current_month: str = ""
-    for post in posts:
-        month = post.date.strftime("%B %Y")
-        if month != current_month:
-            current_month = month
-            grouped.append({"month": month, "posts": []})
-        grouped[-1]["posts"].append(post)
-    return grouped
-
-
 def _ctx(request: Request, **kwargs) -> dict:
     """Build the standard template context."""
     return {
@@ -38,12 +26,18 @@ def _ctx(request: Request, **kwargs) -> dict:
     }
 
 
+async def _engagement(posts, visitor_id: Optional[str]) -> dict:
+    """Like/comment counts for a page of post cards in one round-trip."""
+    async with AsyncReadSessionLocal() as db:
+        return await like_buffer.bulk_state_async(db, [post.slug for post in posts], visitor_id)
+
+
 @router.get("/blog", response_class=HTMLResponse)
-async def blog_list(request: Request) -> HTMLResponse:
+async def blog_list(request: Request, blog_visitor_id: str = Cookie(default=None)) -> HTMLResponse:
     content_service = request.app.state.content_service
     posts, _ = content_service.get_posts(page=1, per_page=100)
     tags = content_service.get_all_tags()
-    grouped_posts = _group_by_month(posts)
+    grouped_posts = content_service.get_posts_by_month()
 
     return templates.TemplateResponse(
         "blog/list.html",
@@ -54,6 +48,7 @@ async def blog_list(request: Request) -> HTMLResponse:
             posts=posts,
             grouped_posts=grouped_posts,
             tags=tags,
+            engagement=await _engagement(posts, blog_visitor_id),
         ),
     )
 
@@ -73,19 +68,15 @@ async def blog_detail(
             status_code=404,
         )
 
-    db = SessionLocal()
-    comments = (
-        db.query(Comment)
-        .filter(Comment.blog_post_slug == slug)
-        .order_by(Comment.created_at.desc())
-        .all()
-    )
-    like_count = db.query(Like).filter(Like.blog_post_slug == slug).count()
-    liked = bool(blog_visitor_id and db.query(Like).filter(
-        Like.blog_post_slug == slug,
-        Like.user_id == blog_visitor_id,
-    ).first())
-    db.close()
+    async with AsyncReadSessionLocal() as db:
+        comments = (
+            await db.execute(
+                select(Comment)
+                .where(Comment.blog_post_slug == slug)
+                .order_by(Comment.created_at.desc())
+            )
+        ).scalars().all()
+        like_count, liked = await like_buffer.state_async(db, slug, blog_visitor_id)
 
     return templates.TemplateResponse(
         "blog/detail.html",
@@ -103,7 +94,12 @@ async def blog_detail(
 
 
 @router.get("/blog/tag/{tag}", response_class=HTMLResponse)
-async def blog_tag(request: Request, tag: str, page: int = Query(1, ge=1)) -> HTMLResponse:
+async def blog_tag(
+    request: Request,
+    tag: str,
+    page: int = Query(1, ge=1),
+    blog_visitor_id: str = Cookie(default=None),
+) -> HTMLResponse:
     content_service = request.app.state.content_service
     posts, total = content_service.get_posts_by_tag(tag, page=page, per_page=10)
     tags = content_service.get_all_tags()
@@ -119,6 +115,7 @@ async def blog_tag(request: Request, tag: str, page: int = Query(1, ge=1)) -> HT
             posts=posts,
             tags=tags,
             tag=tag,
+            engagement=await _engagement(posts, blog_visitor_id),
             page=page,
             has_newer=has_newer,
             has_older=has_older,
@@ -128,7 +125,11 @@ async def blog_tag(request: Request, tag: str, page: int = Query(1, ge=1)) -> HT
 
 # HTMX Endpoints
 @router.get("/api/blog/posts", response_class=HTMLResponse)
-async def blog_posts_htmx(request: Request, page: int = Query(1, ge=1)) -> HTMLResponse:
+async def blog_posts_htmx(
+    request: Request,
+    page: int = Query(1, ge=1),
+    blog_visitor_id: str = Cookie(default=None),
+) -> HTMLResponse:
     """HTMX endpoint for loading more blog posts."""
     content_service = request.app.state.content_service
     posts, total = content_service.get_posts(page=page, per_page=10)
@@ -139,6 +140,7 @@ async def blog_posts_htmx(request: Request, page: int = Query(1, ge=1)) -> HTMLR
         _ctx(
             request,
             posts=posts,
+            engagement=await _engagement(posts, blog_visitor_id),
             page=page,
             has_older=has_older,
         ),
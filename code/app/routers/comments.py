@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.comment import Comment
+from app.services.engagement import record_comment
 
 router = APIRouter(prefix="/api/comments", tags=["comments"])
 
@@ -44,6 +45,7 @@ async def create_comment(
         content=content.strip(),
     )
     db.add(comment)
+    record_comment(db, blog_post_slug)
     db.commit()
     db.refresh(comment)
 
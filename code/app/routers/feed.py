@@ -1,17 +1,24 @@
 # app/routers/feed.py
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from html import escape
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_async_read_db, get_db
 from app.models.feed_article import FeedArticle
+from app.services.artifact_cache import artifact_cache, file_stamp, stamp_time
 from app.services.brief_service import brief_service
+from app.services import feed_sync
+from app.services.feed_jobs import BRIEF_JOB, REFRESH_JOB
 from app.services.feed_service import feed_service
+from app.services.job_runner import job_runner
+from app.services.llm_telemetry import telemetry
 
 router = APIRouter()
 templates = Jinja2Templates(directory=str(settings.templates_dir))
@@ -31,8 +38,8 @@ def _check_editorial_token(token: str):
 
 
 @router.get("/feed", response_class=HTMLResponse)
-async def feed_page(request: Request, category: str = "all", db: Session = Depends(get_db)):
-    articles = feed_service.get_articles(db, category=category)
+async def feed_page(request: Request, category: str = "all", db: AsyncSession = Depends(get_async_read_db)):
+    articles = await feed_service.get_articles_async(db, category=category)
     return templates.TemplateResponse(
         "feed/index.html",
         {
@@ -110,87 +117,89 @@ async def editorial_page(request: Request, token: str = "", db: Session = Depend
     )
 
 
-@router.post("/api/feed/refresh", response_class=JSONResponse)
-async def refresh_feed(db: Session = Depends(get_db)):
-    """Fetch new RSS articles (no AI processing — run scripts/process_feed.py locally for that)."""
-    new_articles = feed_service.fetch_all(db)
-    return {"status": "ok", "new_articles": new_articles}
+@router.get("/feed/editorial/llm-telemetry", response_class=JSONResponse)
+def llm_telemetry_summary(token: str = "", hours: float = 24.0, db: Session = Depends(get_db)):
+    """LLM calls, p50/p95 latency, tokens and spend per stage — token-gated."""
+    _check_editorial_token(token)
+    telemetry.flush()
+    since = datetime.utcnow() - timedelta(hours=max(hours, 0))
+    return {"since": since.isoformat(), "stages": telemetry.summary(db, since=since)}
+
+
+@router.post("/api/feed/refresh", response_class=JSONResponse, status_code=202)
+async def refresh_feed():
+    """Queue an RSS fetch (no AI processing — run scripts/process_feed.py locally for that).
+    Concurrent requests share one run; poll /api/jobs/{id} for the result."""
+    job = await job_runner.submit(REFRESH_JOB)
+    return _job_accepted(job)
+
+
+@router.get("/api/feed/sync/manifest", response_class=JSONResponse)
+def sync_manifest(token: str = "", db: Session = Depends(get_db)):
+    """{url: content hash} of synced articles, so the local script sends only deltas."""
+    _check_editorial_token(token)
+    return {"hashes": feed_sync.sync_manifest(db)}
 
 
 @router.post("/api/feed/sync", response_class=JSONResponse)
-async def sync_articles(token: str = "", payload: dict = Body(...), db: Session = Depends(get_db)):
-    """Accept processed articles from the local machine and upsert into the DB.
+async def sync_articles(request: Request, token: str = "", db: Session = Depends(get_db)):
+    """Accept one chunk of processed articles from the local machine and upsert
+    it in a single transaction. Takes gzip'd NDJSON (see services/feed_sync.py)
+    or the legacy {"articles": [...]} JSON body.
     Preserves editorial decisions (is_editors_pick, is_dismissed) on existing articles."""
     _check_editorial_token(token)
-    articles = payload.get("articles", [])
-    inserted = updated = 0
-    ai_fields = (
-        "display_title", "ai_score", "ai_score_reason",
-        "ai_summary", "first_principle", "key_insight", "ai_insight",
-        "ai_article_analysis", "ai_processed_at",
-    )
-    for a in articles:
-        url = (a.get("url") or "").strip()
-        if not url:
-            continue
-        existing = db.query(FeedArticle).filter_by(url=url).first()
-        if existing:
-            for field in ai_fields:
-                val = a.get(field)
-                if val is not None:
-                    setattr(existing, field, val)
-            updated += 1
-        else:
-            pub = None
-            if a.get("published_at"):
-                try:
-                    pub = datetime.fromisoformat(a["published_at"])
-                except ValueError:
-                    pass
-            proc = None
-            if a.get("ai_processed_at"):
-                try:
-                    proc = datetime.fromisoformat(a["ai_processed_at"])
-                except ValueError:
-                    pass
-            db.add(FeedArticle(
-                title=(a.get("title") or "")[:500],
-                url=url,
-                excerpt=a.get("excerpt"),
-                source_name=a.get("source_name", ""),
-                source_category=a.get("source_category", ""),
-                published_at=pub,
-                display_title=a.get("display_title"),
-                ai_score=a.get("ai_score"),
-                ai_score_reason=a.get("ai_score_reason"),
-                ai_summary=a.get("ai_summary"),
-                first_principle=a.get("first_principle"),
-                key_insight=a.get("key_insight"),
-                ai_insight=a.get("ai_insight"),
-                ai_article_analysis=a.get("ai_article_analysis"),
-                ai_processed_at=proc,
-            ))
-            inserted += 1
-    db.commit()
-    return {"status": "ok", "inserted": inserted, "updated": updated}
+    try:
+        articles = feed_sync.decode_body(
+            await request.body(),
+            content_type=request.headers.get("content-type", ""),
+            content_encoding=request.headers.get("content-encoding", ""),
+        )
+    except feed_sync.SyncPayloadError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    result = await asyncio.to_thread(feed_sync.apply_articles, db, articles)
+    return {"status": "ok", **result}
 
 
-@router.post("/api/feed/brief/generate", response_class=JSONResponse)
-async def generate_brief(token: str = "", db: Session = Depends(get_db)):
-    """Manually trigger a fresh audio brief generation."""
+@router.post("/api/feed/brief/generate", response_class=JSONResponse, status_code=202)
+async def generate_brief(token: str = ""):
+    """Queue a fresh audio brief generation; poll /api/jobs/{id} for the result."""
     _check_editorial_token(token)
-    success = await brief_service.generate(db)
-    latest = brief_service.get_latest()
+    job = await job_runner.submit(BRIEF_JOB)
+    return _job_accepted(job)
+
+
+@router.get("/api/jobs/{job_id}", response_class=JSONResponse)
+def job_status(job_id: str):
+    job = job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def _job_accepted(job: dict) -> dict:
     return {
-        "status": "ok" if success else "error",
-        "generated": success,
-        "latest": latest,
+        "status": job["status"],
+        "job_id": job["id"],
+        "deduplicated": job["deduplicated"],
+        "status_url": f"/api/jobs/{job['id']}",
     }
 
 
 @router.get("/pm-brief.xml")
-async def podcast_rss():
+async def podcast_rss(request: Request):
     """Podcast RSS feed for PM Daily Brief."""
+    stamp = file_stamp(brief_service.manifest_path())
+    artifact = artifact_cache.get_or_build(
+        "pm-brief.xml",
+        stamp,
+        _render_pm_brief_rss,
+        media_type="application/rss+xml",
+        last_modified=stamp_time(stamp),
+    )
+    return artifact_cache.respond(request, artifact)
+
+
+def _render_pm_brief_rss() -> str:
     episodes = brief_service.get_all()
     items = ""
     for episode in episodes:
@@ -213,7 +222,7 @@ async def podcast_rss():
       <guid>{escaped_audio_url}</guid>
     </item>"""
 
-    rss = f"""<?xml version="1.0" encoding="UTF-8"?>
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">
   <channel>
     <title>PM Daily Brief</title>
@@ -231,7 +240,6 @@ async def podcast_rss():
     </image>{items}
   </channel>
 </rss>"""
-    return Response(content=rss, media_type="application/rss+xml")
 
 
 @router.post("/api/feed/article/{article_id}/pick", response_class=HTMLResponse)
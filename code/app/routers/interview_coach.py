@@ -3,16 +3,17 @@
 import json
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal, SessionLocal
 from app.models.interview_session import InterviewSession, InterviewAttempt
-from app.services.interview_evaluator import evaluate_interview_answer
+from app.services.interview_evaluator import evaluate_interview_answer, stream_interview_answer
 
 router = APIRouter()
 templates = Jinja2Templates(directory=str(settings.templates_dir))
@@ -155,6 +156,36 @@ async def interview_coach_practice(request: Request, category: str) -> HTMLRespo
     )
 
 
+def _find_question(category: str, question_id: str):
+    for q in INTERVIEW_QUESTIONS.get(category, []):
+        if q["id"] == question_id:
+            return q
+    return None
+
+
+def _parse_time_spent(value) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _attempt(session_id: str, question_id: str, answer_text: str, time_spent, result) -> InterviewAttempt:
+    return InterviewAttempt(
+        session_id=session_id,
+        question_id=question_id,
+        answer_text=answer_text,
+        overall_score=result.overall_score,
+        framework_score=result.framework_score,
+        structure_score=result.structure_score,
+        completeness_score=result.completeness_score,
+        strengths=json.dumps(result.strengths),
+        improvements=json.dumps(result.improvements),
+        suggested_framework=result.suggested_framework,
+        time_spent_sec=time_spent,
+    )
+
+
 @router.post("/api/interview-coach/submit", response_class=HTMLResponse)
 async def submit_interview_answer(request: Request) -> HTMLResponse:
     """Submit an interview answer for evaluation."""
@@ -162,51 +193,31 @@ async def submit_interview_answer(request: Request) -> HTMLResponse:
     session_id = form_data.get("session_id")
     question_id = form_data.get("question_id")
     answer_text = form_data.get("answer_text")
-    time_spent_sec = form_data.get("time_spent_sec")
     category = form_data.get("category")
 
     if not all([session_id, question_id, answer_text, category]):
         return "<div>Error: Missing required fields</div>"
 
-    try:
-        time_spent = int(time_spent_sec) if time_spent_sec else None
-    except (ValueError, TypeError):
-        time_spent = None
+    time_spent = _parse_time_spent(form_data.get("time_spent_sec"))
 
     try:
-        # Get the question
-        question = None
-        for q in INTERVIEW_QUESTIONS.get(category, []):
-            if q["id"] == question_id:
-                question = q
-                break
-
+        question = _find_question(category, question_id)
         if not question:
             return "<div>Error: Question not found</div>"
 
         # Evaluate answer
         result = await evaluate_interview_answer(
-            category=category, question=question["text"], answer=answer_text, time_spent_sec=time_spent
+            category=category,
+            question=question["text"],
+            answer=answer_text,
+            time_spent_sec=time_spent,
+            question_id=question_id,
         )
 
         # Save attempt to database
-        db = SessionLocal()
-        attempt = InterviewAttempt(
-            session_id=session_id,
-            question_id=question_id,
-            answer_text=answer_text,
-            overall_score=result.overall_score,
-            framework_score=result.framework_score,
-            structure_score=result.structure_score,
-            completeness_score=result.completeness_score,
-            strengths=json.dumps(result.strengths),
-            improvements=json.dumps(result.improvements),
-            suggested_framework=result.suggested_framework,
-            time_spent_sec=time_spent,
-        )
-        db.add(attempt)
-        db.commit()
-        db.close()
+        async with AsyncSessionLocal() as db:
+            db.add(_attempt(session_id, question_id, answer_text, time_spent, result))
+            await db.commit()
 
         # Return feedback HTML
         return templates.TemplateResponse(
@@ -220,3 +231,56 @@ async def submit_interview_answer(request: Request) -> HTMLResponse:
 
     except Exception as e:
         return f"<div class='text-danger'>Error evaluating answer: {str(e)}</div>"
+
+
+def _sse(event: str, data: str) -> str:
+    lines = "".join(f"data: {line}\n" for line in data.split("\n"))
+    return f"event: {event}\n{lines}\n"
+
+
+@router.post("/api/interview-coach/submit/stream")
+async def stream_interview_feedback(request: Request) -> StreamingResponse:
+    """Server-sent events version of submit: `progress` events carry the
+    evaluation text as it is generated, then one `result` event carries the
+    rendered feedback partial (or `error` with a message)."""
+    form_data = await request.form()
+    session_id = form_data.get("session_id")
+    question_id = form_data.get("question_id")
+    answer_text = form_data.get("answer_text")
+    category = form_data.get("category")
+    time_spent = _parse_time_spent(form_data.get("time_spent_sec"))
+    question = _find_question(category, question_id) if category and question_id else None
+
+    async def events():
+        if not all([session_id, answer_text]) or not question:
+            yield _sse("error", "Missing required fields")
+            return
+        try:
+            result = None
+            async for item in stream_interview_answer(
+                category=category,
+                question=question["text"],
+                answer=answer_text,
+                time_spent_sec=time_spent,
+                question_id=question_id,
+            ):
+                if isinstance(item, str):
+                    yield _sse("progress", item)
+                else:
+                    result = item
+            async with AsyncSessionLocal() as db:
+                db.add(_attempt(session_id, question_id, answer_text, time_spent, result))
+                await db.commit()
+        except Exception as e:
+            yield _sse("error", f"Error evaluating answer: {e}")
+            return
+        html = templates.get_template("interview-coach/partials/feedback.html").render(
+            request=request, result=result, answer_text=answer_text
+        )
+        yield _sse("result", html)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
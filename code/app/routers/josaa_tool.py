@@ -7,11 +7,12 @@ import secrets
 
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse, StreamingResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.templating import Jinja2Templates
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_async_db
 from app.models.josaa_scenario import JosaaScenario
 from app.services.josaa_service import JosaaQuery, get_josaa_service
 
@@ -42,14 +43,21 @@ def _get_or_create_session_key(request: Request) -> str:
     return secrets.token_urlsafe(18)
 
 
-def _list_scenarios(db: Session, session_key: str) -> list[JosaaScenario]:
-    return (
-        db.query(JosaaScenario)
-        .filter(JosaaScenario.session_key == session_key)
+async def _list_scenarios(db: AsyncSession, session_key: str) -> list[JosaaScenario]:
+    result = await db.execute(
+        select(JosaaScenario)
+        .where(JosaaScenario.session_key == session_key)
         .order_by(JosaaScenario.created_at.desc())
         .limit(20)
-        .all()
     )
+    return list(result.scalars())
+
+
+async def _get_scenario(db: AsyncSession, scenario_id: int, session_key: str) -> JosaaScenario | None:
+    result = await db.execute(
+        select(JosaaScenario).where(JosaaScenario.id == scenario_id, JosaaScenario.session_key == session_key)
+    )
+    return result.scalars().first()
 
 
 def _build_form_state(**kwargs) -> dict:
@@ -72,7 +80,7 @@ def _build_form_state(**kwargs) -> dict:
 
 
 @router.get("/tools/josaa-top-25", response_class=HTMLResponse)
-async def josaa_top_25_page(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+async def josaa_top_25_page(request: Request, db: AsyncSession = Depends(get_async_db)) -> HTMLResponse:
     # Keep GET ultra-fast: do NOT parse the large CSV on first page load.
     # Heavy dataset work is deferred to form submission.
     years = [2025, 2024, 2023, 2022, 2021, 2020]
@@ -103,7 +111,7 @@ async def josaa_top_25_page(request: Request, db: Session = Depends(get_db)) ->
             meta=None,
             error=error,
             round_insights=[],
-            saved_scenarios=_list_scenarios(db, session_key),
+            saved_scenarios=await _list_scenarios(db, session_key),
         ),
     )
     response.set_cookie("josaa_session_key", session_key, max_age=60 * 60 * 24 * 90)
@@ -113,7 +121,7 @@ async def josaa_top_25_page(request: Request, db: Session = Depends(get_db)) ->
 @router.post("/tools/josaa-top-25", response_class=HTMLResponse)
 async def josaa_top_25_run(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     rank: int = Form(...),
     history_window: int = Form(3),
     round_number: str = Form(""),
@@ -154,7 +162,7 @@ async def josaa_top_25_run(
                 meta=None,
                 error="JoSAA compute is temporarily disabled on current server size to protect site stability. Core pages remain fully available.",
                 round_insights=[],
-                saved_scenarios=_list_scenarios(db, _get_or_create_session_key(request)),
+                saved_scenarios=await _list_scenarios(db, _get_or_create_session_key(request)),
             ),
         )
 
@@ -204,7 +212,7 @@ async def josaa_top_25_run(
                 meta=None,
                 error="Quota and Gender pool are required inputs for accurate Top 25 predictions.",
                 round_insights=[],
-                saved_scenarios=_list_scenarios(db, _get_or_create_session_key(request)),
+                saved_scenarios=await _list_scenarios(db, _get_or_create_session_key(request)),
             ),
         )
 
@@ -271,7 +279,7 @@ async def josaa_top_25_run(
             meta=meta,
             error=error,
             round_insights=round_insights,
-            saved_scenarios=_list_scenarios(db, session_key),
+            saved_scenarios=await _list_scenarios(db, session_key),
         ),
     )
     response.set_cookie("josaa_session_key", session_key, max_age=60 * 60 * 24 * 90)
@@ -333,7 +341,7 @@ async def josaa_top25_save_scenario(
     scenario_name: str = Form("Untitled Scenario"),
     form_state_json: str = Form("{}"),
     shortlist_json: str = Form("[]"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     session_key = _get_or_create_session_key(request)
     item = JosaaScenario(
@@ -343,7 +351,7 @@ async def josaa_top25_save_scenario(
         shortlist_json=shortlist_json,
     )
     db.add(item)
-    db.commit()
+    await db.commit()
     return RedirectResponse(url="/tools/josaa-top-25", status_code=303)
 
 
@@ -352,17 +360,13 @@ async def josaa_top25_rename_scenario(
     request: Request,
     scenario_id: int,
     new_name: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     session_key = _get_or_create_session_key(request)
-    scenario = (
-        db.query(JosaaScenario)
-        .filter(JosaaScenario.id == scenario_id, JosaaScenario.session_key == session_key)
-        .first()
-    )
+    scenario = await _get_scenario(db, scenario_id, session_key)
     if scenario:
         scenario.name = (new_name or scenario.name)[:120]
-        db.commit()
+        await db.commit()
     return RedirectResponse(url="/tools/josaa-top-25", status_code=303)
 
 
@@ -370,17 +374,13 @@ async def josaa_top25_rename_scenario(
 async def josaa_top25_delete_scenario(
     request: Request,
     scenario_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     session_key = _get_or_create_session_key(request)
-    scenario = (
-        db.query(JosaaScenario)
-        .filter(JosaaScenario.id == scenario_id, JosaaScenario.session_key == session_key)
-        .first()
-    )
+    scenario = await _get_scenario(db, scenario_id, session_key)
     if scenario:
-        db.delete(scenario)
-        db.commit()
+        await db.delete(scenario)
+        await db.commit()
     return RedirectResponse(url="/tools/josaa-top-25", status_code=303)
 
 
@@ -388,15 +388,11 @@ async def josaa_top25_delete_scenario(
 async def josaa_top25_load_scenario(
     request: Request,
     scenario_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> HTMLResponse:
     service = get_josaa_service(settings.josaa_data_path)
     session_key = _get_or_create_session_key(request)
-    scenario = (
-        db.query(JosaaScenario)
-        .filter(JosaaScenario.id == scenario_id, JosaaScenario.session_key == session_key)
-        .first()
-    )
+    scenario = await _get_scenario(db, scenario_id, session_key)
 
     years = service.get_years()
     default_year = years[-1] if years else None
@@ -427,7 +423,7 @@ async def josaa_top25_load_scenario(
             meta=None,
             error=None,
             round_insights=[],
-            saved_scenarios=_list_scenarios(db, session_key),
+            saved_scenarios=await _list_scenarios(db, session_key),
             loaded_shortlist_json=scenario.shortlist_json if scenario else "[]",
         ),
     )
@@ -1,38 +1,38 @@
 # app/routers/likes.py
 import uuid
 from datetime import datetime
-from typing import Optional, Tuple
 
-from fastapi import APIRouter, Cookie, Request
+from fastapi import APIRouter, Cookie, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.exc import IntegrityError
 
 from app.config import settings
-from app.database import SessionLocal
-from app.models.like import Like
+from app.database import AsyncReadSessionLocal, AsyncSessionLocal
+from app.services.engagement import like_buffer
 
 router = APIRouter()
 templates = Jinja2Templates(directory=str(settings.templates_dir))
 
 _COOKIE = "blog_visitor_id"
 _COOKIE_MAX_AGE = 365 * 24 * 60 * 60  # 1 year
+_MAX_ENGAGEMENT_SLUGS = 100
 
 
 def _ctx(request: Request, **kwargs) -> dict:
     return {"request": request, "config": settings, "year": datetime.now().year, **kwargs}
 
 
-def _like_state(slug: str, visitor_id: Optional[str]) -> Tuple[int, bool]:
-    """Return (count, liked) for slug + visitor."""
-    db = SessionLocal()
-    count = db.query(Like).filter(Like.blog_post_slug == slug).count()
-    liked = bool(visitor_id and db.query(Like).filter(
-        Like.blog_post_slug == slug,
-        Like.user_id == visitor_id,
-    ).first())
-    db.close()
-    return count, liked
+@router.get("/api/blog/engagement")
+async def engagement(
+    slugs: str = Query(..., description="Comma-separated post slugs"),
+    blog_visitor_id: str = Cookie(default=None),
+) -> dict:
+    """Like/comment counts and the visitor's liked state for many posts at once."""
+    slug_list = [s.strip() for s in slugs.split(",") if s.strip()]
+    if len(slug_list) > _MAX_ENGAGEMENT_SLUGS:
+        raise HTTPException(status_code=400, detail=f"At most {_MAX_ENGAGEMENT_SLUGS} slugs per request")
+    async with AsyncReadSessionLocal() as db:
+        return await like_buffer.bulk_state_async(db, slug_list, blog_visitor_id)
 
 
 @router.post("/api/blog/{slug}/like", response_class=HTMLResponse)
@@ -47,29 +47,8 @@ async def toggle_like(
     if is_new_visitor:
         blog_visitor_id = str(uuid.uuid4())
 
-    db = SessionLocal()
-    try:
-        existing = db.query(Like).filter(
-            Like.blog_post_slug == slug,
-            Like.user_id == blog_visitor_id,
-        ).first()
-
-        if existing:
-            db.delete(existing)
-            db.commit()
-            liked = False
-        else:
-            db.add(Like(blog_post_slug=slug, user_id=blog_visitor_id))
-            db.commit()
-            liked = True
-
-        count = db.query(Like).filter(Like.blog_post_slug == slug).count()
-    except IntegrityError:
-        db.rollback()
-        liked = True
-        count = db.query(Like).filter(Like.blog_post_slug == slug).count()
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        count, liked = await like_buffer.toggle_async(db, slug, blog_visitor_id)
 
     response = templates.TemplateResponse(
         "partials/like_button.html",
@@ -11,7 +11,7 @@ from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 from app.config import settings
-from app.services.analytics import get_snapshot
+from app.services.analytics import get_snapshot, get_snapshot_timed
 
 router = APIRouter(prefix="/tools/marketplace-analytics")
 templates = Jinja2Templates(directory=str(settings.templates_dir))
@@ -49,7 +49,7 @@ def _filters(request: Request) -> Dict:
 @router.get("", response_class=HTMLResponse)
 async def marketplace_dashboard(request: Request) -> HTMLResponse:
     filters = _filters(request)
-    snapshot = get_snapshot(
+    snapshot, timing = get_snapshot_timed(
         date_range_days=filters["date_range"],
         category=filters["category"],
         sort_by=filters["sort_by"],
@@ -62,6 +62,7 @@ async def marketplace_dashboard(request: Request) -> HTMLResponse:
             title="Marketplace Analytics — fullstackpm.tech",
             current_page="/tools/marketplace-analytics",
             snapshot=snapshot,
+            timing=timing,
             **filters,
         ),
     )
@@ -70,7 +71,7 @@ async def marketplace_dashboard(request: Request) -> HTMLResponse:
 @router.get("/partials/dashboard", response_class=HTMLResponse)
 async def marketplace_dashboard_partial(request: Request) -> HTMLResponse:
     filters = _filters(request)
-    snapshot = get_snapshot(
+    snapshot, timing = get_snapshot_timed(
         date_range_days=filters["date_range"],
         category=filters["category"],
         sort_by=filters["sort_by"],
@@ -78,7 +79,7 @@ async def marketplace_dashboard_partial(request: Request) -> HTMLResponse:
     )
     return templates.TemplateResponse(
         "marketplace-analytics/partials/dashboard.html",
-        _ctx(request, snapshot=snapshot, **filters),
+        _ctx(request, snapshot=snapshot, timing=timing, **filters),
     )
 
 
@@ -7,7 +7,7 @@ from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Resp
 from fastapi.templating import Jinja2Templates
 
 from app.config import settings
-from app.database import SessionLocal
+from app.database import AsyncReadSessionLocal
 from app.services.brief_service import brief_service
 from app.services.feed_service import feed_service
 
@@ -27,21 +27,17 @@ def _ctx(request: Request, **kwargs) -> dict:
 
 @router.get("/", response_class=HTMLResponse)
 async def home(request: Request) -> HTMLResponse:
-    db = SessionLocal()
-    try:
+    async with AsyncReadSessionLocal() as db:
         # Pick feature article: highest-scored across all categories (fallback to most recent)
-        feature_pool = feed_service.get_articles(db, category="all", limit=1)
+        feature_pool = await feed_service.get_articles_async(db, category="all", limit=1)
         feature = feature_pool[0] if feature_pool else None
 
         feature_id = feature.id if feature else None
+        top = await feed_service.get_top_by_category_async(db, ["pm", "engineering", "strategy", "ai"], per_category=4)
         articles_by_category = {
-            "pm":          [a for a in feed_service.get_articles(db, category="pm",          limit=4) if a.id != feature_id][:3],
-            "engineering": [a for a in feed_service.get_articles(db, category="engineering", limit=4) if a.id != feature_id][:3],
-            "strategy":    [a for a in feed_service.get_articles(db, category="strategy",    limit=4) if a.id != feature_id][:3],
-            "ai":          [a for a in feed_service.get_articles(db, category="ai",          limit=4) if a.id != feature_id][:3],
+            category: [a for a in candidates if a.id != feature_id][:3]
+            for category, candidates in top.items()
         }
-    finally:
-        db.close()
 
     return templates.TemplateResponse(
         "index.html",
@@ -16,22 +16,20 @@ from sqlalchemy.orm import Session
 from app.config import settings
 from app.database import get_db
 from app.models.episode import Episode
+from app.services.artifact_cache import artifact_cache, stamp_time
+from app.services.episode_catalogue import (
+    EpisodeCatalogue,
+    backstory_catalogue,
+    daily_brief_catalogue,
+    learning_brief_catalogue,
+)
+from app.services.file_streaming import stream_file
 
 router = APIRouter()
 templates = Jinja2Templates(directory=str(settings.templates_dir))
 templates.env.filters["rfc2822"] = lambda value: format_datetime(value)
 AUDIO_DIR = settings.static_dir / "podcast" / "audio"
 BACKSTORY_AUDIO_DIR = settings.static_dir / "podcast" / "the-backstory" / "audio"
-EPISODES_FILE = settings.static_dir / "podcast" / "episodes.json"
-LEARNING_BRIEF_FILE = settings.static_dir / "podcast" / "learning-brief" / "episodes.json"
-BACKSTORY_FILE = settings.static_dir / "podcast" / "the-backstory" / "episodes.json"
-
-
-def _load_episodes_json() -> list[dict]:
-    """Load episodes from JSON file — source of truth until remote publish populates the DB."""
-    if not EPISODES_FILE.exists():
-        return []
-    return json.loads(EPISODES_FILE.read_text()).get("episodes", [])
 
 
 def _ctx(request: Request, **kwargs) -> dict:
@@ -62,18 +60,29 @@ def _parse_tags(raw_tags: Optional[str]) -> List[str]:
 
 @router.get("/podcast", response_class=HTMLResponse)
 async def podcast_list(request: Request) -> HTMLResponse:
-    episodes = _load_episodes_json()
-    tags = sorted({tag for ep in episodes for tag in ep.get("tags", [])}, key=str.lower)
+    snap = daily_brief_catalogue.snapshot()
     return templates.TemplateResponse(
         "podcast/list.html",
-        _ctx(request, title="Daily Brief — fullstackpm.tech", current_page="/podcast", episodes=episodes, tags=tags),
+        _ctx(request, title="Daily Brief — fullstackpm.tech", current_page="/podcast", episodes=snap.episodes, tags=snap.tags),
     )
 
 
 @router.get("/podcast/feed.xml")
 async def podcast_feed(request: Request) -> Response:
-    episodes = _load_episodes_json()
+    snap = daily_brief_catalogue.snapshot()
+    artifact = artifact_cache.get_or_build(
+        "podcast/feed.xml",
+        snap.stamp,
+        lambda: _render_podcast_feed(request, snap.episodes),
+        media_type="application/rss+xml",
+        last_modified=stamp_time(snap.stamp),
+    )
+    return artifact_cache.respond(request, artifact)
+
+
+def _render_podcast_feed(request: Request, source_episodes) -> str:
     from datetime import timezone
+    episodes = [dict(ep) for ep in source_episodes]
     for ep in episodes:
         if isinstance(ep.get("date"), str):
             try:
@@ -92,20 +101,26 @@ async def podcast_feed(request: Request) -> Response:
         if not ep.get("duration_human"):
             secs = ep.get("duration_seconds") or 0
             ep["duration_human"] = f"{int(secs)//60}:{int(secs)%60:02d}"
-    xml = templates.get_template("podcast/feed.xml").render(
+    return templates.get_template("podcast/feed.xml").render(
         _ctx(request, episodes=episodes, title="Daily Brief — fullstackpm.tech", current_page="/podcast")
     )
-    return Response(
-        content=xml,
+
+
+def _show_feed_response(request: Request, catalogue: EpisodeCatalogue, template_name: str) -> Response:
+    snap = catalogue.snapshot()
+    artifact = artifact_cache.get_or_build(
+        template_name,
+        snap.stamp,
+        lambda: _render_show_feed(request, snap.episodes, template_name),
         media_type="application/rss+xml",
-        headers={"Cache-Control": "no-cache"},
+        last_modified=stamp_time(snap.stamp),
     )
+    return artifact_cache.respond(request, artifact)
 
 
-@router.get("/podcast/learning-brief/feed.xml")
-async def learning_brief_feed(request: Request) -> Response:
+def _render_show_feed(request: Request, source_episodes, template_name: str) -> str:
     from datetime import timezone
-    episodes = json.loads(LEARNING_BRIEF_FILE.read_text()).get("episodes", []) if LEARNING_BRIEF_FILE.exists() else []
+    episodes = [dict(ep) for ep in source_episodes]
     for ep in episodes:
         pub = ep.get("published_at") or ep.get("date", "")
         try:
@@ -113,69 +128,24 @@ async def learning_brief_feed(request: Request) -> Response:
         except Exception:
             ep["date_dt"] = datetime.now(timezone.utc)
         ep["audio_length_bytes"] = int(ep.get("audio_length_bytes") or 0)
-    xml = templates.get_template("podcast/learning_brief_feed.xml").render(
-        _ctx(request, episodes=episodes)
-    )
-    return Response(content=xml, media_type="application/rss+xml", headers={"Cache-Control": "no-cache"})
+    return templates.get_template(template_name).render(_ctx(request, episodes=episodes))
+
+
+@router.get("/podcast/learning-brief/feed.xml")
+async def learning_brief_feed(request: Request) -> Response:
+    return _show_feed_response(request, learning_brief_catalogue, "podcast/learning_brief_feed.xml")
 
 
 @router.get("/podcast/the-backstory/feed.xml")
 async def backstory_feed(request: Request) -> Response:
-    from datetime import timezone
-    episodes = json.loads(BACKSTORY_FILE.read_text()).get("episodes", []) if BACKSTORY_FILE.exists() else []
-    for ep in episodes:
-        pub = ep.get("published_at") or ep.get("date", "")
-        try:
-            ep["date_dt"] = datetime.fromisoformat(pub).replace(tzinfo=timezone.utc)
-        except Exception:
-            ep["date_dt"] = datetime.now(timezone.utc)
-        ep["audio_length_bytes"] = int(ep.get("audio_length_bytes") or 0)
-    xml = templates.get_template("podcast/backstory_feed.xml").render(
-        _ctx(request, episodes=episodes)
-    )
-    return Response(content=xml, media_type="application/rss+xml", headers={"Cache-Control": "no-cache"})
+    return _show_feed_response(request, backstory_catalogue, "podcast/backstory_feed.xml")
 
 
 def _stream_audio_from_dir(audio_dir: Path, filename: str, request: Request) -> Response:
-    import re as _re
     audio_path = audio_dir / filename
-    if not audio_path.exists() or not filename.endswith(".mp3"):
+    if not audio_path.is_file() or not filename.endswith(".mp3"):
         raise HTTPException(status_code=404, detail="Audio file not found")
-
-    file_size = audio_path.stat().st_size
-    range_header = request.headers.get("Range")
-
-    if range_header:
-        match = _re.match(r"bytes=(\d+)-(\d*)", range_header)
-        if match:
-            start = int(match.group(1))
-            end = int(match.group(2)) if match.group(2) else file_size - 1
-            end = min(end, file_size - 1)
-            chunk_size = end - start + 1
-            with open(audio_path, "rb") as f:
-                f.seek(start)
-                data = f.read(chunk_size)
-            return Response(
-                content=data,
-                status_code=206,
-                media_type="audio/mpeg",
-                headers={
-                    "Content-Range": f"bytes {start}-{end}/{file_size}",
-                    "Accept-Ranges": "bytes",
-                    "Content-Length": str(chunk_size),
-                    "Cache-Control": "public, max-age=86400",
-                },
-            )
-
-    return Response(
-        content=audio_path.read_bytes(),
-        media_type="audio/mpeg",
-        headers={
-            "Accept-Ranges": "bytes",
-            "Content-Length": str(file_size),
-            "Cache-Control": "public, max-age=86400",
-        },
-    )
+    return stream_file(audio_path, request, media_type="audio/mpeg")
 
 
 @router.get("/podcast/audio/{filename}")
@@ -196,11 +166,11 @@ async def stream_backstory_audio(filename: str, request: Request) -> Response:
 
 @router.get("/podcast/{slug}", response_class=HTMLResponse)
 async def podcast_detail(request: Request, slug: str) -> HTMLResponse:
-    episodes = _load_episodes_json()
-    episode = next((e for e in episodes if e.get("slug") == slug), None)
+    snap = daily_brief_catalogue.snapshot()
+    episode = snap.get(slug)
     if not episode:
         return templates.TemplateResponse("404.html", _ctx(request, title="Page Not Found", current_page=""), status_code=404)
-    index = next((i for i, e in enumerate(episodes) if e.get("slug") == slug), 0)
+    previous_episode, next_episode = snap.neighbours(slug)
     return templates.TemplateResponse(
         "podcast/detail.html",
         _ctx(
@@ -208,8 +178,8 @@ async def podcast_detail(request: Request, slug: str) -> HTMLResponse:
             title=f"{episode['title']} — Daily Brief",
             current_page="/podcast",
             episode=episode,
-            previous_episode=episodes[index + 1] if index + 1 < len(episodes) else None,
-            next_episode=episodes[index - 1] if index > 0 else None,
+            previous_episode=previous_episode,
+            next_episode=next_episode,
             tags=episode.get("tags", []),
         ),
     )
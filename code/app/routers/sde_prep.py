@@ -2,7 +2,7 @@
 """SDE prep tracker routes and APIs."""
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -15,7 +15,6 @@ from app.config import settings
 from app.database import get_db
 from app.models.sde_prep import (
     BehavioralStory,
-    DailyLog,
     DailyTask,
     DifficultyEnum,
     LeetCodeProblem,
@@ -26,6 +25,8 @@ from app.models.sde_prep import (
     SystemDesignTopic,
     WeekPlan,
 )
+from app.services import intensive_progress as intensive
+from app.services.sde_prep_stats import stats_cache
 
 router = APIRouter()
 templates = Jinja2Templates(directory=str(settings.templates_dir))
@@ -181,118 +182,7 @@ async def study_plan(request: Request, db: Session = Depends(get_db)) -> HTMLRes
 @router.get("/api/sde-prep/dashboard/stats")
 async def dashboard_stats(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
     user_id = get_current_user_id(request)
-    total = db.query(LeetCodeProblem).filter_by(user_id=user_id).count()
-    solved = (
-        db.query(LeetCodeProblem)
-        .filter_by(user_id=user_id)
-        .filter(LeetCodeProblem.status == ProblemStatusEnum.COMPLETED)
-        .count()
-    )
-    blind_75 = (
-        db.query(LeetCodeProblem)
-        .filter_by(user_id=user_id)
-        .filter(LeetCodeProblem.is_blind_75.is_(True))
-        .count()
-    )
-
-    def _count_difficulty(level: DifficultyEnum) -> int:
-        return (
-            db.query(LeetCodeProblem)
-            .filter_by(user_id=user_id)
-            .filter(LeetCodeProblem.difficulty == level)
-            .count()
-        )
-
-    by_difficulty = {
-        "EASY": _count_difficulty(DifficultyEnum.EASY),
-        "MEDIUM": _count_difficulty(DifficultyEnum.MEDIUM),
-        "HARD": _count_difficulty(DifficultyEnum.HARD),
-    }
-
-    topic_total = db.query(SystemDesignTopic).filter_by(user_id=user_id).count()
-    topic_confident = (
-        db.query(SystemDesignTopic)
-        .filter_by(user_id=user_id)
-        .filter(SystemDesignTopic.status == SystemDesignStatusEnum.CONFIDENT)
-        .count()
-    )
-
-    stories_total = db.query(BehavioralStory).filter_by(user_id=user_id).count()
-    stories_ready = (
-        db.query(BehavioralStory)
-        .filter_by(user_id=user_id)
-        .filter(BehavioralStory.is_ready.is_(True))
-        .count()
-    )
-
-    week = (
-        db.query(WeekPlan)
-        .filter_by(user_id=user_id)
-        .filter(WeekPlan.is_completed.is_(False))
-        .order_by(WeekPlan.week_number)
-        .first()
-        or db.query(WeekPlan)
-        .filter_by(user_id=user_id)
-        .order_by(WeekPlan.week_number.desc())
-        .first()
-    )
-
-    weekly_progress = [
-        {"week": w.week_number, "percentage": w.completion_percentage}
-        for w in db.query(WeekPlan)
-        .filter_by(user_id=user_id)
-        .order_by(WeekPlan.week_number)
-        .all()
-    ]
-
-    logs = db.query(DailyLog).filter_by(user_id=user_id).order_by(DailyLog.date.desc()).all()
-    streak = 0
-    expected = date.today()
-    for log in logs:
-        if log.date == expected:
-            streak += 1
-            expected = expected - timedelta(days=1)
-        else:
-            break
-
-    days = [date.today() - timedelta(days=i) for i in range(14)][::-1]
-    hours_map = {log.date: log.study_hours for log in logs}
-    study_hours = [hours_map.get(day, 0) for day in days]
-
-    return JSONResponse(
-        {
-            "leetcode": {
-                "solved": solved,
-                "total": total,
-                "percentage": round((solved / total * 100) if total else 0, 1),
-                "blind_75_count": blind_75,
-                "by_difficulty": by_difficulty,
-            },
-            "system_design": {
-                "confident": topic_confident,
-                "total": topic_total,
-                "percentage": round((topic_confident / topic_total * 100) if topic_total else 0, 1),
-            },
-            "behavioral": {
-                "ready": stories_ready,
-                "total": stories_total,
-                "percentage": round((stories_ready / stories_total * 100) if stories_total else 0, 1),
-            },
-            "current_week": {
-                "title": week.title if week else "",
-                "percentage": week.completion_percentage if week else 0,
-            },
-            "streak_days": streak,
-            "charts_data": {
-                "difficulty": by_difficulty,
-                "weekly_progress": weekly_progress,
-                "study_hours": {
-                    "labels": [day.strftime("%b %d") for day in days],
-                    "values": study_hours,
-                },
-            },
-        }
-    )
+    return JSONResponse(stats_cache.get(db, user_id))
 
 
 @router.get("/api/sde-prep/problems", response_class=HTMLResponse)
@@ -354,6 +244,7 @@ async def update_problem(
                 setattr(problem, field, payload[field])
 
         db.commit()
+        stats_cache.invalidate(user_id)
         db.refresh(problem)
         return JSONResponse(problem.to_dict())
     except (KeyError, SQLAlchemyError) as exc:
@@ -396,6 +287,7 @@ async def add_practice_session(
             problem.time_taken_minutes = session.time_taken_minutes
         db.add(session)
         db.commit()
+        stats_cache.invalidate(user_id)
         return JSONResponse({"status": "ok", "practice_id": session.id})
     except (ValueError, SQLAlchemyError) as exc:
         db.rollback()
@@ -537,6 +429,7 @@ async def update_system_design_topic(
             topic.practice_count = int(payload["practice_count"])
             topic.last_practiced = datetime.now()
         db.commit()
+        stats_cache.invalidate(user_id)
         db.refresh(topic)
         return JSONResponse(topic.to_dict())
     except (KeyError, SQLAlchemyError, ValueError) as exc:
@@ -575,6 +468,7 @@ async def create_behavioral(request: Request, db: Session = Depends(get_db)) ->
         )
         db.add(story)
         db.commit()
+        stats_cache.invalidate(user_id)
         db.refresh(story)
         return JSONResponse(story.to_dict())
     except SQLAlchemyError as exc:
@@ -619,6 +513,7 @@ async def update_behavioral(
         if "is_ready" in payload:
             story.is_ready = _bool_value(payload["is_ready"]) or False
         db.commit()
+        stats_cache.invalidate(user_id)
         db.refresh(story)
         return JSONResponse(story.to_dict())
     except (ValueError, SQLAlchemyError) as exc:
@@ -663,6 +558,7 @@ async def update_week(
         if "notes" in payload:
             week.notes = payload.get("notes")
         db.commit()
+        stats_cache.invalidate(user_id)
         db.refresh(week)
         return JSONResponse(week.to_dict())
     except (ValueError, SQLAlchemyError) as exc:
@@ -700,207 +596,107 @@ async def intensive_notes(request: Request) -> HTMLResponse:
 
 
 # ===== INTENSIVE PROGRESS API =====
+# Stored in SQLite via app.services.intensive_progress (formerly one JSON
+# file per user, rewritten on every call).
+
+def _intensive_user(request: Request) -> str:
+    return (request.cookies.get("user_id") or "anonymous")[:64]
+
+
+def _cursor(value: Optional[str]) -> Optional[int]:
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
 
-@router.get("/api/intensive-progress")
-async def get_intensive_progress(request: Request) -> JSONResponse:
-    """Get progress data for 8-week plan."""
-    import json
 
-    user_id = request.cookies.get("user_id") or "anonymous"
-    progress_file = settings.data_dir / f"intensive_progress_{user_id}.json"
+@router.get("/api/intensive-progress")
+async def get_intensive_progress(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
+    """Get progress data for 8-week plan (the newest activity entries only;
+    older ones via /api/intensive-progress/activity)."""
+    return JSONResponse(intensive.get_progress(db, _intensive_user(request)))
 
-    if progress_file.exists():
-        with open(progress_file, 'r') as f:
-            return JSONResponse(json.load(f))
 
-    return JSONResponse({
-        "problemsSolved": 0,
-        "applicationsSubmitted": 0,
-        "interviewsCompleted": 0,
-        "storiesWritten": 0,
-        "designsMastered": 0,
-        "offersReceived": 0,
-        "weeklyStats": {},
-        "recentActivity": []
-    })
+@router.get("/api/intensive-progress/activity")
+async def list_intensive_activity(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
+    """Activity log, newest first. Pass `next_before` back as `before` for the next page."""
+    items, next_before = intensive.list_activity(
+        db,
+        _intensive_user(request),
+        limit=intensive.page_size(request.query_params.get("limit")),
+        before=_cursor(request.query_params.get("before")),
+    )
+    return JSONResponse({"items": items, "next_before": next_before})
 
 
 @router.post("/api/intensive-progress/log")
-async def log_intensive_progress(request: Request) -> JSONResponse:
+async def log_intensive_progress(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
     """Log daily progress for 8-week plan."""
-    import json
-
-    user_id = request.cookies.get("user_id") or "anonymous"
     payload = await _read_payload(request)
+    try:
+        problems = int(payload.get("problems") or 0)
+        apps = int(payload.get("apps") or 0)
+        interviews = int(payload.get("interviews") or 0)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid payload") from exc
 
-    progress_file = settings.data_dir / f"intensive_progress_{user_id}.json"
-    progress_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Load existing progress
-    if progress_file.exists():
-        with open(progress_file, 'r') as f:
-            progress = json.load(f)
-    else:
-        progress = {
-            "problemsSolved": 0,
-            "applicationsSubmitted": 0,
-            "interviewsCompleted": 0,
-            "storiesWritten": 0,
-            "designsMastered": 0,
-            "offersReceived": 0,
-            "weeklyStats": {},
-            "recentActivity": []
-        }
-
-    # Update with new data
-    problems = int(payload.get("problems", 0))
-    apps = int(payload.get("apps", 0))
-    interviews = int(payload.get("interviews", 0))
-
-    progress["problemsSolved"] = progress.get("problemsSolved", 0) + problems
-    progress["applicationsSubmitted"] = progress.get("applicationsSubmitted", 0) + apps
-    progress["interviewsCompleted"] = progress.get("interviewsCompleted", 0) + interviews
-
-    # Add to recent activity
-    today = datetime.now().isoformat()
-    progress["recentActivity"].append({
-        "message": f"Logged: {problems} problems, {apps} applications, {interviews} interviews",
-        "timestamp": today
-    })
-
-    # Save progress
-    with open(progress_file, 'w') as f:
-        json.dump(progress, f, indent=2)
-
+    progress = intensive.log_progress(db, _intensive_user(request), problems, apps, interviews)
     return JSONResponse({"status": "ok", "progress": progress})
 
 
 @router.post("/api/intensive-progress/sync")
-async def sync_intensive_progress(request: Request) -> JSONResponse:
+async def sync_intensive_progress(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
     """Sync progress data to backend."""
-    import json
-
-    user_id = request.cookies.get("user_id") or "anonymous"
     payload = await _read_payload(request)
-
-    progress_file = settings.data_dir / f"intensive_progress_{user_id}.json"
-    progress_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(progress_file, 'w') as f:
-        json.dump(payload, f, indent=2)
-
+    try:
+        intensive.apply_progress(db, _intensive_user(request), payload)
+    except (TypeError, ValueError) as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid payload") from exc
     return JSONResponse({"status": "synced", "timestamp": datetime.now().isoformat()})
 
 
 @router.post("/api/intensive-progress")
-async def update_intensive_progress(request: Request) -> JSONResponse:
+async def update_intensive_progress(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
     """Update specific progress metric."""
-    import json
-
-    user_id = request.cookies.get("user_id") or "anonymous"
+    user_key = _intensive_user(request)
     payload = await _read_payload(request)
-
-    progress_file = settings.data_dir / f"intensive_progress_{user_id}.json"
-    progress_file.parent.mkdir(parents=True, exist_ok=True)
-
-    if progress_file.exists():
-        with open(progress_file, 'r') as f:
-            progress = json.load(f)
-    else:
-        progress = {
-            "problemsSolved": 0,
-            "applicationsSubmitted": 0,
-            "interviewsCompleted": 0,
-            "storiesWritten": 0,
-            "designsMastered": 0,
-            "offersReceived": 0,
-            "weeklyStats": {},
-            "recentActivity": []
-        }
-
-    # Update progress with payload
-    for key, value in payload.items():
-        if key in progress:
-            progress[key] = value
-
-    with open(progress_file, 'w') as f:
-        json.dump(progress, f, indent=2)
-
-    return JSONResponse(progress)
+    try:
+        intensive.apply_progress(db, user_key, payload)
+    except (TypeError, ValueError) as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid payload") from exc
+    return JSONResponse(intensive.get_progress(db, user_key))
 
 
 # ===== INTENSIVE NOTES API =====
 
 @router.get("/api/intensive-notes")
-async def get_intensive_notes(request: Request) -> JSONResponse:
-    """Get all notes for 8-week plan."""
-    import json
-
-    user_id = request.cookies.get("user_id") or "anonymous"
-    notes_file = settings.data_dir / f"intensive_notes_{user_id}.json"
-
-    if notes_file.exists():
-        with open(notes_file, 'r') as f:
-            return JSONResponse(json.load(f))
-
-    return JSONResponse([])
+async def get_intensive_notes(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
+    """Notes for 8-week plan, oldest first: the newest `limit` (default 100).
+    When older notes exist, X-Next-Before holds the cursor for `before`."""
+    notes, next_before = intensive.list_notes(
+        db,
+        _intensive_user(request),
+        limit=intensive.page_size(request.query_params.get("limit")),
+        before=_cursor(request.query_params.get("before")),
+    )
+    headers = {"X-Next-Before": str(next_before)} if next_before is not None else None
+    return JSONResponse(notes, headers=headers)
 
 
 @router.post("/api/intensive-notes")
-async def create_intensive_note(request: Request) -> JSONResponse:
+async def create_intensive_note(request: Request, db: Session = Depends(get_db)) -> JSONResponse:
     """Create a new note."""
-    import json
-    import uuid
-
-    user_id = request.cookies.get("user_id") or "anonymous"
     payload = await _read_payload(request)
-
-    notes_file = settings.data_dir / f"intensive_notes_{user_id}.json"
-    notes_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Load existing notes
-    if notes_file.exists():
-        with open(notes_file, 'r') as f:
-            notes = json.load(f)
-    else:
-        notes = []
-
-    # Create new note
-    new_note = {
-        "id": str(uuid.uuid4()),
-        "category": payload.get("category", "other"),
-        "week": payload.get("week"),
-        "content": payload.get("content", ""),
-        "mood": payload.get("mood"),
-        "timestamp": datetime.now().isoformat()
-    }
-
-    notes.append(new_note)
-
-    # Save notes
-    with open(notes_file, 'w') as f:
-        json.dump(notes, f, indent=2)
-
-    return JSONResponse(new_note)
+    return JSONResponse(intensive.create_note(db, _intensive_user(request), payload))
 
 
 @router.delete("/api/intensive-notes/{note_id}")
-async def delete_intensive_note(note_id: str, request: Request) -> JSONResponse:
+async def delete_intensive_note(note_id: str, request: Request, db: Session = Depends(get_db)) -> JSONResponse:
     """Delete a note."""
-    import json
-
-    user_id = request.cookies.get("user_id") or "anonymous"
-    notes_file = settings.data_dir / f"intensive_notes_{user_id}.json"
-
-    if not notes_file.exists():
-        raise HTTPException(status_code=404, detail="No notes found")
-
-    with open(notes_file, 'r') as f:
-        notes = json.load(f)
-
-    notes = [n for n in notes if n["id"] != note_id]
-
-    with open(notes_file, 'w') as f:
-        json.dump(notes, f, indent=2)
-
+    if not intensive.delete_note(db, _intensive_user(request), note_id):
+        raise HTTPException(status_code=404, detail="Note not found")
     return JSONResponse({"status": "deleted"})
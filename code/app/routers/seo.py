@@ -5,6 +5,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import Response
 
 from app.config import settings
+from app.services.artifact_cache import artifact_cache
 from app.services.feed import FeedService
 
 router = APIRouter()
@@ -13,20 +14,36 @@ router = APIRouter()
 @router.get("/feed.xml")
 async def rss_feed(request: Request) -> Response:
     content_service = request.app.state.content_service
-    posts, _ = content_service.get_posts(page=1, per_page=100)
-    feed_service = FeedService(
-        site_url=settings.site_url,
-        site_title=settings.site_title,
-        site_description=settings.site_description,
+
+    def build() -> str:
+        posts, _ = content_service.get_posts(page=1, per_page=100)
+        feed_service = FeedService(
+            site_url=settings.site_url,
+            site_title=settings.site_title,
+            site_description=settings.site_description,
+        )
+        return feed_service.generate_rss(posts)
+
+    artifact = artifact_cache.get_or_build(
+        "feed.xml", content_service.version, build, last_modified=content_service.last_modified
     )
-    xml_content = feed_service.generate_rss(posts)
-    return Response(content=xml_content, media_type="application/xml")
+    return artifact_cache.respond(request, artifact)
 
 
 @router.get("/sitemap.xml")
 async def sitemap(request: Request) -> Response:
     content_service = request.app.state.content_service
     today = date.today().isoformat()
+    artifact = artifact_cache.get_or_build(
+        "sitemap.xml",
+        (content_service.version, today),
+        lambda: _build_sitemap(content_service, today),
+        last_modified=content_service.last_modified,
+    )
+    return artifact_cache.respond(request, artifact)
+
+
+def _build_sitemap(content_service, today: str) -> str:
     base = settings.site_url
 
     static_pages = [
@@ -81,13 +98,12 @@ async def sitemap(request: Request) -> Response:
             f"  </url>"
         )
 
-    xml = (
+    return (
         '<?xml version="1.0" encoding="UTF-8"?>\n'
         '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
         + "\n".join(urls)
         + "\n</urlset>"
     )
-    return Response(content=xml, media_type="application/xml")
 
 
 @router.get("/robots.txt")
@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.feed_article import FeedArticle
+from app.services.llm_telemetry import telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +63,7 @@ class AIProcessingService:
         articles = (
             db.query(FeedArticle)
             .filter(FeedArticle.ai_processed_at.is_(None))
+            .filter(FeedArticle.duplicate_of.is_(None))
             .order_by(FeedArticle.fetched_at.desc())
             .limit(limit)
             .all()
@@ -133,12 +135,15 @@ class AIProcessingService:
         try:
             from anthropic import Anthropic
             client = Anthropic(api_key=settings.anthropic_api_key)
-            response = client.messages.create(
-                model=settings.anthropic_model,
-                max_tokens=600,
-                system=_ANALYSIS_SYSTEM,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            with telemetry.track("feed.article_analysis", "anthropic", settings.anthropic_model) as call:
+                response = client.messages.create(
+                    model=settings.anthropic_model,
+                    max_tokens=600,
+                    system=_ANALYSIS_SYSTEM,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                call.input_tokens = response.usage.input_tokens
+                call.output_tokens = response.usage.output_tokens
             analysis = response.content[0].text.strip()
             article.ai_article_analysis = analysis
             db.commit()
@@ -153,12 +158,15 @@ class AIProcessingService:
             from anthropic import Anthropic
 
             client = Anthropic(api_key=settings.anthropic_api_key)
-            response = client.messages.create(
-                model=settings.anthropic_model,
-                max_tokens=300,
-                system=_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            with telemetry.track("feed.ai_processing", "anthropic", settings.anthropic_model) as call:
+                response = client.messages.create(
+                    model=settings.anthropic_model,
+                    max_tokens=300,
+                    system=_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                call.input_tokens = response.usage.input_tokens
+                call.output_tokens = response.usage.output_tokens
             return response.content[0].text.strip()
         except Exception as exc:
             logger.error("Claude API call failed: %s", exc)
@@ -1,13 +1,27 @@
 """Marketplace analytics service.
 
 Generates deterministic mock data and aggregates metrics for the dashboard.
+
+Mock data is generated column-wise (MarketplaceColumns) and folded once
+into a DailyCube: per-category and per-signup-day revenue as prefix sums
+over days. Any date range / category / sort is then a few array lookups,
+independent of the number of sales, and finished snapshots are memoized in
+an LRU keyed by the filters. settings.marketplace_scale multiplies the mock
+marketplace (1 = the original 12-seller demo; 2000 = ~1.3M sales).
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
 import random
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from app.config import settings
 
 
 CATEGORIES = [
@@ -76,6 +90,23 @@ class CohortRow:
     retention_pct: float
 
 
+@dataclass(frozen=True)
+class EngineStats:
+    sales: int
+    listings: int
+    sellers: int
+    build_ms: float
+    compute_ms: float  # the aggregation that produced this snapshot; cached with it
+
+
+@dataclass(frozen=True)
+class ServeTiming:
+    """How this request got its snapshot; never cached."""
+
+    served_ms: float
+    cache_hit: bool
+
+
 @dataclass(frozen=True)
 class AnalyticsSnapshot:
     overview: OverviewMetrics
@@ -83,9 +114,125 @@ class AnalyticsSnapshot:
     categories: List[CategoryPerformance]
     cohorts: List[CohortRow]
     available_categories: List[str]
+    engine: Optional[EngineStats] = None
+
+
+class MarketplaceColumns:
+    """Sellers, listings and sales as parallel arrays.
+
+    Days are proleptic ordinals (date.toordinal()); listing and seller
+    references are 0-based row indexes. Only used to build a DailyCube.
+    """
+
+    def __init__(
+        self,
+        *,
+        seller_signup: np.ndarray,
+        listing_seller: np.ndarray,
+        listing_category: np.ndarray,
+        listing_price: np.ndarray,
+        listing_rating: np.ndarray,
+        sale_listing: np.ndarray,
+        sale_day: np.ndarray,
+        sale_amount: np.ndarray,
+    ) -> None:
+        self.seller_signup = seller_signup.astype(np.int64)
+        self.listing_seller = listing_seller.astype(np.int64)
+        self.listing_category = listing_category.astype(np.int64)
+        self.listing_price = listing_price.astype(np.float64)
+        self.listing_rating = listing_rating.astype(np.float64)
+        self.sale_listing = sale_listing.astype(np.int64)
+        self.sale_day = sale_day.astype(np.int64)
+        self.sale_amount = sale_amount.astype(np.float64)
+        self.sale_category = self.listing_category[self.sale_listing]
+
+    @classmethod
+    def from_rows(cls, sellers: List[Seller], listings: List[Listing], sales: List[Sale]) -> "MarketplaceColumns":
+        seller_index = {seller.id: i for i, seller in enumerate(sellers)}
+        listing_index = {listing.id: i for i, listing in enumerate(listings)}
+        category_code = {name: i for i, name in enumerate(CATEGORIES)}
+        return cls(
+            seller_signup=np.array([s.signup_date.toordinal() for s in sellers]),
+            listing_seller=np.array([seller_index[l.seller_id] for l in listings]),
+            listing_category=np.array([category_code[l.category] for l in listings]),
+            listing_price=np.array([l.price for l in listings]),
+            listing_rating=np.array([l.rating for l in listings]),
+            sale_listing=np.array([listing_index[s.listing_id] for s in sales], dtype=np.int64),
+            sale_day=np.array([s.timestamp.toordinal() for s in sales], dtype=np.int64),
+            sale_amount=np.array([s.amount for s in sales]),
+        )
+
+
+class DailyCube:
+    """Pre-aggregated (category x day) sales, built once per dataset.
+
+    Revenue is stored as prefix sums along the day axis, so the revenue of
+    any date range is two lookups per category and a snapshot never touches
+    individual sales:
+
+      revenue[c, i]                 revenue of category c on days before first_day + i
+      signup_revenue[g, c, i]       the same, for sellers who signed up on signup_days[g]
+
+    Sellers that signed up on the same day are interchangeable for the
+    month-1/month-2 cohort split, so cohorts aggregate per signup day
+    rather than per seller (a handful of groups at any scale).
+    """
 
+    def __init__(self, data: MarketplaceColumns) -> None:
+        n_categories = len(CATEGORIES)
+        self.sales = int(data.sale_day.size)
+        self.listings = int(data.listing_category.size)
+        self.sellers = int(data.seller_signup.size)
 
-_DATA_CACHE: Dict[str, List] = {}
+        self.first_day = int(data.sale_day.min()) if self.sales else date.today().toordinal()
+        n_days = (int(data.sale_day.max()) - self.first_day + 1) if self.sales else 1
+        day = data.sale_day - self.first_day
+
+        daily = np.bincount(
+            data.sale_category * n_days + day,
+            weights=data.sale_amount,
+            minlength=n_categories * n_days,
+        ).reshape(n_categories, n_days)
+        self.revenue = _prefix(daily)
+
+        self.signup_days, seller_group = np.unique(data.seller_signup, return_inverse=True)
+        n_groups = self.signup_days.size
+        group = seller_group[data.listing_seller[data.sale_listing]]
+        signup_daily = np.bincount(
+            (group * n_categories + data.sale_category) * n_days + day,
+            weights=data.sale_amount,
+            minlength=n_groups * n_categories * n_days,
+        ).reshape(n_groups, n_categories, n_days)
+        self.signup_revenue = _prefix(signup_daily)
+
+        # Cohorts are signup months, oldest first; each signup day maps to one.
+        months = [(d.year, d.month) for d in map(date.fromordinal, self.signup_days.tolist())]
+        self.cohort_months = sorted(set(months))
+        month_code = {month: code for code, month in enumerate(self.cohort_months)}
+        self.signup_cohort = np.array([month_code[month] for month in months], dtype=np.int64)
+
+        self.listing_count = np.bincount(data.listing_category, minlength=n_categories)
+        self.price_sum = np.bincount(data.listing_category, weights=data.listing_price, minlength=n_categories)
+        self.rating_sum = np.bincount(data.listing_category, weights=data.listing_rating, minlength=n_categories)
+        self.build_ms = 0.0
+
+    def index(self, day) -> np.ndarray:
+        """Prefix-sum column for `day` (an ordinal or array of ordinals), clamped."""
+        return np.clip(np.asarray(day) - self.first_day, 0, self.revenue.shape[-1] - 1)
+
+
+def _prefix(daily: np.ndarray) -> np.ndarray:
+    zeros = np.zeros(daily.shape[:-1] + (1,))
+    return np.concatenate([zeros, np.cumsum(daily, axis=-1)], axis=-1)
+
+
+_DATA_CACHE: Dict[Tuple[int, date], DailyCube] = {}
+_DATA_LOCK = threading.Lock()
+
+# Snapshots by (scale, day, date_range, category, sort_by, sort_dir). The
+# dashboard, its HTMX partial and /export all ask for the same filters.
+SNAPSHOT_CACHE_SIZE = 256
+_SNAPSHOT_CACHE: "OrderedDict[tuple, AnalyticsSnapshot]" = OrderedDict()
 
 
 def get_snapshot(
@@ -94,61 +241,119 @@ def get_snapshot(
     category: Optional[str],
     sort_by: str,
     sort_dir: str,
+    scale: Optional[int] = None,
+) -> AnalyticsSnapshot:
+    return get_snapshot_timed(
+        date_range_days=date_range_days, category=category, sort_by=sort_by, sort_dir=sort_dir, scale=scale
+    )[0]
+
+
+def get_snapshot_timed(
+    *,
+    date_range_days: int,
+    category: Optional[str],
+    sort_by: str,
+    sort_dir: str,
+    scale: Optional[int] = None,
+) -> Tuple[AnalyticsSnapshot, ServeTiming]:
+    """get_snapshot() plus this request's own timing and whether it was a cache hit."""
+    started = time.perf_counter()
+    scale = max(int(scale or settings.marketplace_scale), 1)
+    key = (scale, date.today(), date_range_days, category, sort_by, sort_dir)
+    with _DATA_LOCK:
+        snapshot = _SNAPSHOT_CACHE.get(key)
+        if snapshot is not None:
+            _SNAPSHOT_CACHE.move_to_end(key)
+            return snapshot, ServeTiming((time.perf_counter() - started) * 1000, cache_hit=True)
+
+    snapshot = _compute_snapshot(
+        _load_cube(scale, key[1]),
+        date_range_days=date_range_days,
+        category=category,
+        sort_by=sort_by,
+        sort_dir=sort_dir,
+    )
+    with _DATA_LOCK:
+        _SNAPSHOT_CACHE[key] = snapshot
+        while len(_SNAPSHOT_CACHE) > SNAPSHOT_CACHE_SIZE:
+            _SNAPSHOT_CACHE.popitem(last=False)
+    return snapshot, ServeTiming((time.perf_counter() - started) * 1000, cache_hit=False)
+
+
+def _compute_snapshot(
+    cube: DailyCube,
+    *,
+    date_range_days: int,
+    category: Optional[str],
+    sort_by: str,
+    sort_dir: str,
 ) -> AnalyticsSnapshot:
-    sellers, listings, sales = _load_mock_data()
-    filtered_listings = _filter_listings(listings, category)
-    listing_ids = {listing.id for listing in filtered_listings}
+    started = time.perf_counter()
+
+    categories_selected = _selected_categories(category)
     start_date, end_date = _resolve_range(date_range_days)
+    start, end = start_date.toordinal(), end_date.toordinal() + 1  # [start, end)
 
-    filtered_sales = [
-        sale
-        for sale in sales
-        if sale.listing_id in listing_ids
-        and start_date <= sale.timestamp <= end_date
-    ]
+    revenue = _range_revenue(cube, start, end)
+    previous_revenue = _range_revenue(cube, start - date_range_days, start)
 
     overview = _build_overview(
-        sales=filtered_sales,
-        listings=filtered_listings,
-        date_range_days=date_range_days,
-        start_date=start_date,
-        end_date=end_date,
-        all_sales=sales,
-        category_listing_ids=listing_ids,
+        cube,
+        categories_selected,
+        total_revenue=float(revenue[categories_selected].sum()),
+        previous_revenue=float(previous_revenue[categories_selected].sum()),
     )
-    trends = _build_trends(filtered_sales, end_date=end_date)
+    trends = _build_trends(cube, categories_selected, start=start, end=end, end_date=end_date)
     categories = _build_category_table(
-        listings=filtered_listings,
-        sales=filtered_sales,
+        cube,
+        categories_selected,
+        revenue,
         sort_by=sort_by,
         sort_dir=sort_dir,
     )
-    cohorts = _build_cohorts(
-        sellers=sellers,
-        listings=filtered_listings,
-        sales=filtered_sales,
-    )
+    cohorts = _build_cohorts(cube, categories_selected, start=start, end=end)
 
-    available_categories = sorted({listing.category for listing in listings})
+    available_categories = sorted(CATEGORIES[code] for code in np.flatnonzero(cube.listing_count).tolist())
     return AnalyticsSnapshot(
         overview=overview,
         trends=trends,
         categories=categories,
         cohorts=cohorts,
         available_categories=available_categories,
+        engine=EngineStats(
+            sales=cube.sales,
+            listings=cube.listings,
+            sellers=cube.sellers,
+            build_ms=cube.build_ms,
+            compute_ms=(time.perf_counter() - started) * 1000,
+        ),
     )
 
 
-def _load_mock_data() -> Tuple[List[Seller], List[Listing], List[Sale]]:
-    if _DATA_CACHE:
-        return (
-            _DATA_CACHE["sellers"],
-            _DATA_CACHE["listings"],
-            _DATA_CACHE["sales"],
-        )
-
+def _load_cube(scale: int, today: date) -> DailyCube:
+    key = (scale, today)
+    cube = _DATA_CACHE.get(key)
+    if cube is not None:
+        return cube
+    with _DATA_LOCK:
+        cube = _DATA_CACHE.get(key)
+        if cube is None:
+            started = time.perf_counter()
+            if scale == 1:
+                data = MarketplaceColumns.from_rows(*_load_mock_data(today))
+            else:
+                data = _synthetic_columns(scale, today)
+            cube = DailyCube(data)
+            cube.build_ms = (time.perf_counter() - started) * 1000
+            # One dataset at a time; the previous day's data and snapshots are stale.
+            _DATA_CACHE.clear()
+            _SNAPSHOT_CACHE.clear()
+            _DATA_CACHE[key] = cube
+    return cube
+
+
+def _load_mock_data(today: date) -> Tuple[List[Seller], List[Listing], List[Sale]]:
     rng = random.Random(42)
-    today = date.today()
 
     sellers: List[Seller] = []
     listings: List[Listing] = []
@@ -199,16 +404,44 @@ def _load_mock_data() -> Tuple[List[Seller], List[Listing], List[Sale]]:
                 sale_id += 1
             listing_id += 1
 
-    _DATA_CACHE["sellers"] = sellers
-    _DATA_CACHE["listings"] = listings
-    _DATA_CACHE["sales"] = sales
     return sellers, listings, sales
 
 
-def _filter_listings(listings: Iterable[Listing], category: Optional[str]) -> List[Listing]:
+def _synthetic_columns(scale: int, today: date) -> MarketplaceColumns:
+    """The same distributions as _load_mock_data, drawn vectorised for
+    12 * scale sellers (roughly 650 * scale sales). Deterministic per scale."""
+    rng = np.random.default_rng(42 + scale)
+    seller_ids = np.arange(1, 12 * scale + 1)
+    seller_signup = today.toordinal() - 30 * (seller_ids % 8 + 1)
+
+    listing_seller = np.repeat(np.arange(seller_ids.size), rng.integers(3, 7, seller_ids.size))
+    listing_count = listing_seller.size
+    listing_price = np.round(rng.uniform(15, 250, listing_count), 2)
+
+    sale_listing = np.repeat(np.arange(listing_count), rng.integers(8, 17, listing_count))
+    sale_count = sale_listing.size
+    return MarketplaceColumns(
+        seller_signup=seller_signup,
+        listing_seller=listing_seller,
+        listing_category=rng.integers(0, len(CATEGORIES), listing_count),
+        listing_price=listing_price,
+        listing_rating=np.round(rng.uniform(3.4, 4.9, listing_count), 2),
+        sale_listing=sale_listing,
+        sale_day=today.toordinal() - rng.integers(0, 321, sale_count),
+        sale_amount=np.round(listing_price[sale_listing] * rng.uniform(0.8, 1.4, sale_count), 2),
+    )
+
+
+def _selected_categories(category: Optional[str]) -> np.ndarray:
+    """Category codes to aggregate; an unknown category matches nothing."""
     if not category or category.lower() == "all":
-        return list(listings)
-    return [listing for listing in listings if listing.category == category]
+        return np.arange(len(CATEGORIES))
+    return np.array([CATEGORIES.index(category)] if category in CATEGORIES else [], dtype=np.int64)
+
+
+def _range_revenue(cube: DailyCube, start: int, end: int) -> np.ndarray:
+    """Revenue per category for days in [start, end)."""
+    return cube.revenue[:, cube.index(end)] - cube.revenue[:, cube.index(start)]
 
 
 def _resolve_range(date_range_days: int) -> tuple[date, date]:
@@ -218,33 +451,16 @@ def _resolve_range(date_range_days: int) -> tuple[date, date]:
 
 
 def _build_overview(
+    cube: DailyCube,
+    categories: np.ndarray,
     *,
-    sales: list[Sale],
-    listings: list[Listing],
-    date_range_days: int,
-    start_date: date,
-    end_date: date,
-    all_sales: list[Sale],
-    category_listing_ids: set[int],
+    total_revenue: float,
+    previous_revenue: float,
 ) -> OverviewMetrics:
-    total_revenue = sum(sale.amount for sale in sales)
-    active_listings = len(listings)
-    avg_rating = (
-        sum(listing.rating for listing in listings) / active_listings
-        if active_listings
-        else 0.0
-    )
+    active_listings = int(cube.listing_count[categories].sum())
+    avg_rating = float(cube.rating_sum[categories].sum()) / active_listings if active_listings else 0.0
     satisfaction = int(round(avg_rating * 20))
 
-    previous_start = start_date - timedelta(days=date_range_days)
-    previous_end = start_date
-    previous_sales = [
-        sale
-        for sale in all_sales
-        if sale.listing_id in category_listing_ids
-        and previous_start <= sale.timestamp < previous_end
-    ]
-    previous_revenue = sum(sale.amount for sale in previous_sales)
     delta_pct = None
     if previous_revenue > 0:
         delta_pct = ((total_revenue - previous_revenue) / previous_revenue) * 100
@@ -258,50 +474,41 @@ def _build_overview(
     )
 
 
-def _build_trends(sales: list[Sale], *, end_date: date) -> list[TrendPoint]:
-    buckets = [0.0 for _ in range(12)]
-    for sale in sales:
-        days_diff = (end_date - sale.timestamp).days
-        if 0 <= days_diff < 84:
-            bucket_index = 11 - (days_diff // 7)
-            buckets[bucket_index] += sale.amount
+def _build_trends(cube: DailyCube, categories: np.ndarray, *, start: int, end: int, end_date: date) -> list[TrendPoint]:
+    # Twelve weeks ending today (bucket 11 is the last 7 days), counting only
+    # days inside the selected range [start, end).
+    boundaries = np.clip(end_date.toordinal() + 1 - 7 * np.arange(12, -1, -1), start, end)
+    prefix = cube.revenue[categories][:, cube.index(boundaries)].sum(axis=0)
+    buckets = np.diff(prefix)
 
     trend_points: list[TrendPoint] = []
     for index in range(12):
         week_start = end_date - timedelta(days=(11 - index) * 7 + 6)
         label = week_start.strftime("%b %d")
-        trend_points.append(TrendPoint(label=label, revenue=round(buckets[index], 2)))
+        trend_points.append(TrendPoint(label=label, revenue=round(float(buckets[index]), 2)))
     return trend_points
 
 
 def _build_category_table(
+    cube: DailyCube,
+    categories: np.ndarray,
+    revenue: np.ndarray,
     *,
-    listings: list[Listing],
-    sales: list[Sale],
     sort_by: str,
     sort_dir: str,
 ) -> list[CategoryPerformance]:
-    category_map: dict[str, list[Listing]] = {}
-    for listing in listings:
-        category_map.setdefault(listing.category, []).append(listing)
-
-    sales_by_listing: dict[int, float] = {}
-    for sale in sales:
-        sales_by_listing[sale.listing_id] = sales_by_listing.get(sale.listing_id, 0.0) + sale.amount
-
     rows: list[CategoryPerformance] = []
-    for category, items in category_map.items():
-        listing_count = len(items)
-        revenue = sum(sales_by_listing.get(item.id, 0.0) for item in items)
-        avg_price = sum(item.price for item in items) / listing_count if listing_count else 0.0
-        avg_rating = sum(item.rating for item in items) / listing_count if listing_count else 0.0
+    for code in categories.tolist():
+        count = int(cube.listing_count[code])
+        if not count:
+            continue
         rows.append(
             CategoryPerformance(
-                category=category,
-                listings=listing_count,
-                revenue=revenue,
-                avg_price=avg_price,
-                avg_rating=avg_rating,
+                category=CATEGORIES[code],
+                listings=count,
+                revenue=float(revenue[code]),
+                avg_price=float(cube.price_sum[code] / count),
+                avg_rating=float(cube.rating_sum[code] / count),
             )
         )
 
@@ -318,43 +525,33 @@ def _build_category_table(
     return rows
 
 
-def _build_cohorts(
-    *,
-    sellers: list[Seller],
-    listings: list[Listing],
-    sales: list[Sale],
-) -> list[CohortRow]:
-    listing_to_seller = {listing.id: listing.seller_id for listing in listings}
-    seller_map = {seller.id: seller for seller in sellers}
-    cohorts: dict[str, list[int]] = {}
-    for seller in sellers:
-        cohort_key = seller.signup_date.strftime("%b %Y")
-        cohorts.setdefault(cohort_key, []).append(seller.id)
+def _build_cohorts(cube: DailyCube, categories: np.ndarray, *, start: int, end: int) -> list[CohortRow]:
+    """Month 1 = days [signup, signup + 30), month 2 = [signup + 30, signup + 60),
+    each intersected with the selected range [start, end)."""
+    n = len(cube.cohort_months)
+    groups = np.arange(cube.signup_days.size)
+    prefix = cube.signup_revenue[:, categories, :].sum(axis=1)  # (signup groups, days + 1)
 
-    rows: list[CohortRow] = []
-    for cohort_key, seller_ids in cohorts.items():
-        month1_total = 0.0
-        month2_total = 0.0
-        for sale in sales:
-            seller_id = listing_to_seller.get(sale.listing_id)
-            if seller_id not in seller_ids:
-                continue
-            signup = seller_map[seller_id].signup_date
-            day_delta = (sale.timestamp - signup).days
-            if 0 <= day_delta < 30:
-                month1_total += sale.amount
-            elif 30 <= day_delta < 60:
-                month2_total += sale.amount
+    def window(offset_from: int, offset_to: int) -> np.ndarray:
+        lo = cube.index(np.clip(cube.signup_days + offset_from, start, end))
+        hi = cube.index(np.clip(cube.signup_days + offset_to, start, end))
+        return prefix[groups, hi] - prefix[groups, lo]
+
+    month1_revenue = np.bincount(cube.signup_cohort, weights=window(0, 30), minlength=n)
+    month2_revenue = np.bincount(cube.signup_cohort, weights=window(30, 60), minlength=n)
 
+    rows: list[CohortRow] = []
+    for code in reversed(range(n)):  # newest cohort first
+        year, month = cube.cohort_months[code]
+        month1_total = float(month1_revenue[code])
+        month2_total = float(month2_revenue[code])
         retention = (month2_total / month1_total * 100) if month1_total else 0.0
         rows.append(
             CohortRow(
-                cohort=cohort_key,
+                cohort=date(year, month, 1).strftime("%b %Y"),
                 month1_revenue=month1_total,
                 month2_revenue=month2_total,
                 retention_pct=retention,
             )
         )
-
-    rows.sort(key=lambda row: datetime.strptime(row.cohort, "%b %Y"), reverse=True)
     return rows
@@ -0,0 +1,181 @@
+# app/services/artifact_cache.py
+"""Cache for generated XML artifacts (RSS feeds, sitemap).
+
+Crawlers and podcast aggregators poll these URLs constantly, but the output
+only changes when content or an episode manifest changes. Each artifact is
+built once per source version, stored with a pre-gzipped body, and served
+conditionally:
+
+    artifact = artifact_cache.get_or_build("sitemap", version, build_fn, last_modified=mtime)
+    return artifact_cache.respond(request, artifact)
+
+`version` is any hashable describing the inputs — a content version number,
+source file stamps from file_stamp(), today's date, etc. `last_modified` is
+the newest source mtime (stamp_time() turns file stamps into one).
+
+The identity and gzip bodies are different representations, so each has its
+own strong ETag (the gzip one ends in "-gz"), and responses carry
+Vary: Accept-Encoding.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+@dataclass(frozen=True)
+class GeneratedArtifact:
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    gzip_etag: str
+    last_modified: datetime
+    media_type: str
+
+
+def file_stamp(*paths: Path) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(mtime_ns, size) per path, None for missing files. Cheap enough to call per request."""
+    stamps = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def stamp_time(stamp: Tuple[Optional[Tuple[int, int]], ...]) -> Optional[datetime]:
+    """Newest mtime in a file_stamp() result, None if every file is missing."""
+    mtimes = [entry[0] for entry in stamp if entry is not None]
+    if not mtimes:
+        return None
+    return datetime.fromtimestamp(max(mtimes) / 1e9, tz=timezone.utc)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True if the Accept-Encoding header allows gzip (q > 0, directly or via *)."""
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("*", 0.0) > 0
+
+
+class ArtifactCache:
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[Hashable, GeneratedArtifact]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        name: str,
+        version: Hashable,
+        build: Callable[[], str],
+        media_type: str = "application/xml",
+        last_modified: Optional[datetime] = None,
+    ) -> GeneratedArtifact:
+        """Return the cached artifact for (name, version), building it on a miss.
+
+        last_modified is the newest source mtime; without one, build time is used.
+        """
+        cached = self._entries.get(name)
+        if cached and cached[0] == version:
+            return cached[1]
+        with self._lock:
+            cached = self._entries.get(name)
+            if cached and cached[0] == version:
+                return cached[1]
+            body = build().encode("utf-8")
+            digest = hashlib.sha256(body).hexdigest()[:32]
+            # Second precision: HTTP dates can't carry more, and If-Modified-Since compares exactly.
+            now = datetime.now(timezone.utc).replace(microsecond=0)
+            modified = last_modified.astimezone(timezone.utc).replace(microsecond=0) if last_modified else now
+            previous = self._entries.get(name)
+            if previous and previous[1].last_modified >= modified and previous[1].etag != f'"{digest}"':
+                # Output changed without a newer source file (e.g. a scheduled
+                # post went live): Last-Modified must still move forward.
+                modified = now
+            artifact = GeneratedArtifact(
+                body=body,
+                gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+                etag=f'"{digest}"',
+                gzip_etag=f'"{digest}-gz"',
+                last_modified=modified,
+                media_type=media_type,
+            )
+            if previous and previous[1].etag == artifact.etag:
+                # Inputs changed but output didn't: keep the old Last-Modified.
+                artifact = previous[1]
+            self._entries[name] = (version, artifact)
+            return artifact
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def respond(
+        self,
+        request: Request,
+        artifact: GeneratedArtifact,
+        cache_control: str = "no-cache",
+    ) -> Response:
+        """Serve the artifact, honoring If-None-Match / If-Modified-Since and gzip."""
+        use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+        etag = artifact.gzip_etag if use_gzip else artifact.etag
+        headers = {
+            "ETag": etag,
+            "Last-Modified": format_datetime(artifact.last_modified, usegmt=True),
+            "Cache-Control": cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if self._not_modified(request, artifact, etag):
+            return Response(status_code=304, headers=headers)
+
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=artifact.gzip_body, media_type=artifact.media_type, headers=headers)
+        return Response(content=artifact.body, media_type=artifact.media_type, headers=headers)
+
+    def _not_modified(self, request: Request, artifact: GeneratedArtifact, etag: str) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence; weak comparison per RFC 9110 §13.1.2,
+            # against the ETag of the representation being served.
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or etag in tags
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return artifact.last_modified <= since
+        return False
+
+
+artifact_cache = ArtifactCache()
@@ -0,0 +1,241 @@
+# app/services/audio_assembly.py
+"""Assemble per-turn audio segments into one chaptered episode with ffmpeg.
+
+assemble() probes every segment with ffprobe and picks the cheapest path:
+
+  copy      — all segments are MP3 with the same sample rate, channel count
+              and bitrate (the normal case: every Edge TTS voice emits the
+              same format). The concat demuxer stream-copies the frames;
+              inter-speaker gaps are a short silence clip encoded to match.
+              No decode, no encode.
+  reencode  — formats differ. One ffmpeg run with a single filter graph:
+              per-segment loudnorm (EBU R128, single pass), resample to a
+              common format, pad with the inter-speaker gap, concat, encode.
+
+Either way the output carries one ID3v2 CHAP chapter per segment, so
+players can skip between speakers. Scratch files (concat list, chapter
+metadata, silence clip) live in a private temp directory and the episode
+is written under a temp name and renamed, so concurrent runs never clobber
+each other or leave a half-written episode behind.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Target for the re-encode path.
+LOUDNESS_TARGET = "I=-16:TP=-1.5:LRA=11"
+OUTPUT_SAMPLE_RATE = 44100
+OUTPUT_BITRATE = "128k"
+DEFAULT_GAP_MS = 350
+
+Runner = Callable[..., subprocess.CompletedProcess]
+
+
+@dataclass(frozen=True)
+class AudioInfo:
+    path: Path
+    codec: str
+    sample_rate: int
+    channels: int
+    bit_rate: int
+    duration_ms: int
+
+    @property
+    def stream_format(self) -> Tuple[str, int, int, int]:
+        return self.codec, self.sample_rate, self.channels, self.bit_rate
+
+
+@dataclass(frozen=True)
+class Chapter:
+    title: str
+    start_ms: int
+    end_ms: int
+
+
+@dataclass
+class AssemblyResult:
+    path: Path
+    mode: str
+    duration_ms: int
+    chapters: List[Chapter] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def _run(runner: Runner, cmd: List[str]) -> subprocess.CompletedProcess:
+    result = runner(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{cmd[0]} failed: {(result.stderr or '')[-500:]}")
+    return result
+
+
+def probe(path: Path, runner: Runner = subprocess.run) -> AudioInfo:
+    result = _run(runner, [
+        "ffprobe", "-v", "error", "-select_streams", "a:0",
+        "-show_entries", "stream=codec_name,sample_rate,channels,bit_rate:format=duration,bit_rate",
+        "-of", "json", str(path),
+    ])
+    data = json.loads(result.stdout or "{}")
+    stream = (data.get("streams") or [{}])[0]
+    fmt = data.get("format") or {}
+    return AudioInfo(
+        path=path,
+        codec=stream.get("codec_name", ""),
+        sample_rate=int(stream.get("sample_rate") or 0),
+        channels=int(stream.get("channels") or 0),
+        bit_rate=int(stream.get("bit_rate") or fmt.get("bit_rate") or 0),
+        duration_ms=int(round(float(fmt.get("duration") or 0) * 1000)),
+    )
+
+
+def stream_compatible(infos: Sequence[AudioInfo]) -> bool:
+    """True when the segments can be joined without re-encoding."""
+    return bool(infos) and infos[0].codec == "mp3" and len({i.stream_format for i in infos}) == 1
+
+
+def plan_chapters(durations_ms: Sequence[int], titles: Sequence[str], gap_ms: int) -> List[Chapter]:
+    """One chapter per segment; each gap belongs to the chapter before it."""
+    chapters = []
+    start = 0
+    for index, (duration, title) in enumerate(zip(durations_ms, titles)):
+        end = start + duration + (gap_ms if index < len(durations_ms) - 1 else 0)
+        chapters.append(Chapter(title=title, start_ms=start, end_ms=end))
+        start = end
+    return chapters
+
+
+def _escape(value: str) -> str:
+    for char in ("\\", "=", ";", "#", "\n"):
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+def ffmetadata(chapters: Sequence[Chapter], title: Optional[str] = None) -> str:
+    lines = [";FFMETADATA1"]
+    if title:
+        lines.append(f"title={_escape(title)}")
+    for chapter in chapters:
+        lines += [
+            "[CHAPTER]",
+            "TIMEBASE=1/1000",
+            f"START={chapter.start_ms}",
+            f"END={chapter.end_ms}",
+            f"title={_escape(chapter.title)}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _concat_line(path: Path) -> str:
+    return "file '" + str(path.resolve()).replace("'", "'\\''") + "'"
+
+
+def copy_commands(
+    infos: Sequence[AudioInfo], gap_ms: int, scratch: Path, meta_file: Path, out_path: Path
+) -> List[List[str]]:
+    """ffmpeg commands for the stream-copy path: an optional matching
+    silence clip, then a concat-demuxer copy with chapters."""
+    commands = []
+    first = infos[0]
+    entries = [info.path for info in infos]
+    if gap_ms > 0 and len(infos) > 1:
+        silence = scratch / "gap.mp3"
+        layout = "mono" if first.channels == 1 else "stereo"
+        commands.append([
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "lavfi", "-i", f"anullsrc=r={first.sample_rate}:cl={layout}",
+            "-t", f"{gap_ms / 1000:.3f}",
+            "-c:a", "libmp3lame", "-b:a", str(first.bit_rate),
+            str(silence),
+        ])
+        entries = [p for info in infos for p in (info.path, silence)][:-1]
+    list_file = scratch / "concat.txt"
+    list_file.write_text("\n".join(_concat_line(p) for p in entries) + "\n")
+    commands.append([
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "concat", "-safe", "0", "-i", str(list_file),
+        "-i", str(meta_file),
+        "-map", "0:a", "-map_metadata", "1", "-map_chapters", "1",
+        "-c", "copy", "-id3v2_version", "3",
+        "-f", "mp3", str(out_path),
+    ])
+    return commands
+
+
+def reencode_command(infos: Sequence[AudioInfo], gap_ms: int, meta_file: Path, out_path: Path) -> List[str]:
+    """One ffmpeg run: loudnorm + resample + gap padding per segment, concat, encode."""
+    layout = "stereo" if any(info.channels > 1 for info in infos) else "mono"
+    cmd = ["ffmpeg", "-y", "-v", "error"]
+    for info in infos:
+        cmd += ["-i", str(info.path)]
+    cmd += ["-i", str(meta_file)]
+
+    chains = []
+    for index in range(len(infos)):
+        pad = f",apad=pad_dur={gap_ms / 1000:.3f}" if gap_ms > 0 and index < len(infos) - 1 else ""
+        chains.append(
+            f"[{index}:a]loudnorm={LOUDNESS_TARGET},aresample={OUTPUT_SAMPLE_RATE},"
+            f"aformat=sample_fmts=fltp:channel_layouts={layout}{pad}[s{index}]"
+        )
+    inputs = "".join(f"[s{index}]" for index in range(len(infos)))
+    graph = ";".join(chains + [f"{inputs}concat=n={len(infos)}:v=0:a=1[out]"])
+
+    meta_index = len(infos)
+    cmd += [
+        "-filter_complex", graph,
+        "-map", "[out]", "-map_metadata", str(meta_index), "-map_chapters", str(meta_index),
+        "-c:a", "libmp3lame", "-b:a", OUTPUT_BITRATE, "-id3v2_version", "3",
+        "-f", "mp3", str(out_path),
+    ]
+    return cmd
+
+
+def assemble(
+    segments: Sequence[Tuple[Path, str]],
+    out_path: Path,
+    gap_ms: int = DEFAULT_GAP_MS,
+    title: Optional[str] = None,
+    runner: Runner = subprocess.run,
+) -> AssemblyResult:
+    """Join (path, chapter title) segments into out_path; see module docstring."""
+    if not segments:
+        raise ValueError("no segments to assemble")
+    started = time.perf_counter()
+    infos = [probe(path, runner) for path, _ in segments]
+    titles = [chapter_title for _, chapter_title in segments]
+    mode = "copy" if stream_compatible(infos) else "reencode"
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".assemble-", dir=out_path.parent) as tmp:
+        scratch = Path(tmp)
+        partial = scratch / out_path.name
+        meta_file = scratch / "chapters.ffmeta"
+        durations = [info.duration_ms for info in infos]
+
+        if mode == "copy":
+            commands = copy_commands(infos, gap_ms, scratch, meta_file, partial)
+            if len(commands) > 1:
+                _run(runner, commands[0])  # encode the gap clip, then measure it
+                gap_ms = probe(scratch / "gap.mp3", runner).duration_ms or gap_ms
+                commands = commands[1:]
+        else:
+            commands = [reencode_command(infos, gap_ms, meta_file, partial)]
+
+        chapters = plan_chapters(durations, titles, gap_ms if len(infos) > 1 else 0)
+        meta_file.write_text(ffmetadata(chapters, title))
+        for cmd in commands:
+            _run(runner, cmd)
+        os.replace(partial, out_path)
+
+    return AssemblyResult(
+        path=out_path,
+        mode=mode,
+        duration_ms=chapters[-1].end_ms,
+        chapters=chapters,
+        seconds=time.perf_counter() - started,
+    )
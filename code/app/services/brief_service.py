@@ -11,6 +11,8 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.feed_article import FeedArticle
+from app.services.llm_telemetry import telemetry
+from app.services.tts_pipeline import Segment, concat_mp3, prune_cache, split_script, synthesize
 
 logger = logging.getLogger(__name__)
 
@@ -163,12 +165,15 @@ class BriefService:
             from anthropic import Anthropic
 
             client = Anthropic(api_key=settings.anthropic_api_key)
-            response = client.messages.create(
-                model=settings.anthropic_model,
-                max_tokens=700,
-                system=_SCRIPT_SYSTEM,
-                messages=[{"role": "user", "content": _build_script_prompt(articles, brief_date)}],
-            )
+            with telemetry.track("daily_brief", "anthropic", settings.anthropic_model) as call:
+                response = client.messages.create(
+                    model=settings.anthropic_model,
+                    max_tokens=700,
+                    system=_SCRIPT_SYSTEM,
+                    messages=[{"role": "user", "content": _build_script_prompt(articles, brief_date)}],
+                )
+                call.input_tokens = response.usage.input_tokens
+                call.output_tokens = response.usage.output_tokens
             return response.content[0].text.strip()
         except Exception as exc:
             logger.error("Script generation failed: %s", exc)
@@ -190,15 +195,24 @@ class BriefService:
         return " ".join(lines)
 
     async def _generate_audio(self, script: str, output_path: Path) -> bool:
+        # Synthesize sentence groups concurrently instead of one long request;
+        # unchanged groups are reused from the segment cache on regeneration.
+        segments = [Segment(text, BRIEF_VOICE, f"brief-{i:02d}") for i, text in enumerate(split_script(script))]
+        if not segments:
+            logger.error("Brief script is empty; no audio generated")
+            return False
+        results = await synthesize(segments, settings.tts_cache_dir)
+        failed = [r for r in results if r.path is None]
+        if failed:
+            logger.error("Edge TTS audio generation failed for %d/%d segments: %s", len(failed), len(results), failed[0].error)
+            return False
         try:
-            import edge_tts
-
-            communicate = edge_tts.Communicate(script, BRIEF_VOICE)
-            await communicate.save(str(output_path))
-            return True
-        except Exception as exc:
-            logger.error("Edge TTS audio generation failed: %s", exc)
+            concat_mp3([r.path for r in results], output_path)
+            prune_cache(settings.tts_cache_dir)
+        except OSError as exc:
+            logger.error("Writing brief audio failed: %s", exc)
             return False
+        return True
 
     def _update_manifest(
         self,
@@ -230,6 +244,10 @@ class BriefService:
         episodes = manifest.get("episodes", [])
         return episodes[0] if episodes else None
 
+    def manifest_path(self) -> Path:
+        """Path of the episode manifest; its mtime versions the cached RSS feed."""
+        return _get_manifest_path()
+
     def get_all(self) -> list[dict]:
         """Return all episodes from the manifest."""
         return _load_manifest().get("episodes", [])
@@ -1,18 +1,46 @@
 # app/services/content.py
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import math
+import os
 import re
-from datetime import date, datetime
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import frontmatter
 import markdown
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
+logger = logging.getLogger(__name__)
 
-class BlogPost(BaseModel):
+BUNDLE_VERSION = 1
+BUNDLE_FILENAME = ".content_bundle.json"
+
+
+class _LazyHtml(BaseModel):
+    """Mixin: html_content is rendered from markdown on first access.
+
+    Entries restored from the content bundle arrive with HTML already set;
+    entries parsed from changed files only render when a page asks for them.
+    """
+    _markdown: Optional[str] = PrivateAttr(default=None)
+    _html: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def html_content(self) -> str:
+        if self._html is None:
+            self._html = ContentService.render_markdown(self._markdown or "")
+            self._markdown = None
+        return self._html
+
+
+class BlogPost(_LazyHtml):
     title: str
     slug: str
     date: datetime
@@ -20,10 +48,9 @@ class BlogPost(BaseModel):
     excerpt: str
     author: str
     reading_time: str
-    html_content: str
 
 
-class Project(BaseModel):
+class Project(_LazyHtml):
     title: str
     slug: str
     description: str
@@ -36,100 +63,268 @@ class Project(BaseModel):
     problem: Optional[str] = None
     approach: Optional[str] = None
     solution: Optional[str] = None
-    html_content: str
+
+
+@dataclass(frozen=True)
+class _ContentSnapshot:
+    """Immutable view of the published content plus its lookup indexes.
+
+    ContentService swaps in a new snapshot on reload; request handlers read
+    whichever snapshot is current, so they never see a half-built index.
+    """
+    posts: List[BlogPost] = field(default_factory=list)
+    projects: List[Project] = field(default_factory=list)
+    tags: frozenset = frozenset()
+    posts_by_slug: Dict[str, BlogPost] = field(default_factory=dict)
+    posts_by_tag: Dict[str, List[BlogPost]] = field(default_factory=dict)
+    posts_by_month: List[dict] = field(default_factory=list)
+    projects_by_slug: Dict[str, Project] = field(default_factory=dict)
+    next_publish_at: Optional[datetime] = None  # earliest scheduled (future-dated) post
+    version: int = 0                             # bumped on every swap; keys generated artifacts
+    last_modified: Optional[datetime] = None     # newest content file mtime (UTC)
 
 
 class ContentService:
-    def __init__(self, content_dir: Union[str, Path]) -> None:
+    def __init__(self, content_dir: Union[str, Path], bundle_path: Union[str, Path, None] = None) -> None:
         self.content_dir = Path(content_dir)
-        self._posts: List[BlogPost] = []
-        self._projects: List[Project] = []
-        self._tags: set = set()
+        self.bundle_path = Path(bundle_path) if bundle_path else self.content_dir / BUNDLE_FILENAME
+        self._bundle: dict = {}
+        # "blog/<file>.md" -> ((mtime_ns, size), parsed entry); includes scheduled posts
+        self._files: Dict[str, Tuple[Tuple[int, int], Union[BlogPost, Project]]] = {}
+        self._snapshot = _ContentSnapshot()
+        self._reload_lock = threading.Lock()
 
     def load(self) -> None:
-        self._posts = self._load_posts()
-        self._projects = self._load_projects()
-        self._tags = {tag for post in self._posts for tag in post.tags}
+        """Load posts and projects, reusing bundle entries whose file hash still matches.
+
+        Only files that are new or changed since the bundle was built go
+        through frontmatter parsing, and their markdown renders lazily.
+        """
+        self._bundle = self._read_bundle()
+        with self._reload_lock:
+            self._files = {}
+            self._scan()
+            self._snapshot = self._build_snapshot()
+
+    def refresh(self, rescan: bool = True) -> bool:
+        """Re-parse only changed markdown files and promote due scheduled posts.
+
+        With rescan=False the content directory is not polled; only
+        scheduled posts that are now due get published. Builds a fresh
+        snapshot and swaps it in atomically when anything changed. Returns
+        True if a new snapshot was published.
+        """
+        with self._reload_lock:
+            changed = self._scan() if rescan else False
+            due = self._snapshot.next_publish_at is not None and self._snapshot.next_publish_at <= datetime.now()
+            if not (changed or due):
+                return False
+            self._snapshot = self._build_snapshot()
+            logger.info("Content reloaded: %d posts, %d projects", len(self._snapshot.posts), len(self._snapshot.projects))
+            return True
+
+    @property
+    def version(self) -> int:
+        """Monotonic content version; changes whenever a new snapshot is swapped in."""
+        return self._snapshot.version
+
+    @property
+    def last_modified(self) -> Optional[datetime]:
+        """Newest mtime among the loaded content files, for Last-Modified headers."""
+        return self._snapshot.last_modified
+
+    def seconds_until_next_publish(self) -> Optional[float]:
+        """Seconds until the next scheduled post goes live, or None if none are scheduled."""
+        next_publish_at = self._snapshot.next_publish_at
+        if next_publish_at is None:
+            return None
+        return max(0.0, (next_publish_at - datetime.now()).total_seconds())
+
+    def build_bundle(self) -> int:
+        """Parse and render every post and project, then write the bundle atomically.
+
+        Returns the number of entries written. Run at build/deploy time:
+        python -m app.services.content
+        """
+        self._bundle = {}
+        entries: dict = {}
+        for kind in ("blog", "projects"):
+            for path in sorted((self.content_dir / kind).glob("*.md")):
+                raw = path.read_bytes()
+                item = self._parse_file(kind, path, raw)
+                entries[f"{kind}/{path.name}"] = {
+                    "hash": hashlib.sha256(raw).hexdigest(),
+                    "data": item.model_dump(mode="json"),
+                    "html": item.html_content,
+                }
+        payload = {"version": BUNDLE_VERSION, "entries": entries}
+        tmp = self.bundle_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(tmp, self.bundle_path)
+        return len(entries)
 
     def get_posts(self, page: int = 1, per_page: int = 10) -> Tuple[List[BlogPost], int]:
-        return self._paginate(self._posts, page, per_page)
+        return self._paginate(self._snapshot.posts, page, per_page)
 
     def get_post_by_slug(self, slug: str) -> Optional[BlogPost]:
-        return next((post for post in self._posts if post.slug == slug), None)
+        return self._snapshot.posts_by_slug.get(slug)
 
     def get_posts_by_tag(self, tag: str, page: int = 1, per_page: int = 10) -> Tuple[List[BlogPost], int]:
-        normalized_tag = tag.lower()
-        filtered = [post for post in self._posts if normalized_tag in {t.lower() for t in post.tags}]
-        return self._paginate(filtered, page, per_page)
+        return self._paginate(self._snapshot.posts_by_tag.get(tag.lower(), []), page, per_page)
+
+    def get_posts_by_month(self) -> List[dict]:
+        """Posts grouped as [{month: 'March 2026', posts: [...]}], newest first."""
+        return self._snapshot.posts_by_month
 
     def get_all_tags(self) -> List[str]:
-        return sorted(self._tags, key=str.lower)
+        return sorted(self._snapshot.tags, key=str.lower)
 
     def get_projects(self) -> List[Project]:
-        return list(self._projects)
+        return list(self._snapshot.projects)
 
     def get_project_by_slug(self, slug: str) -> Optional[Project]:
-        return next((project for project in self._projects if project.slug == slug), None)
+        return self._snapshot.projects_by_slug.get(slug)
 
     def get_featured_projects(self, limit: int = 3) -> List[Project]:
-        return [project for project in self._projects if project.featured][:limit]
-
-    def _load_posts(self) -> List[BlogPost]:
-        blog_dir = self.content_dir / "blog"
-        posts: List[BlogPost] = []
-        for path in sorted(blog_dir.glob("*.md")):
-            post = frontmatter.load(path)
-            metadata = post.metadata
-            content_html = self._render_markdown(post.content)
-            slug = self._slug_from_filename(path.name)
-            tags = self._normalize_list(metadata.get("tags", []))
-
-            posts.append(
-                BlogPost(
-                    title=str(metadata.get("title", "")),
-                    slug=slug,
-                    date=self._parse_date(metadata.get("date")),
-                    tags=tags,
-                    excerpt=str(metadata.get("excerpt", "")),
-                    author=str(metadata.get("author", "")),
-                    reading_time=self._calculate_reading_time(post.content),
-                    html_content=content_html,
-                )
-            )
-        # Filter out future-dated posts (enables scheduling)
+        return [project for project in self._snapshot.projects if project.featured][:limit]
+
+    def _scan(self) -> bool:
+        """Sync self._files with the content directory by (mtime, size).
+
+        Unchanged files keep their parsed entry; changed or new files go
+        through _load_entry; deleted files are dropped. Returns True if
+        anything changed. Caller holds _reload_lock.
+        """
+        seen = set()
+        changed = False
+        for kind in ("blog", "projects"):
+            for path in sorted((self.content_dir / kind).glob("*.md")):
+                key = f"{kind}/{path.name}"
+                seen.add(key)
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                current = self._files.get(key)
+                if current and current[0] == stamp:
+                    continue
+                try:
+                    self._files[key] = (stamp, self._load_entry(kind, path))
+                except Exception as exc:
+                    # A half-written file mid-save: keep serving the old entry.
+                    logger.warning("Skipping unparseable content file %s: %s", path, exc)
+                    continue
+                changed = True
+        for key in set(self._files) - seen:
+            del self._files[key]
+            changed = True
+        return changed
+
+    def _build_snapshot(self) -> _ContentSnapshot:
+        """Precompute slug, tag and month lookups so request paths are O(1).
+
+        Future-dated posts stay out of the snapshot (enables scheduling);
+        the earliest one sets next_publish_at so refresh() can promote it.
+        """
         now = datetime.now()
-        published = [p for p in posts if p.date <= now]
-        return sorted(published, key=lambda item: item.date, reverse=True)
-
-    def _load_projects(self) -> List[Project]:
-        projects_dir = self.content_dir / "projects"
-        projects: List[Project] = []
-        for path in sorted(projects_dir.glob("*.md")):
-            project = frontmatter.load(path)
-            metadata = project.metadata
-            content_html = self._render_markdown(project.content)
-            slug = self._slug_from_filename(path.name)
-
-            projects.append(
-                Project(
-                    title=str(metadata.get("title", "")),
-                    slug=slug,
-                    description=str(metadata.get("description", "")),
-                    tech_stack=self._normalize_list(metadata.get("tech_stack", [])),
-                    status=str(metadata.get("status", "planned")),
-                    featured=bool(metadata.get("featured", False)),
-                    display_order=int(metadata.get("display_order", 9999)),
-                    github_url=str(metadata.get("github_url", "")),
-                    live_url=str(metadata.get("live_url", "")),
-                    problem=str(metadata.get("problem", "")) or None,
-                    approach=str(metadata.get("approach", "")) or None,
-                    solution=str(metadata.get("solution", "")) or None,
-                    html_content=content_html,
-                )
+        all_posts = [item for key, (_, item) in self._files.items() if key.startswith("blog/")]
+        posts = sorted((p for p in all_posts if p.date <= now), key=lambda item: item.date, reverse=True)
+        scheduled = [p.date for p in all_posts if p.date > now]
+        projects = sorted(
+            (item for key, (_, item) in self._files.items() if key.startswith("projects/")),
+            key=lambda item: (item.display_order, item.title.lower()),
+        )
+
+        by_tag: Dict[str, List[BlogPost]] = {}
+        for post in posts:
+            for tag in {t.lower() for t in post.tags}:
+                by_tag.setdefault(tag, []).append(post)
+
+        grouped: List[dict] = []
+        current_month = ""
+        for post in posts:
+            month = post.date.strftime("%B %Y")
+            if month != current_month:
+                current_month = month
+                grouped.append({"month": month, "posts": []})
+            grouped[-1]["posts"].append(post)
+
+        return _ContentSnapshot(
+            posts=posts,
+            projects=projects,
+            tags=frozenset(tag for post in posts for tag in post.tags),
+            # Reversed so the first match wins on duplicate slugs, as a linear scan would.
+            posts_by_slug={post.slug: post for post in reversed(posts)},
+            posts_by_tag=by_tag,
+            posts_by_month=grouped,
+            projects_by_slug={project.slug: project for project in reversed(projects)},
+            next_publish_at=min(scheduled) if scheduled else None,
+            version=self._snapshot.version + 1,
+            last_modified=max(
+                (datetime.fromtimestamp(stamp[0] / 1e9, tz=timezone.utc) for stamp, _ in self._files.values()),
+                default=None,
+            ),
+        )
+
+    def _read_bundle(self) -> dict:
+        if not self.bundle_path.exists():
+            return {}
+        try:
+            payload = json.loads(self.bundle_path.read_text())
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable content bundle %s: %s", self.bundle_path, exc)
+            return {}
+        if payload.get("version") != BUNDLE_VERSION:
+            return {}
+        return payload.get("entries", {})
+
+    def _load_entry(self, kind: str, path: Path) -> Union[BlogPost, Project]:
+        """Return the bundled entry if the file is unchanged, else parse it."""
+        model = BlogPost if kind == "blog" else Project
+        raw = path.read_bytes()
+        cached = self._bundle.get(f"{kind}/{path.name}")
+        if cached and cached.get("hash") == hashlib.sha256(raw).hexdigest():
+            item = model.model_validate(cached["data"])
+            item._html = cached["html"]
+            return item
+        return self._parse_file(kind, path, raw)
+
+    def _parse_file(self, kind: str, path: Path, raw: bytes) -> Union[BlogPost, Project]:
+        parsed = frontmatter.loads(raw.decode("utf-8"))
+        metadata = parsed.metadata
+        slug = self._slug_from_filename(path.name)
+
+        if kind == "blog":
+            item = BlogPost(
+                title=str(metadata.get("title", "")),
+                slug=slug,
+                date=self._parse_date(metadata.get("date")),
+                tags=self._normalize_list(metadata.get("tags", [])),
+                excerpt=str(metadata.get("excerpt", "")),
+                author=str(metadata.get("author", "")),
+                reading_time=self._calculate_reading_time(parsed.content),
             )
-        return sorted(projects, key=lambda item: (item.display_order, item.title.lower()))
+        else:
+            item = Project(
+                title=str(metadata.get("title", "")),
+                slug=slug,
+                description=str(metadata.get("description", "")),
+                tech_stack=self._normalize_list(metadata.get("tech_stack", [])),
+                status=str(metadata.get("status", "planned")),
+                featured=bool(metadata.get("featured", False)),
+                display_order=int(metadata.get("display_order", 9999)),
+                github_url=str(metadata.get("github_url", "")),
+                live_url=str(metadata.get("live_url", "")),
+                problem=str(metadata.get("problem", "")) or None,
+                approach=str(metadata.get("approach", "")) or None,
+                solution=str(metadata.get("solution", "")) or None,
+            )
+        item._markdown = parsed.content
+        return item
 
-    def _render_markdown(self, content: str) -> str:
+    @staticmethod
+    def render_markdown(content: str) -> str:
         """Render markdown to HTML with extended formatting support."""
         return markdown.markdown(
             content,
@@ -178,3 +373,11 @@ class ContentService:
         start = page_index * per_page
         end = start + per_page
         return items[start:end], total
+
+
+if __name__ == "__main__":
+    from app.config import settings
+
+    service = ContentService(settings.content_dir)
+    count = service.build_bundle()
+    print(f"Wrote {count} entries to {service.bundle_path}")
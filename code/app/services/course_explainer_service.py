@@ -2732,6 +2732,9 @@ TOP_12_COURSES: list[CourseExplainer] = [
 ]
 
 
+_COURSES_BY_SLUG: dict[str, CourseExplainer] = {course.slug: course for course in TOP_12_COURSES}
+
+
 class CourseExplainerService:
     def all_courses(self) -> list[CourseExplainer]:
         return list(TOP_12_COURSES)
@@ -2740,4 +2743,4 @@ class CourseExplainerService:
         return self.all_courses()[:limit]
 
     def get_by_slug(self, slug: str) -> CourseExplainer | None:
-        return next((course for course in TOP_12_COURSES if course.slug == slug), None)
+        return _COURSES_BY_SLUG.get(slug)
@@ -0,0 +1,277 @@
+# app/services/engagement.py
+"""Blog like/comment counters with a write-behind buffer for like toggles.
+
+Counts come from the denormalized post_stats table (a primary-key lookup)
+rather than COUNT(*) over likes. Like toggles are not written immediately:
+LikeBuffer records the visitor's desired state in memory, coalesces repeat
+toggles (like -> unlike -> like is one write, or none), and flushes the whole
+batch in a single transaction — every few seconds from the app lifespan, or
+sooner once max_pending toggles are waiting. A viral post's like burst
+becomes one SQLite write instead of hundreds serialized on the write lock.
+
+Reads merge pending toggles over committed state, so a visitor always sees
+their own like immediately. The trade-off is that a crash loses at most one
+flush interval of likes.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.like import Like
+from app.models.post_stats import PostStats
+
+logger = logging.getLogger(__name__)
+
+_Key = Tuple[str, str]           # (slug, visitor_id)
+_Pending = Tuple[bool, bool]     # (desired liked state, committed liked state)
+
+
+def _upsert(dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def _bump(db: Session, slug: str, likes: int = 0, comments: int = 0) -> None:
+    """Apply counter deltas to post_stats inside the caller's transaction.
+
+    One INSERT ... ON CONFLICT DO UPDATE doing the arithmetic in SQL, so
+    concurrent comments and like flushes never overwrite each other's counts.
+    """
+    def floor_zero(expr):
+        return case((expr < 0, 0), else_=expr)
+
+    stmt = _upsert(db.get_bind().dialect.name)(PostStats).values(
+        blog_post_slug=slug, like_count=max(likes, 0), comment_count=max(comments, 0)
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[PostStats.blog_post_slug],
+        set_={
+            "like_count": floor_zero(PostStats.like_count + likes),
+            "comment_count": floor_zero(PostStats.comment_count + comments),
+            "updated_at": func.now(),
+        },
+    ))
+
+
+def record_comment(db: Session, slug: str) -> None:
+    """Count a new comment. Call before committing the Comment row."""
+    _bump(db, slug, comments=1)
+
+
+def _counts_stmt(slugs: List[str]):
+    return select(PostStats.blog_post_slug, PostStats.like_count, PostStats.comment_count).where(
+        PostStats.blog_post_slug.in_(slugs)
+    )
+
+
+def _liked_stmt(slugs: List[str], visitor_id: str):
+    return select(Like.blog_post_slug).where(Like.user_id == visitor_id, Like.blog_post_slug.in_(slugs))
+
+
+def _counts_from(slugs: List[str], rows) -> Dict[str, Tuple[int, int]]:
+    counts = {slug: (0, 0) for slug in slugs}
+    for slug, likes, comments in rows:
+        counts[slug] = (likes or 0, comments or 0)
+    return counts
+
+
+def get_counts(db: Session, slugs: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+    """Committed (like_count, comment_count) per slug; missing slugs are (0, 0)."""
+    slugs = list(dict.fromkeys(slugs))
+    return _counts_from(slugs, db.execute(_counts_stmt(slugs)) if slugs else [])
+
+
+class LikeBuffer:
+    """Sync and async sessions share one buffer: each read method has an
+    `_async` twin that runs the same statements on an AsyncSession."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_pending: int = 500,
+    ) -> None:
+        self._session_factory = session_factory
+        self.max_pending = max_pending
+        self._pending: Dict[_Key, _Pending] = {}
+        self._inflight: Dict[_Key, _Pending] = {}  # being written by flush(); still visible to reads
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    # --- reads -----------------------------------------------------------
+
+    def _buffered(self, key: _Key) -> Optional[_Pending]:
+        return self._pending.get(key) or self._inflight.get(key)
+
+    def _deltas(self, slugs: Iterable[str]) -> Dict[str, int]:
+        """Net unflushed like change per slug, in one pass over the buffer."""
+        deltas = dict.fromkeys(slugs, 0)
+        for entries in (self._inflight, self._pending):
+            for (slug, _), (desired, committed) in entries.items():
+                if slug in deltas:
+                    deltas[slug] += int(desired) - int(committed)
+        return deltas
+
+    def _merge(self, slugs: List[str], counts, liked: set, visitor_id: Optional[str]) -> Dict[str, dict]:
+        with self._lock:
+            deltas = self._deltas(slugs)
+            if visitor_id:
+                for slug in slugs:
+                    buffered = self._buffered((slug, visitor_id))
+                    if buffered is not None:
+                        if buffered[0]:
+                            liked.add(slug)
+                        else:
+                            liked.discard(slug)
+        return {
+            slug: {
+                "like_count": max(counts[slug][0] + deltas[slug], 0),
+                "comment_count": counts[slug][1],
+                "liked": slug in liked,
+            }
+            for slug in slugs
+        }
+
+    def state(self, db: Session, slug: str, visitor_id: Optional[str]) -> Tuple[int, bool]:
+        """(like_count, liked) for slug and visitor, including unflushed toggles."""
+        stats = self.bulk_state(db, [slug], visitor_id)[slug]
+        return stats["like_count"], stats["liked"]
+
+    async def state_async(self, db: AsyncSession, slug: str, visitor_id: Optional[str]) -> Tuple[int, bool]:
+        stats = (await self.bulk_state_async(db, [slug], visitor_id))[slug]
+        return stats["like_count"], stats["liked"]
+
+    def bulk_state(self, db: Session, slugs: Iterable[str], visitor_id: Optional[str]) -> Dict[str, dict]:
+        """{slug: {like_count, comment_count, liked}} for many posts in two
+        indexed queries: counts from post_stats, and the visitor's likes."""
+        slugs = list(dict.fromkeys(slugs))
+        if not slugs:
+            return {}
+        counts = _counts_from(slugs, db.execute(_counts_stmt(slugs)))
+        liked = set(db.execute(_liked_stmt(slugs, visitor_id)).scalars()) if visitor_id else set()
+        return self._merge(slugs, counts, liked, visitor_id)
+
+    async def bulk_state_async(
+        self, db: AsyncSession, slugs: Iterable[str], visitor_id: Optional[str]
+    ) -> Dict[str, dict]:
+        slugs = list(dict.fromkeys(slugs))
+        if not slugs:
+            return {}
+        counts = _counts_from(slugs, await db.execute(_counts_stmt(slugs)))
+        liked = set((await db.execute(_liked_stmt(slugs, visitor_id))).scalars()) if visitor_id else set()
+        return self._merge(slugs, counts, liked, visitor_id)
+
+    # --- writes ----------------------------------------------------------
+
+    def _record_toggle(self, key: _Key, committed: Optional[bool]) -> bool:
+        """Flip key in the pending map. Returns True when the buffer is full."""
+        with self._lock:
+            pending = self._pending.get(key)
+            inflight = self._inflight.get(key)
+            if pending is not None:
+                current, base = pending
+            elif inflight is not None:
+                # The in-flight write will land first; build on its outcome.
+                current = base = inflight[0]
+            else:
+                current = base = bool(committed)
+            desired = not current
+            if desired == base:
+                self._pending.pop(key, None)  # toggled back: nothing to write
+            else:
+                self._pending[key] = (desired, base)
+            return len(self._pending) >= self.max_pending
+
+    def toggle(self, db: Session, slug: str, visitor_id: str) -> Tuple[int, bool]:
+        """Flip the visitor's like on slug. Returns the new (like_count, liked)."""
+        key = (slug, visitor_id)
+        with self._lock:
+            buffered = self._buffered(key)
+        committed = None
+        if buffered is None:
+            committed = bool(db.execute(_liked_stmt([slug], visitor_id)).first())
+        if self._record_toggle(key, committed):
+            self.flush()
+        return self.state(db, slug, visitor_id)
+
+    async def toggle_async(self, db: AsyncSession, slug: str, visitor_id: str) -> Tuple[int, bool]:
+        key = (slug, visitor_id)
+        with self._lock:
+            buffered = self._buffered(key)
+        committed = None
+        if buffered is None:
+            committed = bool((await db.execute(_liked_stmt([slug], visitor_id))).first())
+        if self._record_toggle(key, committed):
+            await asyncio.to_thread(self.flush)
+        return await self.state_async(db, slug, visitor_id)
+
+    def flush(self) -> int:
+        """Write pending toggles in one transaction. Returns rows changed."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                self._inflight, self._pending = self._pending, {}
+            batch = self._inflight
+            try:
+                changed = self._write(batch)
+            except Exception:
+                logger.exception("Like flush failed; %d toggles re-queued", len(batch))
+                with self._lock:
+                    for key, entry in batch.items():
+                        self._pending.setdefault(key, entry)
+                    self._inflight = {}
+                return 0
+            with self._lock:
+                self._inflight = {}
+            return changed
+
+    def _write(self, batch: Dict[_Key, _Pending]) -> int:
+        db = self._session_factory()
+        try:
+            slugs = {slug for slug, _ in batch}
+            visitors = {visitor for _, visitor in batch}
+            existing = {
+                tuple(row)
+                for row in db.query(Like.blog_post_slug, Like.user_id)
+                .filter(Like.blog_post_slug.in_(slugs), Like.user_id.in_(visitors))
+                .all()
+            }
+            deltas: Dict[str, int] = defaultdict(int)
+            changed = 0
+            for (slug, visitor), (desired, _) in batch.items():
+                if desired and (slug, visitor) not in existing:
+                    db.add(Like(blog_post_slug=slug, user_id=visitor))
+                    deltas[slug] += 1
+                    changed += 1
+                elif not desired and (slug, visitor) in existing:
+                    db.query(Like).filter(
+                        Like.blog_post_slug == slug,
+                        Like.user_id == visitor,
+                    ).delete(synchronize_session=False)
+                    deltas[slug] -= 1
+                    changed += 1
+            for slug, delta in deltas.items():
+                if delta:
+                    _bump(db, slug, likes=delta)
+            db.commit()
+            return changed
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+like_buffer = LikeBuffer()
@@ -0,0 +1,107 @@
+# app/services/episode_catalogue.py
+"""Shared, mtime-checked view of the podcast episode manifests.
+
+The daily brief, learning brief and backstory pages plus their RSS feeds all
+read the same episodes.json files. Each catalogue parses its manifest once,
+re-reads it only when the file's (mtime, size) changes, and hands out an
+immutable snapshot with a slug index:
+
+    snap = daily_brief_catalogue.snapshot()
+    episode = snap.get(slug)
+
+Episodes are read-only mappings — copy with dict(ep) before decorating one
+for a template.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from app.config import settings
+from app.services.artifact_cache import file_stamp
+
+logger = logging.getLogger(__name__)
+
+Episode = Mapping[str, object]
+
+
+@dataclass(frozen=True)
+class EpisodeSnapshot:
+    episodes: Tuple[Episode, ...] = ()
+    by_slug: Dict[str, int] = field(default_factory=dict)   # slug -> position in episodes
+    tags: Tuple[str, ...] = ()
+    stamp: tuple = ()
+
+    def get(self, slug: str) -> Optional[Episode]:
+        index = self.by_slug.get(slug)
+        return self.episodes[index] if index is not None else None
+
+    def neighbours(self, slug: str) -> Tuple[Optional[Episode], Optional[Episode]]:
+        """(previous, next) episodes around slug. Manifests are newest-first,
+        so previous is the older episode at index + 1."""
+        index = self.by_slug.get(slug)
+        if index is None:
+            return None, None
+        previous = self.episodes[index + 1] if index + 1 < len(self.episodes) else None
+        following = self.episodes[index - 1] if index > 0 else None
+        return previous, following
+
+
+class EpisodeCatalogue:
+    def __init__(self, manifest_path: Path) -> None:
+        self.manifest_path = Path(manifest_path)
+        self._snapshot: Optional[EpisodeSnapshot] = None
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> EpisodeSnapshot:
+        """Current snapshot; one stat() per call, a re-parse only when the file changed."""
+        stamp = file_stamp(self.manifest_path)
+        current = self._snapshot
+        if current is not None and current.stamp == stamp:
+            return current
+        with self._lock:
+            if self._snapshot is None or self._snapshot.stamp != stamp:
+                self._snapshot = self._load(stamp)
+            return self._snapshot
+
+    def _load(self, stamp: tuple) -> EpisodeSnapshot:
+        if stamp[0] is None:
+            return EpisodeSnapshot(stamp=stamp)
+        try:
+            data = json.loads(self.manifest_path.read_text())
+            if not isinstance(data, dict):
+                raise ValueError("manifest is not a JSON object")
+            episodes = tuple(MappingProxyType(dict(ep)) for ep in data.get("episodes") or [])
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Failed to load %s: %s", self.manifest_path, exc)
+            # Keep serving the last good episodes through a half-written manifest,
+            # under the bad file's stamp so it is not re-read until it changes again.
+            if self._snapshot is None:
+                return EpisodeSnapshot(stamp=stamp)
+            return replace(self._snapshot, stamp=stamp)
+
+        by_slug: Dict[str, int] = {}
+        for index, ep in enumerate(episodes):
+            slug = ep.get("slug")
+            if slug and slug not in by_slug:  # first match wins, as a linear scan would
+                by_slug[slug] = index
+
+        tags = sorted({str(tag) for ep in episodes for tag in ep.get("tags", []) or []}, key=str.lower)
+        return EpisodeSnapshot(
+            episodes=episodes,
+            by_slug=by_slug,
+            tags=tuple(tags),
+            stamp=stamp,
+        )
+
+
+PODCAST_DIR = settings.static_dir / "podcast"
+
+daily_brief_catalogue = EpisodeCatalogue(PODCAST_DIR / "episodes.json")
+learning_brief_catalogue = EpisodeCatalogue(PODCAST_DIR / "learning-brief" / "episodes.json")
+backstory_catalogue = EpisodeCatalogue(PODCAST_DIR / "the-backstory" / "episodes.json")
@@ -0,0 +1,199 @@
+# app/services/evaluation_cache.py
+"""Cache of interview-coach evaluations, keyed by question and answer.
+
+Practice loops resubmit the same answer, or the same answer with a typo
+fixed, to the same question. Both cost a full model call for an evaluation
+that would come out the same. Lookups go in two steps:
+
+  exact — (question_id, fingerprint), where the fingerprint hashes the
+          answer after lowercasing and collapsing punctuation/whitespace.
+  near  — optional, off unless near_threshold > 0. MinHash over word
+          shingles, compared against the cached answers to the same
+          question. An estimated Jaccard similarity of at least
+          `near_threshold` counts as the same answer only if the word count
+          is within NEAR_LENGTH_SLACK and the last sentence is unchanged: a
+          flipped conclusion is a small edit by similarity but a different
+          answer to grade.
+
+Entries expire after ttl_seconds; beyond max_entries the least recently
+used entry is dropped.
+
+    cached = evaluation_cache.get(question_id, answer)
+    ...
+    evaluation_cache.put(question_id, answer, result)
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+from app.config import settings
+
+SHINGLE_SIZE = 3
+MINHASH_PERMUTATIONS = 64
+# Near matches need enough shingles for the similarity estimate to mean
+# anything; two short answers differing by one word are different answers.
+MIN_SHINGLES = 12
+NEAR_LENGTH_SLACK = 2  # words
+
+_SENTENCE_RE = re.compile(r"[.!?]+")
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)  # fixed: signatures must be stable across restarts
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(MINHASH_PERMUTATIONS)]
+
+Signature = Tuple[int, ...]
+
+
+def normalize_answer(text: str) -> str:
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+
+def answer_fingerprint(text: str) -> str:
+    return hashlib.sha256(normalize_answer(text).encode("utf-8")).hexdigest()[:32]
+
+
+def minhash(text: str) -> Optional[Signature]:
+    """MinHash signature of the answer's word shingles; None when too short."""
+    words = normalize_answer(text).split()
+    shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def last_sentence(text: str) -> str:
+    """The answer's final sentence, normalized (its conclusion)."""
+    sentences = [normalize_answer(part) for part in _SENTENCE_RE.split(text or "")]
+    return next((sentence for sentence in reversed(sentences) if sentence), "")
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    signature: Optional[Signature]
+    words: int
+    ending: str
+    expires_at: float
+
+
+class EvaluationCache:
+    def __init__(
+        self,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 2000,
+        near_threshold: float = 0.0,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.near_threshold = near_threshold  # 0 disables near-duplicate matching
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._by_question: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = self.near_hits = self.misses = 0
+
+    def get(self, question_id: str, answer: str) -> Optional[Any]:
+        """Cached evaluation for this answer (or a near-identical one), else None."""
+        fingerprint = answer_fingerprint(answer)
+        now = time.monotonic()
+        with self._lock:
+            value = self._live((question_id, fingerprint), now)
+            if value is not None:
+                self.hits += 1
+                return value
+        # Signatures cost a few ms for long answers; compute outside the lock.
+        signature = minhash(answer) if self.near_threshold > 0 else None
+        with self._lock:
+            value = self._nearest(question_id, signature, answer, now)
+            if value is not None:
+                self.near_hits += 1
+                return value
+            self.misses += 1
+            return None
+
+    def put(self, question_id: str, answer: str, value: Any) -> None:
+        key = (question_id, answer_fingerprint(answer))
+        signature = minhash(answer) if self.near_threshold > 0 else None
+        with self._lock:
+            self._entries[key] = _Entry(
+                value,
+                signature,
+                len(normalize_answer(answer).split()),
+                last_sentence(answer),
+                time.monotonic() + self.ttl_seconds,
+            )
+            self._entries.move_to_end(key)
+            self._by_question.setdefault(question_id, set()).add(key[1])
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_question.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # --- internals (call with the lock held) -----------------------------
+
+    def _live(self, key: Tuple[str, str], now: float) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def _nearest(
+        self, question_id: str, signature: Optional[Signature], answer: str, now: float
+    ) -> Optional[Any]:
+        if signature is None:
+            return None
+        words, ending = len(normalize_answer(answer).split()), last_sentence(answer)
+        best_key, best_score = None, self.near_threshold
+        for fingerprint in list(self._by_question.get(question_id, ())):
+            key = (question_id, fingerprint)
+            entry = self._entries[key]
+            if entry.expires_at <= now:
+                self._drop(key)
+                continue
+            if entry.signature is None or entry.ending != ending or abs(entry.words - words) > NEAR_LENGTH_SLACK:
+                continue
+            score = similarity(signature, entry.signature)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self._live(best_key, now) if best_key else None
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        fingerprints = self._by_question.get(key[0])
+        if fingerprints is not None:
+            fingerprints.discard(key[1])
+            if not fingerprints:
+                del self._by_question[key[0]]
+
+
+evaluation_cache = EvaluationCache(
+    ttl_seconds=settings.eval_cache_ttl_seconds,
+    max_entries=settings.eval_cache_max_entries,
+    near_threshold=settings.eval_cache_near_threshold,
+)
@@ -0,0 +1,125 @@
+# app/services/feed_dedup.py
+"""Near-duplicate detection for the PM feed.
+
+Syndicated stories arrive from several sources under different URLs (Medium
+mirrors, tracking params, the same launch covered by AWS and InfoQ). Two
+layers catch them before they cost an LLM call:
+
+  canonical_url() — exact identity after stripping tracking params, www/m.
+                    hosts, fragments and Medium publication mirrors.
+  simhash()       — 64-bit SimHash over word shingles. Two texts whose
+                    fingerprints differ in <= SIMHASH_MAX_DISTANCE bits are
+                    treated as the same story.
+
+Fingerprints are stored as 16-char hex strings (SQLite INTEGER is signed, a
+64-bit fingerprint does not fit).
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+# Max Hamming distance for a near-duplicate. Title+excerpt is short and noisy,
+# so it gets a tighter bound than full extracted text.
+SIMHASH_MAX_DISTANCE = 3
+FULLTEXT_MAX_DISTANCE = 6
+
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ref", "ref_src",
+    "source", "sk", "cmpid", "ncid", "guccounter", "_hsenc", "_hsmi",
+    "mkt_tok", "igshid", "share", "triedredirect",
+}
+_TRACKING_PREFIXES = ("utm_", "__s", "at_")
+
+# Medium post URLs end in a 12-hex-char id regardless of publication.
+_MEDIUM_ID_RE = re.compile(r"-([0-9a-f]{10,12})$")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so mirrors and tracking variants compare equal."""
+    raw = (url or "").strip()
+    if not raw:
+        return ""
+    parts = urlsplit(raw)
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if path.endswith("/amp"):
+        path = path[:-4]
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    medium_id = _MEDIUM_ID_RE.search(path)
+    if medium_id and (host == "medium.com" or host.endswith(".medium.com")):
+        return f"https://medium.com/p/{medium_id.group(1)}"
+
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=False)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith(_TRACKING_PREFIXES)
+    ]
+    query.sort()
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _shingles(text: str) -> Iterable[str]:
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) < SHINGLE_SIZE:
+        return words
+    return (" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1))
+
+
+def simhash(text: str) -> Optional[str]:
+    """64-bit SimHash of the text's word shingles, as hex. None for empty text."""
+    weights = [0] * SIMHASH_BITS
+    seen = False
+    for shingle in _shingles(text):
+        seen = True
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    if not seen:
+        return None
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return f"{value:016x}"
+
+
+def hamming(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def find_near_duplicate(
+    fingerprint: Optional[str],
+    candidates: Iterable[Tuple[int, Optional[str]]],
+    max_distance: int = SIMHASH_MAX_DISTANCE,
+) -> Optional[int]:
+    """Return the id of the closest candidate within max_distance, else None.
+
+    candidates is an iterable of (id, fingerprint) pairs.
+    """
+    if not fingerprint:
+        return None
+    best_id, best_distance = None, max_distance + 1
+    for candidate_id, other in candidates:
+        if not other:
+            continue
+        distance = hamming(fingerprint, other)
+        if distance < best_distance:
+            best_id, best_distance = candidate_id, distance
+    return best_id
+
+
+def article_fingerprint(title: str, excerpt: Optional[str]) -> Optional[str]:
+    """Fetch-time fingerprint: title + excerpt (all we have before extraction)."""
+    return simhash(f"{title or ''} {excerpt or ''}")
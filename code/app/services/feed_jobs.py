@@ -0,0 +1,48 @@
+# app/services/feed_jobs.py
+"""Feed refresh and daily brief generation as app.services.job_runner jobs.
+
+Both are minutes of blocking work (RSS fetches; a Claude call followed by
+edge-tts synthesis), so each runs on a worker thread with its own session.
+"""
+from __future__ import annotations
+
+import asyncio
+
+from app.database import SessionLocal
+from app.services.brief_service import brief_service
+from app.services.feed_service import feed_service
+from app.services.job_runner import job_runner
+
+REFRESH_JOB = "feed.refresh"
+BRIEF_JOB = "feed.brief"
+
+
+def _refresh() -> dict:
+    db = SessionLocal()
+    try:
+        return {"new_articles": feed_service.fetch_all(db)}
+    finally:
+        db.close()
+
+
+def _generate_brief() -> dict:
+    db = SessionLocal()
+    try:
+        # brief_service.generate makes a synchronous Claude call; give it its
+        # own event loop on this thread so the app's loop is never blocked.
+        generated = asyncio.run(brief_service.generate(db))
+    finally:
+        db.close()
+    return {"generated": generated, "latest": brief_service.get_latest()}
+
+
+async def refresh_feed(params: dict) -> dict:
+    return await asyncio.to_thread(_refresh)
+
+
+async def generate_brief(params: dict) -> dict:
+    return await asyncio.to_thread(_generate_brief)
+
+
+job_runner.register(REFRESH_JOB, refresh_feed)
+job_runner.register(BRIEF_JOB, generate_brief)
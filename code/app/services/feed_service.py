@@ -4,20 +4,24 @@ from __future__ import annotations
 import json
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 import feedparser
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.feed_article import FeedArticle
+from app.services.feed_dedup import article_fingerprint, canonical_url, find_near_duplicate
 from app.services.feed_sources import FEED_SOURCES
 
 logger = logging.getLogger(__name__)
 
 MAX_ARTICLES_PER_SOURCE = 5
 MAX_EXCERPT_CHARS = 300
+DEDUP_WINDOW_DAYS = 14  # syndicated copies land within days of each other
 
 # Match emoji/pictograph Unicode ranges common in RSS feed titles
 _EMOJI_RE = re.compile(
@@ -97,6 +101,7 @@ class FeedService:
                     fetched = a.get("fetched_at")
                     db.add(FeedArticle(
                         url=url,
+                        canonical_url=canonical_url(url),
                         title=a.get("title", "")[:500],
                         display_title=a.get("display_title"),
                         excerpt=a.get("excerpt"),
@@ -127,7 +132,23 @@ class FeedService:
         return upserted
 
     def fetch_all(self, db: Session) -> int:
-        """Fetch all RSS sources and store new articles. Return new article count."""
+        """Fetch all RSS sources and store new articles. Return new article count.
+
+        URLs are canonicalized before the existence check, so tracking-param and
+        mirror variants of a stored article are skipped. Articles whose
+        title+excerpt fingerprint is within SIMHASH_MAX_DISTANCE of a recent
+        article are stored with duplicate_of pointing at the cluster
+        representative — downstream AI stages only process representatives.
+        """
+        since = datetime.utcnow() - timedelta(days=DEDUP_WINDOW_DAYS)
+        recent = [
+            (row.duplicate_of or row.id, row.simhash)
+            for row in db.query(FeedArticle.id, FeedArticle.duplicate_of, FeedArticle.simhash)
+            .filter(FeedArticle.fetched_at >= since)
+            .filter(FeedArticle.simhash.isnot(None))
+            .all()
+        ]
+
         new_count = 0
         for source in FEED_SOURCES:
             try:
@@ -137,19 +158,33 @@ class FeedService:
                     if not url:
                         continue
 
-                    exists = db.query(FeedArticle).filter_by(url=url).first()
+                    canonical = canonical_url(url)
+                    exists = (
+                        db.query(FeedArticle.id)
+                        .filter(or_(FeedArticle.url == url, FeedArticle.canonical_url == canonical))
+                        .first()
+                    )
                     if exists:
                         continue
 
+                    title = _clean_title(entry.get("title", "Untitled"))[:500]
+                    excerpt = _clean_excerpt(entry)
+                    fingerprint = article_fingerprint(title, excerpt)
                     article = FeedArticle(
-                        title=_clean_title(entry.get("title", "Untitled"))[:500],
+                        title=title,
                         url=url,
-                        excerpt=_clean_excerpt(entry),
+                        canonical_url=canonical,
+                        simhash=fingerprint,
+                        duplicate_of=find_near_duplicate(fingerprint, recent),
+                        excerpt=excerpt,
                         source_name=source["name"],
                         source_category=source["category"],
                         published_at=_parse_date(entry),
                     )
                     db.add(article)
+                    db.flush()
+                    if fingerprint:
+                        recent.append((article.duplicate_of or article.id, fingerprint))
                     new_count += 1
                 db.commit()
             except Exception as exc:
@@ -160,20 +195,50 @@ class FeedService:
     def get_article(self, db: Session, article_id: int) -> Optional[FeedArticle]:
         return db.query(FeedArticle).filter(FeedArticle.id == article_id).first()
 
+    _RANKING = (
+        FeedArticle.ai_score.desc().nullslast(),
+        FeedArticle.published_at.desc().nullslast(),
+        FeedArticle.fetched_at.desc(),
+    )
+
+    @staticmethod
+    def _visible(stmt):
+        return stmt.where(FeedArticle.is_dismissed == False).where(FeedArticle.duplicate_of.is_(None))
+
+    @classmethod
+    def _articles_stmt(cls, category: str, limit: int):
+        stmt = cls._visible(select(FeedArticle))
+        if category != "all":
+            stmt = stmt.where(FeedArticle.source_category == category)
+        return stmt.order_by(*cls._RANKING).limit(limit)
+
     def get_articles(self, db: Session, category: str = "all", limit: int = 60) -> list[FeedArticle]:
         """Return feed articles sorted by AI score then date, optionally filtered by category."""
-        query = db.query(FeedArticle).filter(FeedArticle.is_dismissed == False)
-        if category != "all":
-            query = query.filter(FeedArticle.source_category == category)
-        return (
-            query.order_by(
-                FeedArticle.ai_score.desc().nullslast(),
-                FeedArticle.published_at.desc().nullslast(),
-                FeedArticle.fetched_at.desc(),
-            )
-            .limit(limit)
-            .all()
+        return list(db.execute(self._articles_stmt(category, limit)).scalars())
+
+    async def get_articles_async(self, db: AsyncSession, category: str = "all", limit: int = 60) -> list[FeedArticle]:
+        """get_articles() for async sessions."""
+        return list((await db.execute(self._articles_stmt(category, limit))).scalars())
+
+    async def get_top_by_category_async(
+        self, db: AsyncSession, categories: list[str], per_category: int
+    ) -> dict[str, list[FeedArticle]]:
+        """Top `per_category` articles for each category in one query
+        (ROW_NUMBER per category) instead of one round-trip per category."""
+        rank = func.row_number().over(partition_by=FeedArticle.source_category, order_by=self._RANKING).label("rank")
+        ranked = self._visible(
+            select(FeedArticle.id, rank).where(FeedArticle.source_category.in_(categories))
+        ).subquery()
+        stmt = (
+            select(FeedArticle)
+            .join(ranked, ranked.c.id == FeedArticle.id)
+            .where(ranked.c.rank <= per_category)
+            .order_by(FeedArticle.source_category, ranked.c.rank)
         )
+        grouped: dict[str, list[FeedArticle]] = {category: [] for category in categories}
+        for article in (await db.execute(stmt)).scalars():
+            grouped[article.source_category].append(article)
+        return grouped
 
 
 feed_service = FeedService()
@@ -0,0 +1,197 @@
+# app/services/feed_sync.py
+"""Delta sync of processed feed articles from the local machine to Render.
+
+scripts/process_feed.py does the AI work locally and pushes results to
+/api/feed/sync. Sending every article on every run grows without bound, so
+the protocol is:
+
+  1. The client GETs /api/feed/sync/manifest: {url: sync_hash} for every
+     article the server already has.
+  2. It hashes its own payloads (content_hash) and keeps only the articles
+     whose hash is missing or different.
+  3. Those go up as gzip-compressed NDJSON, one POST per chunk of at most
+     SYNC_CHUNK_ARTICLES articles / SYNC_CHUNK_BYTES bytes.
+  4. The server applies each chunk in one transaction (apply_articles) and
+     stores the client's hash, so the next manifest reflects it.
+
+A content hash rather than an ai_processed_at watermark, because analyses
+are generated after scoring without touching ai_processed_at.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.feed_article import FeedArticle
+from app.services.feed_dedup import canonical_url
+
+SYNC_CHUNK_ARTICLES = 100
+SYNC_CHUNK_BYTES = 1_000_000          # uncompressed NDJSON per chunk
+MAX_SYNC_BODY_BYTES = 16_000_000      # decompressed, server side
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+SYNC_FIELDS = (
+    "url", "title", "display_title", "excerpt", "source_name", "source_category",
+    "published_at", "ai_score", "ai_score_reason", "ai_summary", "first_principle",
+    "key_insight", "ai_insight", "ai_article_analysis", "ai_processed_at",
+)
+# Fields refreshed on articles the server already has; editorial state
+# (is_editors_pick, is_dismissed) is never overwritten.
+AI_FIELDS = (
+    "display_title", "ai_score", "ai_score_reason",
+    "ai_summary", "first_principle", "key_insight", "ai_insight",
+    "ai_article_analysis", "ai_processed_at",
+)
+_DATETIME_FIELDS = ("published_at", "ai_processed_at")
+
+
+class SyncPayloadError(ValueError):
+    """Malformed or oversized sync body."""
+
+
+def serialize_article(a: FeedArticle) -> dict:
+    payload = {field: getattr(a, field) for field in SYNC_FIELDS}
+    for field in _DATETIME_FIELDS:
+        if payload[field] is not None:
+            payload[field] = payload[field].isoformat()
+    return payload
+
+
+def content_hash(payload: dict) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+# --- client side ------------------------------------------------------------
+
+
+def changed_payloads(articles: Iterable[FeedArticle], manifest: Dict[str, str]) -> Iterator[dict]:
+    """Payloads (with their sync_hash) the server does not already have."""
+    for article in articles:
+        payload = serialize_article(article)
+        digest = content_hash(payload)
+        if manifest.get(payload["url"]) != digest:
+            payload["sync_hash"] = digest
+            yield payload
+
+
+def ndjson_chunks(
+    payloads: Iterable[dict],
+    max_articles: int = SYNC_CHUNK_ARTICLES,
+    max_bytes: int = SYNC_CHUNK_BYTES,
+) -> Iterator[Tuple[int, bytes]]:
+    """(article_count, gzip'd NDJSON body) per chunk. An article larger than
+    max_bytes on its own still goes, alone in its chunk."""
+    lines: List[bytes] = []
+    size = 0
+    for payload in payloads:
+        line = json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n"
+        if lines and (len(lines) >= max_articles or size + len(line) > max_bytes):
+            yield len(lines), gzip.compress(b"".join(lines))
+            lines, size = [], 0
+        lines.append(line)
+        size += len(line)
+    if lines:
+        yield len(lines), gzip.compress(b"".join(lines))
+
+
+# --- server side ------------------------------------------------------------
+
+
+def decode_body(body: bytes, content_type: str = "", content_encoding: str = "") -> List[dict]:
+    """Articles from a sync request: gzip'd or plain NDJSON, or the legacy
+    {"articles": [...]} JSON document."""
+    if "gzip" in (content_encoding or "").lower():
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = inflater.decompress(body, MAX_SYNC_BODY_BYTES)
+        except zlib.error as exc:
+            raise SyncPayloadError(f"bad gzip body: {exc}") from exc
+        if inflater.unconsumed_tail:
+            raise SyncPayloadError("sync chunk too large")
+    elif len(body) > MAX_SYNC_BODY_BYTES:
+        raise SyncPayloadError("sync chunk too large")
+
+    try:
+        if NDJSON_MEDIA_TYPE in (content_type or ""):
+            return [json.loads(line) for line in body.splitlines() if line.strip()]
+        return list(json.loads(body or b"{}").get("articles", []))
+    except (ValueError, AttributeError) as exc:
+        raise SyncPayloadError(f"bad sync payload: {exc}") from exc
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def apply_articles(db: Session, articles: List[dict]) -> Dict[str, int]:
+    """Upsert one chunk of articles in a single transaction."""
+    by_url: Dict[str, dict] = {}
+    for a in articles:
+        url = (a.get("url") or "").strip()
+        if url:
+            by_url[url] = a  # last one wins within a chunk
+
+    existing = {
+        row.url: row
+        for row in db.query(FeedArticle).filter(FeedArticle.url.in_(list(by_url))).all()
+    } if by_url else {}
+
+    inserted = updated = 0
+    try:
+        for url, a in by_url.items():
+            row = existing.get(url)
+            if row is not None:
+                for field in AI_FIELDS:
+                    value = a.get(field)
+                    if value is None:
+                        continue
+                    if field in _DATETIME_FIELDS:
+                        value = _parse_datetime(value)
+                    setattr(row, field, value)
+                updated += 1
+            else:
+                row = FeedArticle(
+                    title=(a.get("title") or "")[:500],
+                    url=url,
+                    canonical_url=canonical_url(url),
+                    excerpt=a.get("excerpt"),
+                    source_name=a.get("source_name", ""),
+                    source_category=a.get("source_category", ""),
+                    published_at=_parse_datetime(a.get("published_at")),
+                    display_title=a.get("display_title"),
+                    ai_score=a.get("ai_score"),
+                    ai_score_reason=a.get("ai_score_reason"),
+                    ai_summary=a.get("ai_summary"),
+                    first_principle=a.get("first_principle"),
+                    key_insight=a.get("key_insight"),
+                    ai_insight=a.get("ai_insight"),
+                    ai_article_analysis=a.get("ai_article_analysis"),
+                    ai_processed_at=_parse_datetime(a.get("ai_processed_at")),
+                )
+                db.add(row)
+                inserted += 1
+            row.sync_hash = a.get("sync_hash")
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return {"inserted": inserted, "updated": updated}
+
+
+def sync_manifest(db: Session) -> Dict[str, str]:
+    """{url: sync_hash} for every article that arrived through delta sync."""
+    rows = db.query(FeedArticle.url, FeedArticle.sync_hash).filter(FeedArticle.sync_hash.isnot(None))
+    return {url: digest for url, digest in rows}
@@ -0,0 +1,201 @@
+# app/services/file_streaming.py
+"""Range-aware streaming file responses for podcast audio.
+
+Apple Podcasts and Overcast fetch episodes with HTTP byte-range requests,
+often several ranges per request when scrubbing. This serves a file without
+ever holding it in memory: bytes are read in CHUNK_SIZE pieces on a worker
+thread (anyio.open_file) so the event loop never blocks on disk I/O.
+
+Supports single and multi-range (multipart/byteranges) requests, If-Range,
+and conditional GETs (If-None-Match / If-Modified-Since -> 304). Validators
+come from the file's stat, so nothing is hashed per request.
+"""
+from __future__ import annotations
+
+import os
+import re
+import secrets
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Tuple
+
+import anyio
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+MAX_RANGES = 16  # more than this is a scanner, not a player
+CRLF = "\r\n"
+
+_RANGE_SPEC_RE = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+ByteRange = Tuple[int, int]  # inclusive (start, end)
+
+
+def _etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _last_modified(stat: os.stat_result) -> datetime:
+    return datetime.fromtimestamp(int(stat.st_mtime), tz=timezone.utc)
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_range_header(header: str, file_size: int) -> Optional[List[ByteRange]]:
+    """Parse a `Range: bytes=...` header.
+
+    Returns None if the header is malformed or not a bytes range (serve the
+    full file), [] if no range is satisfiable (416), else the ranges.
+    """
+    unit, _, specs = header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs:
+        return None
+    ranges: List[ByteRange] = []
+    for spec in specs.split(","):
+        match = _RANGE_SPEC_RE.match(spec)
+        if not match or (not match.group(1) and not match.group(2)):
+            return None
+        first, last = match.group(1), match.group(2)
+        if first:
+            start = int(first)
+            end = min(int(last), file_size - 1) if last else file_size - 1
+            if last and int(last) < start:
+                return None
+        else:
+            # Suffix range: the final N bytes.
+            start = max(file_size - int(last), 0)
+            end = file_size - 1
+        if start < file_size and start <= end:
+            ranges.append((start, end))
+    if len(ranges) > MAX_RANGES:
+        return None
+    return ranges
+
+
+def _coalesce(ranges: List[ByteRange]) -> List[ByteRange]:
+    """Merge overlapping/adjacent ranges so multipart bodies never repeat bytes."""
+    merged: List[ByteRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+async def _iter_ranges(
+    path: Path,
+    ranges: List[ByteRange],
+    parts: Optional[List[bytes]] = None,
+    tail: bytes = b"",
+) -> AsyncIterator[bytes]:
+    """Yield the bytes of each range, preceded by its multipart header if given."""
+    async with await anyio.open_file(path, "rb") as f:
+        for index, (start, end) in enumerate(ranges):
+            if parts:
+                yield parts[index]
+            await f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+    if tail:
+        yield tail
+
+
+def _not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        since = _parse_http_date(if_modified_since)
+        return since is not None and last_modified <= since
+    return False
+
+
+def _if_range_allows(request: Request, etag: str, last_modified: datetime) -> bool:
+    """If-Range: honor Range only when the client's validator still matches."""
+    if_range = request.headers.get("if-range")
+    if not if_range:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        return if_range == etag  # strong comparison required
+    since = _parse_http_date(if_range)
+    return since is not None and last_modified == since
+
+
+def stream_file(
+    path: Path,
+    request: Request,
+    media_type: str,
+    cache_control: str = "public, max-age=86400",
+) -> Response:
+    """Serve `path` with range, multi-range, If-Range and conditional GET support."""
+    stat = path.stat()
+    file_size = stat.st_size
+    etag = _etag(stat)
+    last_modified = _last_modified(stat)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    ranges = None
+    if range_header and _if_range_allows(request, etag, last_modified):
+        ranges = parse_range_header(range_header, file_size)
+
+    if ranges is None:
+        headers["Content-Length"] = str(file_size)
+        whole = [(0, file_size - 1)] if file_size else []
+        return StreamingResponse(_iter_ranges(path, whole), media_type=media_type, headers=headers)
+
+    if not ranges:
+        headers["Content-Range"] = f"bytes */{file_size}"
+        return Response(status_code=416, headers=headers)
+
+    ranges = _coalesce(ranges)
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(_iter_ranges(path, ranges), status_code=206, media_type=media_type, headers=headers)
+
+    boundary = secrets.token_hex(12)
+    parts = [
+        (
+            f"{'' if index == 0 else CRLF}--{boundary}{CRLF}"
+            f"Content-Type: {media_type}{CRLF}"
+            f"Content-Range: bytes {start}-{end}/{file_size}{CRLF}{CRLF}"
+        ).encode()
+        for index, (start, end) in enumerate(ranges)
+    ]
+    tail = f"{CRLF}--{boundary}--{CRLF}".encode()
+    headers["Content-Length"] = str(
+        sum(len(p) for p in parts) + sum(end - start + 1 for start, end in ranges) + len(tail)
+    )
+    return StreamingResponse(
+        _iter_ranges(path, ranges, parts, tail),
+        status_code=206,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+        headers=headers,
+    )
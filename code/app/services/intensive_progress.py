@@ -0,0 +1,258 @@
+# app/services/intensive_progress.py
+"""Store for the 8-week intensive tracker: counters, activity and notes.
+
+Replaces the per-user intensive_progress_{user}.json / intensive_notes_{user}.json
+files, which were read and rewritten whole on every request (so concurrent
+logs lost updates) and whose activity list grew forever:
+
+  counters — one IntensiveProgress row per user, incremented in SQL
+             (`SET x = x + n`), so concurrent logs all count;
+  activity — append-only IntensiveActivity rows, trimmed to the newest
+             ACTIVITY_RETENTION per user on write;
+  notes    — IntensiveNote rows.
+
+Reads are bounded: get_progress() returns the newest RECENT_ACTIVITY
+entries, and activity and notes are paged by id cursor (`before`), so
+neither a load nor a log gets slower as a user's history grows.
+
+import_legacy_files() moves any remaining JSON files into the tables once,
+at startup, and renames them to *.json.imported.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.intensive_progress import IntensiveActivity, IntensiveNote, IntensiveProgress
+
+logger = logging.getLogger(__name__)
+
+# API field -> column, in the order the tracker shows them.
+COUNTERS = {
+    "problemsSolved": "problems_solved",
+    "applicationsSubmitted": "applications_submitted",
+    "interviewsCompleted": "interviews_completed",
+    "storiesWritten": "stories_written",
+    "designsMastered": "designs_mastered",
+    "offersReceived": "offers_received",
+}
+RECENT_ACTIVITY = 50  # what the tracker keeps client-side too
+ACTIVITY_RETENTION = 500
+DEFAULT_PAGE = 100
+MAX_PAGE = 500
+
+
+def page_size(limit: Optional[Any], default: int = DEFAULT_PAGE) -> int:
+    try:
+        return min(max(int(limit), 1), MAX_PAGE)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_time(value: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return datetime.now()
+
+
+def _activity_dict(row: IntensiveActivity) -> dict:
+    return {"id": row.id, "message": row.message, "timestamp": row.created_at.isoformat()}
+
+
+def _ensure_row(db: Session, user_key: str) -> None:
+    if db.get(IntensiveProgress, user_key) is not None:
+        return
+    try:
+        with db.begin_nested():
+            db.add(IntensiveProgress(user_key=user_key, updated_at=datetime.utcnow()))
+    except IntegrityError:
+        pass  # created concurrently
+
+
+def _trim_activity(db: Session, user_key: str) -> None:
+    cutoff = (
+        db.query(IntensiveActivity.id)
+        .filter(IntensiveActivity.user_key == user_key)
+        .order_by(IntensiveActivity.id.desc())
+        .offset(ACTIVITY_RETENTION)
+        .limit(1)
+        .scalar()
+    )
+    if cutoff is not None:
+        db.query(IntensiveActivity).filter(
+            IntensiveActivity.user_key == user_key, IntensiveActivity.id <= cutoff
+        ).delete(synchronize_session=False)
+
+
+def list_activity(
+    db: Session, user_key: str, limit: int = DEFAULT_PAGE, before: Optional[int] = None
+) -> Tuple[List[dict], Optional[int]]:
+    """Newest first; the second value is the `before` cursor for the next page."""
+    query = db.query(IntensiveActivity).filter(IntensiveActivity.user_key == user_key)
+    if before is not None:
+        query = query.filter(IntensiveActivity.id < before)
+    rows = query.order_by(IntensiveActivity.id.desc()).limit(limit + 1).all()
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return [_activity_dict(row) for row in rows], (rows[-1].id if more else None)
+
+
+def get_progress(db: Session, user_key: str) -> Dict[str, Any]:
+    """The tracker's progress object; recentActivity is the newest
+    RECENT_ACTIVITY entries, oldest first."""
+    row = db.get(IntensiveProgress, user_key)
+    activity, next_before = list_activity(db, user_key, RECENT_ACTIVITY)
+    progress: Dict[str, Any] = {
+        name: getattr(row, column) if row else 0 for name, column in COUNTERS.items()
+    }
+    progress["weeklyStats"] = json.loads(row.weekly_stats) if row and row.weekly_stats else {}
+    progress["recentActivity"] = activity[::-1]
+    progress["activityBefore"] = next_before
+    return progress
+
+
+def log_progress(db: Session, user_key: str, problems: int, apps: int, interviews: int) -> Dict[str, Any]:
+    _ensure_row(db, user_key)
+    db.query(IntensiveProgress).filter(IntensiveProgress.user_key == user_key).update(
+        {
+            IntensiveProgress.problems_solved: IntensiveProgress.problems_solved + problems,
+            IntensiveProgress.applications_submitted: IntensiveProgress.applications_submitted + apps,
+            IntensiveProgress.interviews_completed: IntensiveProgress.interviews_completed + interviews,
+            IntensiveProgress.updated_at: datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
+    db.add(IntensiveActivity(
+        user_key=user_key,
+        message=f"Logged: {problems} problems, {apps} applications, {interviews} interviews",
+    ))
+    db.flush()
+    _trim_activity(db, user_key)
+    db.commit()
+    return get_progress(db, user_key)
+
+
+def apply_progress(db: Session, user_key: str, payload: Dict[str, Any]) -> None:
+    """Overwrite the fields present in payload (counters, weeklyStats and,
+    if given, the whole recentActivity list)."""
+    _ensure_row(db, user_key)
+    values: Dict[str, Any] = {}
+    for name, column in COUNTERS.items():
+        if name in payload:
+            values[column] = int(payload[name] or 0)
+    if isinstance(payload.get("weeklyStats"), dict):
+        values["weekly_stats"] = json.dumps(payload["weeklyStats"])
+    values["updated_at"] = datetime.utcnow()
+    db.query(IntensiveProgress).filter(IntensiveProgress.user_key == user_key).update(
+        values, synchronize_session=False
+    )
+    if isinstance(payload.get("recentActivity"), list):
+        db.query(IntensiveActivity).filter(IntensiveActivity.user_key == user_key).delete(
+            synchronize_session=False
+        )
+        db.add_all(
+            IntensiveActivity(
+                user_key=user_key,
+                message=str(item.get("message", "")),
+                created_at=_parse_time(item.get("timestamp")),
+            )
+            for item in payload["recentActivity"][-ACTIVITY_RETENTION:]
+            if isinstance(item, dict)
+        )
+    db.commit()
+
+
+def list_notes(
+    db: Session, user_key: str, limit: int = DEFAULT_PAGE, before: Optional[int] = None
+) -> Tuple[List[dict], Optional[int]]:
+    """A page of notes, oldest first (as the notes page appends); pages walk
+    back in time via the returned `before` cursor."""
+    query = db.query(IntensiveNote).filter(IntensiveNote.user_key == user_key)
+    if before is not None:
+        query = query.filter(IntensiveNote.id < before)
+    rows = query.order_by(IntensiveNote.id.desc()).limit(limit + 1).all()
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return [row.to_dict() for row in reversed(rows)], (rows[-1].id if more else None)
+
+
+def create_note(db: Session, user_key: str, payload: Dict[str, Any]) -> dict:
+    week = payload.get("week")
+    note = IntensiveNote(
+        note_id=str(uuid.uuid4()),
+        user_key=user_key,
+        category=payload.get("category") or "other",
+        week=str(week) if week not in (None, "") else None,
+        content=payload.get("content") or "",
+        mood=payload.get("mood"),
+        created_at=datetime.now(),
+    )
+    db.add(note)
+    db.commit()
+    return note.to_dict()
+
+
+def delete_note(db: Session, user_key: str, note_id: str) -> bool:
+    deleted = (
+        db.query(IntensiveNote)
+        .filter(IntensiveNote.user_key == user_key, IntensiveNote.note_id == note_id)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return bool(deleted)
+
+
+def import_legacy_files(session_factory: Callable[[], Session], data_dir: Path) -> int:
+    """Move intensive_*_{user}.json files into the tables. Returns files imported."""
+    imported = 0
+    db = session_factory()
+    try:
+        for path in sorted(data_dir.glob("intensive_progress_*.json")):
+            user_key = path.stem[len("intensive_progress_"):]
+            try:
+                payload = json.loads(path.read_text())
+                if db.get(IntensiveProgress, user_key) is None and isinstance(payload, dict):
+                    apply_progress(db, user_key, payload)
+            except (ValueError, OSError):
+                logger.exception("Could not import %s", path)
+                db.rollback()
+                continue
+            path.rename(path.with_name(path.name + ".imported"))
+            imported += 1
+        for path in sorted(data_dir.glob("intensive_notes_*.json")):
+            user_key = path.stem[len("intensive_notes_"):]
+            try:
+                notes = json.loads(path.read_text())
+                known = {row.note_id for row in db.query(IntensiveNote.note_id).filter(IntensiveNote.user_key == user_key)}
+                for item in notes if isinstance(notes, list) else []:
+                    note_id = str(item.get("id") or uuid.uuid4())
+                    if note_id in known:
+                        continue
+                    week = item.get("week")
+                    db.add(IntensiveNote(
+                        note_id=note_id,
+                        user_key=user_key,
+                        category=item.get("category") or "other",
+                        week=str(week) if week not in (None, "") else None,
+                        content=item.get("content") or "",
+                        mood=item.get("mood"),
+                        created_at=_parse_time(item.get("timestamp")),
+                    ))
+                db.commit()
+            except (ValueError, OSError, AttributeError, IntegrityError):
+                logger.exception("Could not import %s", path)
+                db.rollback()
+                continue
+            path.rename(path.with_name(path.name + ".imported"))
+            imported += 1
+    finally:
+        db.close()
+    return imported
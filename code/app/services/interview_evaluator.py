@@ -5,15 +5,19 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Union
 
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field, ValidationError
 
 from app.config import settings
+from app.services.evaluation_cache import evaluation_cache
+from app.services.llm_clients import llm_clients
+from app.services.llm_telemetry import telemetry
 
 logger = logging.getLogger(__name__)
 
+TELEMETRY_STAGE = "interview_coach"
+
 CATEGORY_FRAMEWORKS = {
     "product_design": "CIRCLES, Design Thinking",
     "strategy": "SWOT, Porter's Five Forces",
@@ -58,29 +62,100 @@ class EvaluationError(RuntimeError):
 
 
 async def evaluate_interview_answer(
-    category: str, question: str, answer: str, time_spent_sec: Optional[int] = None
+    category: str,
+    question: str,
+    answer: str,
+    time_spent_sec: Optional[int] = None,
+    question_id: Optional[str] = None,
 ) -> EvaluationResult:
-    """Evaluate an interview answer using OpenAI ChatGPT."""
+    """Evaluate an interview answer using OpenAI ChatGPT.
+
+    With a question_id, a resubmitted or near-identical answer to the same
+    question is served from evaluation_cache without a model call.
+    """
+    if question_id:
+        cached = evaluation_cache.get(question_id, answer)
+        if cached is not None:
+            return cached
     if not settings.openai_api_key:
         raise EvaluationError("OPENAI_API_KEY not configured")
 
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
-    system_prompt = _build_system_prompt(category)
-    user_prompt = _build_user_prompt(question, answer, time_spent_sec)
-
+    client = llm_clients.openai(settings.openai_api_key)
     try:
-        response = await client.chat.completions.create(
-            model=settings.openai_model,
-            max_tokens=settings.openai_max_tokens,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
+        with telemetry.track(TELEMETRY_STAGE, "openai", settings.openai_model) as call:
+            response = await client.chat.completions.create(
+                model=settings.openai_model,
+                max_tokens=settings.openai_max_tokens,
+                messages=_build_messages(category, question, answer, time_spent_sec),
+            )
+            call.input_tokens = response.usage.prompt_tokens
+            call.output_tokens = response.usage.completion_tokens
         raw_text = response.choices[0].message.content
+    except Exception as exc:
+        logger.error("Evaluation failed", exc_info=True)
+        raise EvaluationError("Evaluation failed") from exc
+
+    result = _parse_evaluation(raw_text)
+    if question_id:
+        evaluation_cache.put(question_id, answer, result)
+    return result
+
+
+async def stream_interview_answer(
+    category: str,
+    question: str,
+    answer: str,
+    time_spent_sec: Optional[int] = None,
+    question_id: Optional[str] = None,
+) -> AsyncIterator[Union[str, EvaluationResult]]:
+    """Evaluate an answer, yielding text deltas as the model writes them.
+
+    The last item yielded is the parsed EvaluationResult, so callers can show
+    progress while the JSON arrives and render the scores once it is complete.
+    A cache hit yields only the result.
+    """
+    if question_id:
+        cached = evaluation_cache.get(question_id, answer)
+        if cached is not None:
+            yield cached
+            return
+    if not settings.openai_api_key:
+        raise EvaluationError("OPENAI_API_KEY not configured")
+
+    client = llm_clients.openai(settings.openai_api_key)
+    parts: List[str] = []
+    try:
+        with telemetry.track(TELEMETRY_STAGE, "openai", settings.openai_model) as call:
+            chunks = await client.chat.completions.create(
+                model=settings.openai_model,
+                max_tokens=settings.openai_max_tokens,
+                messages=_build_messages(category, question, answer, time_spent_sec),
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in chunks:
+                if chunk.usage:
+                    call.input_tokens = chunk.usage.prompt_tokens
+                    call.output_tokens = chunk.usage.completion_tokens
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+    except Exception as exc:
+        logger.error("Evaluation failed", exc_info=True)
+        raise EvaluationError("Evaluation failed") from exc
+
+    result = _parse_evaluation("".join(parts))
+    if question_id:
+        evaluation_cache.put(question_id, answer, result)
+    yield result
+
+
+def _parse_evaluation(raw_text: str) -> EvaluationResult:
+    try:
         payload = json.loads(raw_text)
         parsed = EvaluationSchema(**payload)
-    except (ValidationError, json.JSONDecodeError, Exception) as exc:
+    except (ValidationError, json.JSONDecodeError, TypeError) as exc:
         logger.error("Evaluation failed", exc_info=True)
         raise EvaluationError("Evaluation failed") from exc
 
@@ -97,6 +172,15 @@ async def evaluate_interview_answer(
     )
 
 
+def _build_messages(
+    category: str, question: str, answer: str, time_spent_sec: Optional[int]
+) -> List[dict]:
+    return [
+        {"role": "system", "content": _build_system_prompt(category)},
+        {"role": "user", "content": _build_user_prompt(question, answer, time_spent_sec)},
+    ]
+
+
 def _build_system_prompt(category: str) -> str:
     frameworks = CATEGORY_FRAMEWORKS.get(category, "General PM frameworks")
     return (
@@ -0,0 +1,256 @@
+# app/services/job_runner.py
+"""In-process background jobs, persisted in the background_jobs table.
+
+Slow work (RSS refresh, brief generation) is submitted here instead of
+running inside the request handler:
+
+    job = await job_runner.submit(REFRESH_JOB)     # returns immediately
+    job_runner.get(job["id"])                      # poll: queued/running/succeeded/failed
+
+Handlers are `async def handler(params) -> dict | None` registered per kind.
+A pool of `workers` asyncio tasks runs them; blocking handlers should push
+their work onto a thread with asyncio.to_thread.
+
+De-duplication: while a job is queued or running, submitting the same
+dedupe key (by default the kind) returns the existing job. A unique index
+on background_jobs.active_key enforces this, across processes too.
+
+Persistence: jobs are rows, so a restart loses nothing. start() re-queues
+anything of a registered kind left queued or running (interrupted) by the
+previous process and prunes finished jobs older than `retention_days`. A
+running job that has already been claimed `max_attempts` times is marked
+failed instead, so a job that kills the process cannot rerun on every boot. Jobs
+of other kinds are left alone for the runner that handles them (the web app
+and the pipeline CLI each run their own).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.background_job import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[dict], Awaitable[Optional[dict]]]
+
+
+def _as_dict(job: BackgroundJob, deduplicated: bool = False) -> dict:
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "params": json.loads(job.params) if job.params else {},
+        "result": json.loads(job.result) if job.result else None,
+        "error": job.error,
+        "attempts": job.attempts,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "deduplicated": deduplicated,
+    }
+
+
+class JobRunner:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        workers: int = 2,
+        retention_days: int = 7,
+        max_attempts: int = 3,
+    ) -> None:
+        self._session_factory = session_factory
+        self.workers = max(workers, 1)
+        self.retention_days = retention_days
+        self.max_attempts = max(max_attempts, 1)
+        self._handlers: Dict[str, Handler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def register(self, kind: str, handler: Handler) -> None:
+        self._handlers[kind] = handler
+
+    async def start(self) -> List[str]:
+        """Re-queue unfinished jobs from the database and start the workers.
+        Returns the ids of the re-queued jobs."""
+        self._queue = asyncio.Queue()
+        recovered = await asyncio.to_thread(self._recover)
+        for job_id in recovered:
+            self._queue.put_nowait(job_id)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        return recovered
+
+    async def stop(self) -> None:
+        """Cancel the workers. A job cut off mid-run stays 'running' in the
+        database and is re-queued by the next start()."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def submit(self, kind: str, params: Optional[dict] = None, dedupe_key: Optional[str] = None) -> dict:
+        """Queue a job, or return the queued/running job with the same key."""
+        if kind not in self._handlers:
+            raise ValueError(f"unknown job kind: {kind}")
+        job, created = await asyncio.to_thread(self._insert, kind, params or {}, dedupe_key or kind)
+        if created and self._queue is not None:
+            self._queue.put_nowait(job["id"])
+        return job
+
+    def get(self, job_id: str) -> Optional[dict]:
+        db = self._session_factory()
+        try:
+            job = db.get(BackgroundJob, job_id)
+            return _as_dict(job) if job else None
+        finally:
+            db.close()
+
+    async def join(self) -> None:
+        """Wait until every queued job has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    # --- workers -------------------------------------------------------------
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception:
+                logger.exception("Background job %s crashed the runner", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        claimed = await asyncio.to_thread(self._claim, job_id)
+        if claimed is None:
+            return
+        kind, params = claimed
+        handler = self._handlers.get(kind)
+        try:
+            if handler is None:
+                raise LookupError(f"no handler registered for {kind}")
+            result = await handler(params)
+        except Exception as exc:
+            logger.exception("Background job %s (%s) failed", job_id, kind)
+            await asyncio.to_thread(self._finish, job_id, "failed", None, f"{type(exc).__name__}: {exc}"[:1000])
+        else:
+            await asyncio.to_thread(self._finish, job_id, "succeeded", result, None)
+
+    # --- database (run on a thread) --------------------------------------------
+
+    def _insert(self, kind: str, params: dict, key: str) -> Tuple[dict, bool]:
+        db = self._session_factory()
+        try:
+            for _ in range(3):
+                job = BackgroundJob(
+                    id=uuid.uuid4().hex,
+                    kind=kind,
+                    status="queued",
+                    active_key=key,
+                    params=json.dumps(params, default=str),
+                    created_at=datetime.utcnow(),
+                )
+                db.add(job)
+                try:
+                    db.commit()
+                    return _as_dict(job), True
+                except IntegrityError:
+                    db.rollback()
+                existing = db.query(BackgroundJob).filter(BackgroundJob.active_key == key).first()
+                if existing is not None:
+                    return _as_dict(existing, deduplicated=True), False
+                # The active job finished between our insert and lookup; try again.
+            raise RuntimeError(f"could not queue job {kind!r}")
+        finally:
+            db.close()
+
+    def _claim(self, job_id: str) -> Optional[Tuple[str, dict]]:
+        db = self._session_factory()
+        try:
+            # Conditional update, so a job is only ever claimed once.
+            claimed = (
+                db.query(BackgroundJob)
+                .filter(BackgroundJob.id == job_id, BackgroundJob.status == "queued")
+                .update(
+                    {
+                        "status": "running",
+                        "started_at": datetime.utcnow(),
+                        "attempts": BackgroundJob.attempts + 1,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if not claimed:
+                return None
+            job = db.get(BackgroundJob, job_id)
+            return job.kind, json.loads(job.params) if job.params else {}
+        finally:
+            db.close()
+
+    def _finish(self, job_id: str, status: str, result: Optional[dict], error: Optional[str]) -> None:
+        db = self._session_factory()
+        try:
+            job = db.get(BackgroundJob, job_id)
+            if job is None:
+                return
+            job.status = status
+            job.result = json.dumps(result, default=str) if result is not None else None
+            job.error = error
+            job.finished_at = datetime.utcnow()
+            job.active_key = None
+            db.commit()
+        finally:
+            db.close()
+
+    def _recover(self) -> List[str]:
+        db = self._session_factory()
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+            db.query(BackgroundJob).filter(
+                BackgroundJob.status.in_(("succeeded", "failed")),
+                BackgroundJob.finished_at < cutoff,
+            ).delete(synchronize_session=False)
+            kinds = list(self._handlers)
+            running = db.query(BackgroundJob).filter(
+                BackgroundJob.status == "running", BackgroundJob.kind.in_(kinds)
+            )
+            exhausted = running.filter(BackgroundJob.attempts >= self.max_attempts).update(
+                {
+                    "status": "failed",
+                    "error": f"Interrupted {self.max_attempts} time(s); not retried",
+                    "finished_at": datetime.utcnow(),
+                    "active_key": None,
+                },
+                synchronize_session=False,
+            )
+            interrupted = running.update({"status": "queued"}, synchronize_session=False)
+            db.commit()
+            if exhausted:
+                logger.warning("Failed %d background job(s) interrupted %d times", exhausted, self.max_attempts)
+            if interrupted:
+                logger.info("Re-queued %d background job(s) interrupted by a restart", interrupted)
+            rows = (
+                db.query(BackgroundJob.id)
+                .filter(BackgroundJob.status == "queued", BackgroundJob.kind.in_(kinds))
+                .order_by(BackgroundJob.created_at)
+                .all()
+            )
+            return [row.id for row in rows]
+        finally:
+            db.close()
+
+
+job_runner = JobRunner(workers=settings.job_workers, max_attempts=settings.job_max_attempts)
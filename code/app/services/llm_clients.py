@@ -0,0 +1,133 @@
+# app/services/llm_clients.py
+"""Process-wide registry of pooled LLM SDK clients.
+
+Building an AsyncOpenAI / AsyncAnthropic client per call also builds a new
+httpx connection pool, so every request paid a fresh TCP + TLS handshake.
+Clients are created once per (provider, api key) and reused, keeping
+connections alive between calls:
+
+    client = llm_clients.openai(api_key)
+    client = llm_clients.anthropic(api_key)
+    model = llm_clients.gemini(api_key, "gemini-2.5-flash")
+
+Keys are stored as a SHA-256 prefix, never in clear. The registry is an LRU
+bounded at max_clients (visitors can bring their own keys); evicted clients
+have their connection pools closed.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+MAX_CLIENTS = 32
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE = 10
+KEEPALIVE_EXPIRY = 60.0
+TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def _key_id(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+class LLMClientRegistry:
+    def __init__(self, max_clients: int = MAX_CLIENTS) -> None:
+        self.max_clients = max_clients
+        self._clients: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._google_key: Optional[str] = None
+
+    def get(self, provider: str, api_key: str, factory: Callable[[str], Any]) -> Any:
+        """Client for (provider, api_key), built with factory(api_key) on first use."""
+        key = (provider, _key_id(api_key))
+        evicted = []
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+            client = factory(api_key)
+            self._clients[key] = client
+            while len(self._clients) > self.max_clients:
+                evicted.append(self._clients.popitem(last=False)[1])
+        for old in evicted:
+            self._schedule_close(old)
+        return client
+
+    def openai(self, api_key: str) -> Any:
+        from openai import AsyncOpenAI
+
+        return self.get("openai", api_key, lambda k: AsyncOpenAI(api_key=k, http_client=_http_client()))
+
+    def anthropic(self, api_key: str) -> Any:
+        from anthropic import AsyncAnthropic
+
+        return self.get("anthropic", api_key, lambda k: AsyncAnthropic(api_key=k, http_client=_http_client()))
+
+    def gemini(self, api_key: str, model: str) -> Any:
+        """GenerativeModel for model. google.generativeai keeps its key in
+        module state, so configure() only runs when the key changes."""
+        import google.generativeai as genai
+
+        with self._lock:
+            if self._google_key != api_key:
+                genai.configure(api_key=api_key)
+                self._google_key = api_key
+        return self.get(f"google:{model}", api_key, lambda k: genai.GenerativeModel(model))
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    def _schedule_close(client: Any) -> None:
+        close = getattr(client, "close", None)
+        if close is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop to close on; the pool is dropped with the client
+        try:
+            result = close()
+            if asyncio.iscoroutine(result):
+                loop.create_task(result)
+        except Exception:
+            logger.debug("Closing evicted LLM client failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        """Close every pooled client (app shutdown)."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.debug("Closing LLM client failed", exc_info=True)
+
+
+llm_clients = LLMClientRegistry()
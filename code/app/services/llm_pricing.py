@@ -0,0 +1,48 @@
+# app/services/llm_pricing.py
+"""Token prices for every model the app and pipeline call.
+
+Prices are USD per 1M tokens, as published by each provider. Dated model
+IDs (claude-haiku-4-5-20251001) are priced by their undated alias.
+"""
+from __future__ import annotations
+
+import re
+
+PROVIDER_PRICING = {
+    "openai": {
+        "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+        "gpt-4o": {"input": 2.50, "output": 10.00},
+    },
+    "anthropic": {
+        "claude-3-5-haiku": {"input": 0.80, "output": 4.00},
+        "claude-3-5-sonnet": {"input": 3.00, "output": 15.00},
+        "claude-haiku-4-5": {"input": 1.00, "output": 5.00},
+        "claude-sonnet-4-5": {"input": 3.00, "output": 15.00},
+        "claude-sonnet-4-6": {"input": 3.00, "output": 15.00},
+    },
+    "xai": {
+        "grok-3": {"input": 3.00, "output": 15.00},
+        "grok-3-mini": {"input": 0.30, "output": 0.50},
+    },
+    "google": {
+        "gemini-2.5-flash": {"input": 0.0, "output": 0.0},  # Free tier
+    },
+}
+
+_DATE_SUFFIX = re.compile(r"-\d{8}$")
+
+
+def model_pricing(provider: str, model: str) -> dict | None:
+    models = PROVIDER_PRICING.get(provider, {})
+    return models.get(model) or models.get(_DATE_SUFFIX.sub("", model or ""))
+
+
+def calculate_cost(provider: str, model: str, input_tokens: int, output_tokens: int) -> float:
+    """Calculate cost based on provider, model, and token counts."""
+    pricing = model_pricing(provider, model)
+    if not pricing:
+        return 0.0
+
+    input_cost = (input_tokens / 1_000_000) * pricing["input"]
+    output_cost = (output_tokens / 1_000_000) * pricing["output"]
+    return round(input_cost + output_cost, 6)
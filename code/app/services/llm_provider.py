@@ -6,6 +6,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
+from app.services.llm_clients import llm_clients
+from app.services.llm_pricing import PROVIDER_PRICING, calculate_cost  # noqa: F401 — re-exported
+from app.services.llm_telemetry import telemetry
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,48 +24,6 @@ class LLMResponse:
     cost_usd: float
 
 
-# Token pricing constants (as of Feb 2025)
-PROVIDER_PRICING = {
-    "openai": {
-        "gpt-4o-mini": {
-            "input": 0.00000015,  # $0.15 per 1M input tokens
-            "output": 0.0000006,  # $0.60 per 1M output tokens
-        },
-        "gpt-4o": {
-            "input": 0.000005,  # $5 per 1M input tokens
-            "output": 0.000015,  # $15 per 1M output tokens
-        },
-    },
-    "anthropic": {
-        "claude-3-5-haiku": {
-            "input": 0.0000008,  # $0.80 per 1M input tokens
-            "output": 0.000004,  # $4 per 1M output tokens
-        },
-        "claude-3-5-sonnet": {
-            "input": 0.000003,  # $3 per 1M input tokens
-            "output": 0.000015,  # $15 per 1M output tokens
-        },
-    },
-    "google": {
-        "gemini-2.5-flash": {
-            "input": 0.0,  # Free tier
-            "output": 0.0,
-        },
-    },
-}
-
-
-def calculate_cost(provider: str, model: str, input_tokens: int, output_tokens: int) -> float:
-    """Calculate cost based on provider, model, and token counts."""
-    pricing = PROVIDER_PRICING.get(provider, {}).get(model)
-    if not pricing:
-        return 0.0
-
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-    return round(input_cost + output_cost, 6)
-
-
 class LLMProviderError(RuntimeError):
     """Raised when LLM provider call fails."""
 
@@ -92,29 +54,23 @@ class OpenAIProvider(LLMProvider):
     ) -> LLMResponse:
         """Complete using OpenAI API."""
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=self.api_key)
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=kwargs.get("temperature", 0.7),
-            )
-
-            content = response.choices[0].message.content
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            cost = calculate_cost(
-                "openai", self.model, input_tokens, output_tokens
-            )
+            client = llm_clients.openai(self.api_key)
+            with telemetry.track(kwargs.get("stage", "llm_provider"), "openai", self.model) as call:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=kwargs.get("temperature", 0.7),
+                )
+                call.input_tokens = response.usage.prompt_tokens
+                call.output_tokens = response.usage.completion_tokens
 
             return LLMResponse(
-                content=content,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
+                content=response.choices[0].message.content,
+                input_tokens=call.input_tokens,
+                output_tokens=call.output_tokens,
                 model=self.model,
-                cost_usd=cost,
+                cost_usd=calculate_cost("openai", self.model, call.input_tokens, call.output_tokens),
             )
         except Exception as exc:
             logger.error("OpenAI API call failed", exc_info=True)
@@ -142,35 +98,40 @@ class AnthropicProvider(LLMProvider):
     ) -> LLMResponse:
         """Complete using Anthropic API."""
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic(api_key=self.api_key)
-            response = await client.messages.create(
-                model=self.actual_model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=kwargs.get("temperature", 0.7),
-            )
-
-            content = response.content[0].text
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            cost = calculate_cost(
-                "anthropic", self.model, input_tokens, output_tokens
-            )
+            client = llm_clients.anthropic(self.api_key)
+            with telemetry.track(kwargs.get("stage", "llm_provider"), "anthropic", self.actual_model) as call:
+                response = await client.messages.create(
+                    model=self.actual_model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=kwargs.get("temperature", 0.7),
+                )
+                call.input_tokens = response.usage.input_tokens
+                call.output_tokens = response.usage.output_tokens
 
             return LLMResponse(
-                content=content,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
+                content=response.content[0].text,
+                input_tokens=call.input_tokens,
+                output_tokens=call.output_tokens,
                 model=self.model,
-                cost_usd=cost,
+                cost_usd=calculate_cost("anthropic", self.actual_model, call.input_tokens, call.output_tokens),
             )
         except Exception as exc:
             logger.error("Anthropic API call failed", exc_info=True)
             raise LLMProviderError(f"Anthropic API call failed: {exc}") from exc
 
 
+def _gemini_usage(response, prompt: str, content: str) -> tuple[int, int]:
+    """Token counts Gemini reports in usage_metadata; a chars/4 estimate
+    only when the response carries none."""
+    usage = getattr(response, "usage_metadata", None)
+    input_tokens = getattr(usage, "prompt_token_count", None)
+    output_tokens = getattr(usage, "candidates_token_count", None)
+    if input_tokens is None or output_tokens is None:
+        return len(prompt) // 4, len(content) // 4
+    return input_tokens, output_tokens
+
+
 class GoogleProvider(LLMProvider):
     """Google Gemini provider (free tier default)."""
 
@@ -188,44 +149,29 @@ class GoogleProvider(LLMProvider):
         try:
             import google.generativeai as genai
 
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model)
+            model = llm_clients.gemini(self.api_key, self.model)
 
             # Convert messages format from OpenAI to Gemini
             prompt = "\n".join([m["content"] for m in messages if m["role"] == "user"])
-            system_prompt = None
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_prompt = msg["content"]
-                    break
-
-            response = await model.generate_content_async(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=max_tokens,
-                    temperature=kwargs.get("temperature", 0.7),
-                ),
-                safety_settings=None,
-            )
 
-            content = response.text
-            # Estimate token count (Gemini's counting may vary)
-            # Use rough estimate: 1 token ≈ 4 characters
-            total_chars = len(prompt) + len(content)
-            estimated_tokens = total_chars // 4
-            input_tokens = len(prompt) // 4
-            output_tokens = len(content) // 4
-
-            cost = calculate_cost(
-                "google", self.model, input_tokens, output_tokens
-            )
+            with telemetry.track(kwargs.get("stage", "llm_provider"), "google", self.model) as call:
+                response = await model.generate_content_async(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        max_output_tokens=max_tokens,
+                        temperature=kwargs.get("temperature", 0.7),
+                    ),
+                    safety_settings=None,
+                )
+                content = response.text
+                call.input_tokens, call.output_tokens = _gemini_usage(response, prompt, content)
 
             return LLMResponse(
                 content=content,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
+                input_tokens=call.input_tokens,
+                output_tokens=call.output_tokens,
                 model=self.model,
-                cost_usd=cost,
+                cost_usd=calculate_cost("google", self.model, call.input_tokens, call.output_tokens),
             )
         except Exception as exc:
             logger.error("Google Gemini API call failed", exc_info=True)
@@ -0,0 +1,190 @@
+# app/services/llm_telemetry.py
+"""Cost, token and latency telemetry for every LLM call.
+
+Wrap each provider call in track() and fill in what the response reports:
+
+    with telemetry.track("pipeline.analyse", "anthropic", model) as call:
+        response = client.messages.create(...)
+        call.input_tokens = response.usage.input_tokens
+        call.output_tokens = response.usage.output_tokens
+
+Latency, failures and cost (from app.services.llm_pricing) are filled in on
+exit. Records are buffered in memory and written in one transaction by
+flush(): from the app lifespan on a timer, and at interpreter exit for the
+pipeline CLI. Tracking itself never does I/O, so it is safe on the event loop.
+
+summary() reports calls, errors, p50/p95 latency, tokens and spend per stage.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import Base, SessionLocal
+from app.models.llm_call import LLMCall
+from app.services.llm_pricing import calculate_cost
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CallStats:
+    """Filled in by the caller inside track()."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    retries: int = 0
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of values (q in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class LLMTelemetry:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_buffered: int = 2000,
+    ) -> None:
+        self._session_factory = session_factory
+        self.max_buffered = max_buffered
+        self._pending: List[dict] = []
+        self._lock = threading.Lock()
+        self._table_ready = False
+
+    @contextmanager
+    def track(self, stage: str, provider: str, model: str) -> Iterator[CallStats]:
+        stats = CallStats()
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            yield stats
+        except BaseException as exc:
+            error = f"{type(exc).__name__}: {exc}"[:500]
+            raise
+        finally:
+            self.record(
+                stage,
+                provider,
+                model,
+                input_tokens=stats.input_tokens,
+                output_tokens=stats.output_tokens,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                retries=stats.retries,
+                error=error,
+            )
+
+    def record(
+        self,
+        stage: str,
+        provider: str,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        latency_ms: float = 0.0,
+        retries: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        row = {
+            "created_at": datetime.utcnow(),
+            "stage": stage,
+            "provider": provider,
+            "model": model,
+            "input_tokens": int(input_tokens or 0),
+            "output_tokens": int(output_tokens or 0),
+            "latency_ms": round(latency_ms, 1),
+            "retries": retries,
+            "cost_usd": calculate_cost(provider, model, input_tokens or 0, output_tokens or 0),
+            "success": error is None,
+            "error": error,
+        }
+        with self._lock:
+            self._pending.append(row)
+            # Bound memory if nothing is flushing (e.g. the DB is down).
+            if len(self._pending) > self.max_buffered:
+                del self._pending[: len(self._pending) - self.max_buffered]
+
+    def flush(self) -> int:
+        """Write buffered records in one transaction. Returns rows written."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        db = self._session_factory()
+        try:
+            self._ensure_table(db)
+            db.bulk_insert_mappings(LLMCall, batch)
+            db.commit()
+            return len(batch)
+        except Exception:
+            db.rollback()
+            logger.exception("LLM telemetry flush failed; %d records re-queued", len(batch))
+            with self._lock:
+                self._pending[:0] = batch
+            return 0
+        finally:
+            db.close()
+
+    def _ensure_table(self, db: Session) -> None:
+        # The pipeline writes to its own database, which init_db() may have
+        # created before this model was imported.
+        if not self._table_ready:
+            Base.metadata.create_all(bind=db.get_bind(), tables=[LLMCall.__table__])
+            self._table_ready = True
+
+    def summary(self, db: Session, since: Optional[datetime] = None) -> List[Dict[str, object]]:
+        """Per-stage rollup of calls since `since` (default: last 24 hours)."""
+        since = since or datetime.utcnow() - timedelta(hours=24)
+        self._ensure_table(db)
+        rows = db.execute(
+            select(
+                LLMCall.stage,
+                LLMCall.latency_ms,
+                LLMCall.input_tokens,
+                LLMCall.output_tokens,
+                LLMCall.retries,
+                LLMCall.cost_usd,
+                LLMCall.success,
+            ).where(LLMCall.created_at >= since)
+        )
+        by_stage: Dict[str, list] = defaultdict(list)
+        for row in rows:
+            by_stage[row.stage].append(row)
+
+        report = []
+        for stage, calls in sorted(by_stage.items()):
+            latencies = [c.latency_ms for c in calls]
+            report.append(
+                {
+                    "stage": stage,
+                    "calls": len(calls),
+                    "errors": sum(1 for c in calls if not c.success),
+                    "retries": sum(c.retries for c in calls),
+                    "p50_ms": round(percentile(latencies, 50), 1),
+                    "p95_ms": round(percentile(latencies, 95), 1),
+                    "input_tokens": sum(c.input_tokens for c in calls),
+                    "output_tokens": sum(c.output_tokens for c in calls),
+                    "cost_usd": round(sum(c.cost_usd for c in calls), 4),
+                }
+            )
+        return report
+
+
+telemetry = LLMTelemetry()
+atexit.register(telemetry.flush)
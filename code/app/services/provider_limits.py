@@ -0,0 +1,101 @@
+# app/services/provider_limits.py
+"""Per-provider concurrency and request-rate limits for batched LLM work.
+
+One ProviderLimiter is shared by everything running on an event loop (e.g.
+several deep-dive roundtables at once) so the batch as a whole stays under
+each provider's limits:
+
+    limiter = ProviderLimiter({"openai": ProviderLimit(concurrency=4, per_minute=60)})
+    text = await limiter.call("openai", chat, provider="openai", ...)
+
+A permit is taken once a concurrency slot is free and the next start time
+allowed by per_minute has come (requests are spaced evenly rather than
+bursting). call() runs the blocking function in a worker thread and keeps
+the permit until that thread returns: cancelling the awaiting task (as the
+roundtable engine does with losing speculations) cannot stop an HTTP
+request already in flight, so releasing early would let the provider see
+more concurrent calls than its limit. slot() is the plain context-manager
+form for async code that really stops when cancelled. Providers without a
+configured limit are not throttled.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ProviderLimit:
+    concurrency: int = 4
+    per_minute: Optional[int] = None  # None = no rate cap, only concurrency
+
+
+class _Gate:
+    def __init__(self, limit: ProviderLimit) -> None:
+        self.semaphore = asyncio.Semaphore(max(limit.concurrency, 1))
+        self.interval = 60.0 / limit.per_minute if limit.per_minute else 0.0
+        self.next_start = 0.0
+        self.waited = 0.0
+        self.calls = 0
+
+
+class ProviderLimiter:
+    def __init__(self, limits: Dict[str, ProviderLimit]) -> None:
+        self.limits = dict(limits)
+        self._gates: Dict[str, _Gate] = {}
+
+    async def _acquire(self, provider: str) -> Optional[_Gate]:
+        limit = self.limits.get(provider)
+        if limit is None:
+            return None
+        gate = self._gates.get(provider)
+        if gate is None:
+            gate = self._gates[provider] = _Gate(limit)
+        requested = time.monotonic()
+        await gate.semaphore.acquire()
+        try:
+            now = time.monotonic()
+            start = max(now, gate.next_start)
+            gate.next_start = start + gate.interval
+            if start > now:
+                await asyncio.sleep(start - now)
+        except BaseException:
+            gate.semaphore.release()
+            raise
+        gate.waited += time.monotonic() - requested
+        gate.calls += 1
+        return gate
+
+    @asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[None]:
+        gate = await self._acquire(provider)
+        try:
+            yield
+        finally:
+            if gate is not None:
+                gate.semaphore.release()
+
+    async def call(self, provider: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run blocking fn(*args, **kwargs) in a thread under provider's limits."""
+        gate = await self._acquire(provider)
+        future = asyncio.ensure_future(asyncio.to_thread(fn, *args, **kwargs))
+
+        def finished(done: asyncio.Future) -> None:
+            if gate is not None:
+                gate.semaphore.release()
+            if not done.cancelled():
+                done.exception()  # retrieved, so an abandoned failure isn't logged as unhandled
+
+        future.add_done_callback(finished)
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, dict]:
+        return {
+            provider: {"calls": gate.calls, "waited_seconds": round(gate.waited, 2)}
+            for provider, gate in self._gates.items()
+        }
@@ -0,0 +1,161 @@
+# app/services/roundtable_engine.py
+"""Async turn engine for multi-speaker roundtables (pipeline deep dives).
+
+Each turn depends on the transcript so far, so turns run one after another
+exactly as in a serial loop; the engine does not make them faster. What it
+adds around them:
+
+  - fallbacks — for every turn the scheduler names the speaker it picked
+    plus its runner-ups (TurnSlot.candidates). The picked speaker's turn is
+    kept whenever it succeeds; if its provider errors, the next runner-up
+    stands in instead of the serial loop's "[turn skipped]" placeholder.
+    Runner-ups start only after the candidates before them failed, unless
+    TurnSlot.speculate > 1 starts that many up front (each one is a full,
+    paid call that usually gets thrown away, so only worth it when a
+    provider is known to be flaky);
+  - on_turn — a coroutine run in the background for every kept turn
+    (progress output, TTS for that turn) while the next one is generated;
+    that background work is the only thing that overlaps;
+  - the live transcript — each kept turn is appended to a JSONL file as
+    soon as it lands, so a long run can be followed or salvaged.
+
+    report = await run_turns(total_turns, schedule, generate, speakers,
+                             transcript_path=path, on_turn=prefetch)
+    report.transcript, report.fallbacks_used
+
+`generate(speaker, slot, transcript)` returns the turn text and may be a
+plain function (run in a worker thread, like the blocking LLM clients) or
+a coroutine function (tests use a fake provider).
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TurnSlot:
+    index: int
+    candidates: Tuple[str, ...]  # the scheduler's pick first, then fallbacks
+    length_mode: str = "normal"
+    is_first: bool = False
+    is_final: bool = False
+    speculate: int = 1  # candidates started at once; the rest only after failures
+
+    @property
+    def speaker(self) -> str:
+        return self.candidates[0]
+
+
+@dataclass
+class EngineReport:
+    transcript: List[dict] = field(default_factory=list)
+    wall_seconds: float = 0.0  # the turn loop, not the background work drained after it
+    speculative_calls: int = 0
+    fallbacks_used: int = 0
+    background_seconds: float = 0.0  # on_turn work, overlapped with later turns
+
+    def as_dict(self) -> dict:
+        return {
+            "wall_seconds": round(self.wall_seconds, 2),
+            "speculative_calls": self.speculative_calls,
+            "fallbacks_used": self.fallbacks_used,
+            "background_seconds": round(self.background_seconds, 2),
+        }
+
+
+Schedule = Callable[[int, List[dict]], TurnSlot]
+Generate = Callable[[str, TurnSlot, List[dict]], object]
+
+
+async def _attempt(
+    generate: Generate, speaker: str, slot: TurnSlot, history: List[dict]
+) -> Tuple[Optional[str], Optional[str]]:
+    """(text, error) — never raises, so a failed candidate falls through to the next."""
+    try:
+        if inspect.iscoroutinefunction(generate):
+            return await generate(speaker, slot, history), None
+        return await asyncio.to_thread(generate, speaker, slot, history), None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+
+async def run_turns(
+    total_turns: int,
+    schedule: Schedule,
+    generate: Generate,
+    speakers: Dict[str, dict],
+    transcript_path: Optional[Path] = None,
+    on_turn: Optional[Callable[[dict], Awaitable[None]]] = None,
+    failure_text: Callable[[str, str], str] = lambda speaker, error: f"[turn skipped — {error}]",
+) -> EngineReport:
+    """Generate total_turns turns. `speakers` maps a speaker key to the
+    fields copied into each transcript entry (name, provider, model...)."""
+    report = EngineReport()
+    started = time.perf_counter()
+    background: List[asyncio.Task] = []
+    live = open(transcript_path, "a", encoding="utf-8") if transcript_path else None
+
+    async def timed_hook(entry: dict) -> None:
+        hook_started = time.perf_counter()
+        try:
+            await on_turn(entry)
+        except Exception:
+            logger.exception("on_turn failed for turn %s", entry.get("turn"))
+        finally:
+            report.background_seconds += time.perf_counter() - hook_started
+
+    try:
+        for index in range(total_turns):
+            slot = schedule(index, report.transcript)
+            history = list(report.transcript)
+            tasks = {
+                speaker: asyncio.ensure_future(_attempt(generate, speaker, slot, history))
+                for speaker in slot.candidates[:max(slot.speculate, 1)]
+            }
+            report.speculative_calls += len(tasks) - 1
+
+            speaker, text, first_error = slot.speaker, None, None
+            for rank, candidate in enumerate(slot.candidates):
+                if candidate not in tasks:
+                    # Everything before it failed: start this fallback now.
+                    tasks[candidate] = asyncio.ensure_future(_attempt(generate, candidate, slot, history))
+                text, error = await tasks[candidate]
+                if text is not None:
+                    speaker = candidate
+                    report.fallbacks_used += rank > 0
+                    break
+                first_error = first_error or error
+                logger.warning("turn %d: %s failed: %s", index + 1, candidate, error)
+            for task in tasks.values():
+                task.cancel()  # losing speculations; their threads finish unobserved
+
+            entry = {
+                "persona": speaker,
+                **speakers.get(speaker, {}),
+                "length_mode": slot.length_mode,
+                "text": text if text is not None else failure_text(slot.speaker, first_error or "no response"),
+            }
+            report.transcript.append(entry)
+            if live:
+                live.write(json.dumps({"turn": index + 1, **entry}) + "\n")
+                live.flush()
+            if on_turn:
+                background.append(asyncio.ensure_future(timed_hook({"turn": index + 1, **entry})))
+
+        report.wall_seconds = time.perf_counter() - started
+        if background:
+            await asyncio.gather(*background)
+    finally:
+        if live:
+            live.close()
+
+    return report
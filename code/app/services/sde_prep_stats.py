@@ -0,0 +1,190 @@
+# app/services/sde_prep_stats.py
+"""SDE prep dashboard stats: a handful of grouped queries, cached per user.
+
+compute_stats() needs five queries whatever the data size:
+
+  problems — GROUP BY status, difficulty, is_blind_75 gives solved, total,
+             Blind 75 and per-difficulty counts at once
+  topics   — GROUP BY status
+  stories  — GROUP BY is_ready
+  weeks    — one ordered scan for the current week and the progress chart
+  logs     — only the last STREAK_WINDOW_DAYS of DailyLog; a streak that
+             fills the window is extended one more window at a time
+
+The composite indexes on (user_id, status) and (user_id, difficulty) are
+created by app.database.ensure_sde_prep_indexes().
+
+stats_cache holds each user's result until a write endpoint calls
+invalidate(user_id), or ttl_seconds pass (covers writes from outside the
+router, and the date rolling over for the streak).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.sde_prep import (
+    BehavioralStory,
+    DailyLog,
+    DifficultyEnum,
+    LeetCodeProblem,
+    ProblemStatusEnum,
+    SystemDesignStatusEnum,
+    SystemDesignTopic,
+    WeekPlan,
+)
+
+CHART_DAYS = 14
+STREAK_WINDOW_DAYS = 60
+
+
+def _percentage(part: int, whole: int) -> float:
+    return round((part / whole * 100) if whole else 0, 1)
+
+
+def _streak(db: Session, user_id: int, today: date, hours: Dict[date, int]) -> int:
+    """Consecutive logged days ending today; `hours` already covers the first window."""
+    streak = 0
+    window_start = today - timedelta(days=STREAK_WINDOW_DAYS - 1)
+    logged = set(hours)
+    while True:
+        while today - timedelta(days=streak) in logged:
+            streak += 1
+        if today - timedelta(days=streak) >= window_start:
+            return streak
+        # The streak reaches the start of the window; look one window further back.
+        window_end = window_start
+        window_start = window_end - timedelta(days=STREAK_WINDOW_DAYS)
+        logged = {
+            row.date
+            for row in db.query(DailyLog.date)
+            .filter(DailyLog.user_id == user_id, DailyLog.date >= window_start, DailyLog.date < window_end)
+        }
+
+
+def compute_stats(db: Session, user_id: int, today: Optional[date] = None) -> Dict[str, Any]:
+    today = today or date.today()
+
+    total = solved = blind_75 = 0
+    by_difficulty = {level.value: 0 for level in DifficultyEnum}
+    for status, difficulty, is_blind_75, count in (
+        db.query(LeetCodeProblem.status, LeetCodeProblem.difficulty, LeetCodeProblem.is_blind_75, func.count())
+        .filter(LeetCodeProblem.user_id == user_id)
+        .group_by(LeetCodeProblem.status, LeetCodeProblem.difficulty, LeetCodeProblem.is_blind_75)
+    ):
+        total += count
+        by_difficulty[difficulty.value] += count
+        if status == ProblemStatusEnum.COMPLETED:
+            solved += count
+        if is_blind_75:
+            blind_75 += count
+
+    topics = dict(
+        db.query(SystemDesignTopic.status, func.count())
+        .filter(SystemDesignTopic.user_id == user_id)
+        .group_by(SystemDesignTopic.status)
+        .all()
+    )
+    topic_total = sum(topics.values())
+    topic_confident = topics.get(SystemDesignStatusEnum.CONFIDENT, 0)
+
+    stories = dict(
+        db.query(BehavioralStory.is_ready, func.count())
+        .filter(BehavioralStory.user_id == user_id)
+        .group_by(BehavioralStory.is_ready)
+        .all()
+    )
+    stories_total = sum(stories.values())
+    stories_ready = stories.get(True, 0)
+
+    weeks = (
+        db.query(WeekPlan.week_number, WeekPlan.title, WeekPlan.completion_percentage, WeekPlan.is_completed)
+        .filter(WeekPlan.user_id == user_id)
+        .order_by(WeekPlan.week_number)
+        .all()
+    )
+    week = next((w for w in weeks if not w.is_completed), weeks[-1] if weeks else None)
+
+    window_start = today - timedelta(days=STREAK_WINDOW_DAYS - 1)
+    hours = {
+        row.date: row.study_hours
+        for row in db.query(DailyLog.date, DailyLog.study_hours)
+        .filter(DailyLog.user_id == user_id, DailyLog.date >= window_start)
+    }
+    days = [today - timedelta(days=i) for i in range(CHART_DAYS)][::-1]
+
+    return {
+        "leetcode": {
+            "solved": solved,
+            "total": total,
+            "percentage": _percentage(solved, total),
+            "blind_75_count": blind_75,
+            "by_difficulty": by_difficulty,
+        },
+        "system_design": {
+            "confident": topic_confident,
+            "total": topic_total,
+            "percentage": _percentage(topic_confident, topic_total),
+        },
+        "behavioral": {
+            "ready": stories_ready,
+            "total": stories_total,
+            "percentage": _percentage(stories_ready, stories_total),
+        },
+        "current_week": {
+            "title": week.title if week else "",
+            "percentage": week.completion_percentage if week else 0,
+        },
+        "streak_days": _streak(db, user_id, today, hours),
+        "charts_data": {
+            "difficulty": by_difficulty,
+            "weekly_progress": [{"week": w.week_number, "percentage": w.completion_percentage} for w in weeks],
+            "study_hours": {
+                "labels": [day.strftime("%b %d") for day in days],
+                "values": [hours.get(day, 0) for day in days],
+            },
+        },
+    }
+
+
+class StatsCache:
+    def __init__(self, ttl_seconds: float = 300) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[int, Tuple[date, float, Dict[str, Any]]] = {}
+        # Bumped by invalidate(), so a compute that raced a write is not stored.
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, db: Session, user_id: int) -> Dict[str, Any]:
+        today = date.today()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry and entry[0] == today and entry[1] > time.monotonic():
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            generation = self._generations.get(user_id, 0)
+        stats = compute_stats(db, user_id, today)
+        with self._lock:
+            if self._generations.get(user_id, 0) == generation:
+                self._entries[user_id] = (today, time.monotonic() + self.ttl_seconds, stats)
+        return stats
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+stats_cache = StatsCache(ttl_seconds=settings.sde_stats_cache_ttl_seconds)
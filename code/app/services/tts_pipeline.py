@@ -0,0 +1,185 @@
+# app/services/tts_pipeline.py
+"""Concurrent text-to-speech for multi-segment audio (deep dives, daily brief).
+
+Callers split their script into Segments (one per transcript turn, or per
+few sentences) and hand the whole list to synthesize(), which runs in a
+single event loop:
+
+  - at most `concurrency` segments are synthesized at once;
+  - each segment is retried `retries` times with backoff before it is
+    reported as failed (other segments still complete);
+  - results land in a content-addressed cache, keyed by
+    sha256(backend, voice, text), so an unchanged segment is never
+    synthesized twice — re-rendering an episode after editing one turn
+    only pays for that turn. Identical segments in one batch share a call.
+
+Render time is therefore roughly the slowest segment rather than the sum.
+
+    results = await synthesize(segments, cache_dir)
+    paths = [r.path for r in results if r.path]
+
+The backend is pluggable (TTSBackend); EdgeTTSBackend is the default and
+tests use a fake.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Protocol
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTSBackend(Protocol):
+    name: str
+
+    async def synthesize(self, text: str, voice: str, out_path: Path) -> None:
+        ...
+
+
+class EdgeTTSBackend:
+    name = "edge-tts"
+
+    async def synthesize(self, text: str, voice: str, out_path: Path) -> None:
+        import edge_tts
+
+        await edge_tts.Communicate(text, voice).save(str(out_path))
+
+
+@dataclass(frozen=True)
+class Segment:
+    text: str
+    voice: str
+    label: str = ""
+
+
+@dataclass
+class SegmentResult:
+    segment: Segment
+    path: Optional[Path] = None
+    cached: bool = False
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+def segment_key(backend_name: str, voice: str, text: str) -> str:
+    return hashlib.sha256(f"{backend_name}\0{voice}\0{text}".encode("utf-8")).hexdigest()[:32]
+
+
+async def synthesize(
+    segments: List[Segment],
+    cache_dir: Path,
+    backend: Optional[TTSBackend] = None,
+    concurrency: Optional[int] = None,
+    retries: Optional[int] = None,
+    backoff_seconds: float = 1.0,
+) -> List[SegmentResult]:
+    """Synthesize every segment (or reuse its cached audio). Results are in
+    input order; a failed segment has path=None and an error."""
+    backend = backend or EdgeTTSBackend()
+    concurrency = concurrency or settings.tts_concurrency
+    retries = settings.tts_retries if retries is None else retries
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    in_flight: Dict[str, asyncio.Task] = {}
+
+    async def render(key: str, segment: Segment) -> SegmentResult:
+        result = SegmentResult(segment)
+        target = cache_dir / f"{key}.mp3"
+        if target.exists() and target.stat().st_size > 0:
+            os.utime(target)  # keeps recently used segments out of prune_cache()
+            result.path, result.cached = target, True
+            return result
+        async with semaphore:
+            for attempt in range(retries + 1):
+                result.attempts = attempt + 1
+                partial = target.with_suffix(f".{os.getpid()}.part")
+                try:
+                    await backend.synthesize(segment.text, segment.voice, partial)
+                    if not partial.exists() or partial.stat().st_size == 0:
+                        raise RuntimeError("TTS produced no audio")
+                    os.replace(partial, target)  # atomic: the cache never holds half a file
+                    result.path, result.error = target, None
+                    return result
+                except Exception as exc:
+                    partial.unlink(missing_ok=True)
+                    result.error = f"{type(exc).__name__}: {exc}"
+                    if attempt < retries:
+                        await asyncio.sleep(backoff_seconds * 2 ** attempt)
+        logger.warning("TTS failed for %s after %d attempts: %s", segment.label or key, result.attempts, result.error)
+        return result
+
+    tasks = []
+    for segment in segments:
+        key = segment_key(backend.name, segment.voice, segment.text)
+        if key not in in_flight:
+            in_flight[key] = asyncio.ensure_future(render(key, segment))
+        tasks.append(in_flight[key])
+    shared = await asyncio.gather(*tasks)
+    # Duplicates share one synthesis but keep their own segment/label.
+    return [
+        SegmentResult(segment, r.path, r.cached, r.attempts, r.error)
+        for segment, r in zip(segments, shared)
+    ]
+
+
+def split_script(script: str, max_chars: int = 600) -> List[str]:
+    """Split a narration script into chunks of whole sentences, each at most
+    max_chars (a single longer sentence becomes its own chunk)."""
+    sentences = [s for s in re.split(r"(?<=[.!?])\s+", script.strip()) if s]
+    chunks: List[str] = []
+    current = ""
+    for sentence in sentences:
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def concat_mp3(paths: Iterable[Path], out_path: Path) -> None:
+    """Byte-concatenate MP3 segments of the same voice and encoding.
+
+    MP3 is a sequence of self-contained frames, so same-format segments
+    join without re-encoding (and without ffmpeg on the web host)."""
+    partial = out_path.with_suffix(".part")
+    with open(partial, "wb") as out:
+        for path in paths:
+            with open(path, "rb") as segment:
+                shutil.copyfileobj(segment, out)
+    os.replace(partial, out_path)
+
+
+def prune_cache(cache_dir: Path, max_age_days: float = 30) -> int:
+    """Delete cached segments not used for max_age_days. Returns files removed."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in cache_dir.glob("*.mp3"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Expose a cached segment at `dst` without duplicating the bytes when possible."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
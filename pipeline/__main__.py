@@ -31,12 +31,20 @@ def main():
     dd = sub.add_parser("deep-dive", help="Generate AI-vs-AI-vs-AI roundtable transcript")
     dd.add_argument("--topic", type=str, default=None)
     dd.add_argument("--article-id", type=int, default=None)
+    dd.add_argument("--top-n", type=int, default=None,
+                    help="Batch: the N top-scored recent articles without a deep dive (resumable)")
+    dd.add_argument("--concurrency", type=int, default=None, help="Batch: roundtables run at once")
     dd.add_argument("--depth", choices=["light", "standard", "deep"], default=None)
     dd.add_argument("--rounds", type=int, default=None, help="Fixed override: rounds × 3 turns")
     dd.add_argument("--pm-action", choices=["force", "optional", "off"], default=None)
     dd.add_argument("--seed", type=int, default=None, help="For reproducibility")
+    dd.add_argument("--speculate", type=int, default=None,
+                    help="Speakers started at once per turn (default 1: fallbacks only after a failure)")
     dd.add_argument("--with-audio", action="store_true", help="Also synthesize per-speaker audio")
 
+    ls = sub.add_parser("llm-stats", help="LLM calls, latency and spend per stage")
+    ls.add_argument("--hours", type=float, default=24.0, help="Look-back window")
+
     args = parser.parse_args()
 
     if args.stage == "fetch":
@@ -58,6 +66,15 @@ def main():
         from pipeline.stages import fetch, extract, analyse
         results = [fetch.run(), extract.run(), analyse.run()]
         result = {"stage": "daily", "steps": results}
+    elif args.stage == "deep-dive" and args.top_n:
+        from pipeline.stages import deep_dive_batch
+        result = deep_dive_batch.run(
+            top_n=args.top_n,
+            depth=args.depth,
+            pm_action=args.pm_action,
+            with_audio=args.with_audio,
+            concurrency=args.concurrency,
+        )
     elif args.stage == "deep-dive":
         from pipeline.stages import deep_dive
         result = deep_dive.run(
@@ -67,11 +84,24 @@ def main():
             rounds=args.rounds,
             pm_action=args.pm_action,
             seed=args.seed,
+            speculate=args.speculate,
+            prefetch_audio=args.with_audio,
         )
         if args.with_audio and result.get("id"):
             from pipeline.stages import deep_dive_audio
             audio_result = deep_dive_audio.run(deep_dive_id=result["id"])
             result["audio"] = audio_result
+    elif args.stage == "llm-stats":
+        from datetime import datetime, timedelta
+        from pipeline import config  # noqa: F401
+        from app.database import SessionLocal
+        from app.services.llm_telemetry import telemetry
+        db = SessionLocal()
+        try:
+            since = datetime.utcnow() - timedelta(hours=args.hours)
+            result = {"since": since, "stages": telemetry.summary(db, since=since)}
+        finally:
+            db.close()
     else:
         parser.print_help()
         sys.exit(1)
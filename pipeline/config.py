@@ -71,6 +71,32 @@ DEEP_DIVE_DEFAULT_DEPTH = os.environ.get("PIPELINE_DEEP_DIVE_DEPTH", "standard")
 #   off      — no PM-action prompt; close with a sharp observation or question
 DEEP_DIVE_PM_ACTION_MODE = os.environ.get("PIPELINE_DEEP_DIVE_PM_ACTION", "optional")
 
+# Speakers started at once per turn. Runner-ups always stand in if the
+# scheduled speaker's provider errors; with 1 they start only after that
+# failure. Higher values start them up front — each is a full paid call that
+# is usually discarded, so only for flaky providers.
+DEEP_DIVE_SPECULATE = int(os.environ.get("PIPELINE_DEEP_DIVE_SPECULATE", "1"))
+
+# Batch deep dives (`deep-dive --top-n N`): how far back to look for analysed
+# articles, how many roundtables run at once, and per-provider limits shared
+# by all of them (concurrent calls, requests per minute).
+DEEP_DIVE_BATCH_DAYS = int(os.environ.get("PIPELINE_DEEP_DIVE_BATCH_DAYS", "7"))
+DEEP_DIVE_BATCH_CONCURRENCY = int(os.environ.get("PIPELINE_DEEP_DIVE_BATCH_CONCURRENCY", "3"))
+DEEP_DIVE_PROVIDER_LIMITS = {
+    "openai": {
+        "concurrency": int(os.environ.get("PIPELINE_OPENAI_CONCURRENCY", "4")),
+        "per_minute": int(os.environ.get("PIPELINE_OPENAI_RPM", "60")),
+    },
+    "xai": {
+        "concurrency": int(os.environ.get("PIPELINE_XAI_CONCURRENCY", "2")),
+        "per_minute": int(os.environ.get("PIPELINE_XAI_RPM", "30")),
+    },
+    "anthropic": {
+        "concurrency": int(os.environ.get("PIPELINE_ANTHROPIC_CONCURRENCY", "4")),
+        "per_minute": int(os.environ.get("PIPELINE_ANTHROPIC_RPM", "50")),
+    },
+}
+
 # How many articles get the editorial rewrite per run
 REWRITE_TOP_N = int(os.environ.get("PIPELINE_REWRITE_TOP_N", "12"))
 
@@ -4,28 +4,33 @@ Three providers behind one chat() function:
   anthropic → claude SDK
   openai    → openai SDK
   xai       → openai SDK with base_url=https://api.x.ai/v1
+
+Every call is recorded in the llm_calls table (tokens, latency, retries,
+cost) under its `stage`; see `python -m pipeline llm-stats`. Transient
+errors (rate limits, timeouts, 5xx) are retried here rather than inside the
+SDKs, so the retry count is known.
 """
 from __future__ import annotations
 
 import os
+import random
+import time
 from typing import List, Dict
 
+from pipeline import config  # noqa: F401 — puts code/ on sys.path and sets DATABASE_URL first
+from app.services.llm_telemetry import telemetry
 
-def chat(provider: str, model: str, system: str, messages: List[Dict[str, str]], max_tokens: int = 600) -> str:
-    """Single-shot chat completion. Returns the assistant's text reply."""
+MAX_ATTEMPTS = 3
+_RETRYABLE = {"RateLimitError", "APIConnectionError", "APITimeoutError", "InternalServerError"}
+
+
+def _client(provider: str):
     if provider == "anthropic":
         from anthropic import Anthropic
         key = os.environ.get("ANTHROPIC_API_KEY")
         if not key:
             raise RuntimeError("ANTHROPIC_API_KEY not set")
-        client = Anthropic(api_key=key)
-        resp = client.messages.create(
-            model=model,
-            max_tokens=max_tokens,
-            system=system,
-            messages=messages,
-        )
-        return resp.content[0].text.strip()
+        return Anthropic(api_key=key, max_retries=0)
 
     if provider in ("openai", "xai"):
         from openai import OpenAI
@@ -33,18 +38,50 @@ def chat(provider: str, model: str, system: str, messages: List[Dict[str, str]],
             key = os.environ.get("OPENAI_API_KEY")
             if not key:
                 raise RuntimeError("OPENAI_API_KEY not set")
-            client = OpenAI(api_key=key)
-        else:
-            key = os.environ.get("XAI_API_KEY")
-            if not key:
-                raise RuntimeError("XAI_API_KEY not set")
-            client = OpenAI(api_key=key, base_url="https://api.x.ai/v1")
-
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=max_tokens,
-            messages=[{"role": "system", "content": system}, *messages],
-        )
-        return resp.choices[0].message.content.strip()
+            return OpenAI(api_key=key, max_retries=0)
+        key = os.environ.get("XAI_API_KEY")
+        if not key:
+            raise RuntimeError("XAI_API_KEY not set")
+        return OpenAI(api_key=key, base_url="https://api.x.ai/v1", max_retries=0)
 
     raise ValueError(f"unknown provider: {provider}")
+
+
+def chat(
+    provider: str,
+    model: str,
+    system: str,
+    messages: List[Dict[str, str]],
+    max_tokens: int = 600,
+    stage: str = "pipeline",
+) -> str:
+    """Single-shot chat completion. Returns the assistant's text reply."""
+    client = _client(provider)
+    with telemetry.track(stage, provider, model) as call:
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                if provider == "anthropic":
+                    resp = client.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        system=system,
+                        messages=messages,
+                    )
+                    call.input_tokens = resp.usage.input_tokens
+                    call.output_tokens = resp.usage.output_tokens
+                    return resp.content[0].text.strip()
+
+                resp = client.chat.completions.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    messages=[{"role": "system", "content": system}, *messages],
+                )
+                if resp.usage:
+                    call.input_tokens = resp.usage.prompt_tokens
+                    call.output_tokens = resp.usage.completion_tokens
+                return resp.choices[0].message.content.strip()
+            except Exception as exc:
+                if type(exc).__name__ not in _RETRYABLE or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                call.retries += 1
+                time.sleep(2 ** attempt + random.random())
@@ -16,6 +16,7 @@ from datetime import datetime
 from typing import Optional
 
 from pipeline import config
+from pipeline.llm import chat
 
 from app.database import SessionLocal, ensure_feed_layer2_columns, ensure_pipeline_tables, init_db
 from app.models.feed_article import FeedArticle
@@ -64,15 +65,14 @@ def _build_user_prompt(article: FeedArticle, full_text: str) -> str:
 
 def _call_claude(prompt: str) -> Optional[str]:
     try:
-        from anthropic import Anthropic
-        client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        response = client.messages.create(
-            model=config.ANALYSE_MODEL,
+        return chat(
+            "anthropic",
+            config.ANALYSE_MODEL,
+            SYSTEM_PROMPT,
+            [{"role": "user", "content": prompt}],
             max_tokens=2000,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            stage="pipeline.analyse",
         )
-        return response.content[0].text.strip()
     except Exception as exc:
         print(f"  ! Claude call failed: {exc}")
         return None
@@ -142,6 +142,7 @@ def run(limit: Optional[int] = None, re_analyse: bool = False) -> dict:
             db.query(FeedArticle)
             .filter(FeedArticle.id.in_(target_ids))
             .filter(FeedArticle.is_dismissed == False)
+            .filter(FeedArticle.duplicate_of.is_(None))  # one analysis per near-duplicate cluster
             .order_by(FeedArticle.fetched_at.desc())
             .all()
         )
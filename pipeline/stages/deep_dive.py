@@ -8,11 +8,20 @@ Personas:
   Believer (GPT)     — sees AI as transformative, bullish, evidence-based
   Skeptic  (Grok)    — calls out hype, demands evidence, counter-takes
   Realist  (Claude)  — synthesizes, names what a PM should actually do
+
+Turns run on app.services.roundtable_engine, still one at a time: if the
+picked speaker's provider errors, the scheduler's runner-up speakers stand in
+(started up front only with DEEP_DIVE_SPECULATE > 1); kept turns stream to a
+.live.jsonl file next to the final JSON, removed once that is written; with
+prefetch_audio each turn's TTS is rendered into deep_dive_audio's segment
+cache while the next turn is generated.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import random
+from functools import partial
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
@@ -22,6 +31,8 @@ from pipeline.llm import chat
 from app.database import SessionLocal, ensure_pipeline_tables, init_db
 from app.models.feed_article import FeedArticle
 from app.models.pipeline_models import ArticleAnalysis, DeepDive
+from app.services.provider_limits import ProviderLimiter
+from app.services.roundtable_engine import TurnSlot, run_turns
 
 
 PERSONAS: Dict[str, dict] = {
@@ -162,6 +173,40 @@ def _pick_next_speaker(transcript: List[dict], excluded: List[str] = None) -> st
     return random.choices(candidates, weights=weights)[0]
 
 
+def _fallback_order(transcript: List[dict], picked: str) -> List[str]:
+    """The other speakers _pick_next_speaker could have drawn, most likely first."""
+    prev = transcript[-1]["persona"] if transcript else None
+    recent = [t["persona"] for t in transcript[-4:]]
+    others = [p for p in TURN_ORDER if p not in (prev, picked)]
+    return sorted(others, key=recent.count)
+
+
+def _schedule_turn(turn_num: int, total_turns: int, transcript: List[dict], speculate: int) -> TurnSlot:
+    """Same speaker and length draws, in the same order, as the serial loop,
+    so a seed still reproduces the same episode shape."""
+    is_first = turn_num == 0
+    is_final = turn_num == total_turns - 1
+    if is_first:
+        # Random opener — not always Believer
+        persona_key = random.choice(TURN_ORDER)
+        fallbacks = [p for p in TURN_ORDER if p != persona_key]
+    elif is_final:
+        # Realist always closes (synthesis is their role)
+        persona_key, fallbacks = "realist", []
+    else:
+        persona_key = _pick_next_speaker(transcript)
+        fallbacks = _fallback_order(transcript, persona_key)
+    length_mode = "normal" if (is_first or is_final) else _pick_length_mode()
+    candidates = tuple([persona_key] + fallbacks)
+    return TurnSlot(turn_num, candidates, length_mode, is_first, is_final, speculate=max(speculate, 1))
+
+
+def _max_tokens(slot: TurnSlot) -> int:
+    if slot.is_final:
+        return 650  # give the closing room to land
+    return {"short": 220, "normal": 500, "long": 800}[slot.length_mode]
+
+
 def _pick_length_mode() -> str:
     r = random.random()
     if r < 0.20:
@@ -219,6 +264,31 @@ def _slugify(text: str) -> str:
     return s[:70] or "deep-dive"
 
 
+def _save_deep_dive(
+    article_id: Optional[int], topic: str, personas: Dict[str, dict], transcript: List[dict]
+) -> Tuple[int, List[dict]]:
+    db = SessionLocal()
+    try:
+        participants = [
+            {"persona": k, "name": v["name"], "provider": v["provider"], "model": v["model"]}
+            for k, v in personas.items()
+        ]
+        dd = DeepDive(
+            source_article_id=article_id,
+            topic=topic,
+            format="unpack",
+            participants_json=json.dumps(participants),
+            transcript_json=json.dumps(transcript),
+            status="draft",
+            generated_at=datetime.utcnow(),
+        )
+        db.add(dd)
+        db.commit()
+        return dd.id, participants
+    finally:
+        db.close()
+
+
 def run(
     topic: Optional[str] = None,
     article_id: Optional[int] = None,
@@ -226,9 +296,36 @@ def run(
     rounds: Optional[int] = None,
     pm_action: Optional[str] = None,
     seed: Optional[int] = None,
+    speculate: Optional[int] = None,
+    prefetch_audio: bool = False,
 ) -> dict:
+    return asyncio.run(run_async(
+        topic=topic,
+        article_id=article_id,
+        depth=depth,
+        rounds=rounds,
+        pm_action=pm_action,
+        seed=seed,
+        speculate=speculate,
+        prefetch_audio=prefetch_audio,
+    ))
+
+
+async def run_async(
+    topic: Optional[str] = None,
+    article_id: Optional[int] = None,
+    depth: Optional[str] = None,
+    rounds: Optional[int] = None,
+    pm_action: Optional[str] = None,
+    seed: Optional[int] = None,
+    speculate: Optional[int] = None,
+    prefetch_audio: bool = False,
+    limiter: Optional[ProviderLimiter] = None,
+) -> dict:
+    """One roundtable. `limiter` throttles LLM calls per provider when several
+    run on the same loop (see deep_dive_batch)."""
     if not topic and not article_id:
-        return {"stage": "deep_dive", "error": "must provide --topic or --article-id"}
+        return {"stage": "deep_dive", "error": "must provide --topic, --article-id or --top-n"}
 
     if seed is not None:
         random.seed(seed)
@@ -240,7 +337,7 @@ def run(
 
     source_context = None
     if article_id:
-        topic, source_context = _context_from_article(article_id)
+        topic, source_context = await asyncio.to_thread(_context_from_article, article_id)
         if not topic:
             return {"stage": "deep_dive", "error": f"no article {article_id}"}
     else:
@@ -269,81 +366,72 @@ def run(
         print(f"    {p['name']:<14} → {p['provider']}/{p['model']}")
     print(f"══════════════════════════════════════════════════")
 
-    transcript: List[dict] = []
-
-    for turn_num in range(total_turns):
-        is_first = turn_num == 0
-        is_final = turn_num == total_turns - 1
-
-        if is_first:
-            # Random opener — not always Believer
-            persona_key = random.choice(TURN_ORDER)
-        elif is_final:
-            # Realist always closes (synthesis is their role)
-            persona_key = "realist"
-        else:
-            persona_key = _pick_next_speaker(transcript)
-
-        length_mode = "normal" if (is_first or is_final) else _pick_length_mode()
-        max_tokens = {"short": 220, "normal": 500, "long": 800}[length_mode]
-        if is_final:
-            max_tokens = 650  # give the closing room to land
+    out_dir = config.PIPELINE_ROOT / "data" / "deep_dives"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    out_path = out_dir / f"{ts}-{_slugify(topic)}.json"
+    live_path = out_path.with_suffix(".live.jsonl")
 
+    async def generate(persona_key: str, slot: TurnSlot, history: List[dict]) -> str:
         persona = personas[persona_key]
-        prompt = _build_turn_prompt(persona_key, transcript, source_context, is_first, is_final, length_mode, pm_mode)
-
-        tag = "OPEN" if is_first else ("CLOSE" if is_final else length_mode.upper())
-        print(f"\n— Turn {turn_num + 1}/{total_turns} [{tag}]: {persona['name']} ({persona['provider']}/{persona['model']}) —")
-        try:
-            response = chat(
-                provider=persona["provider"],
-                model=persona["model"],
-                system=persona["system"],
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-            )
-        except Exception as exc:
-            print(f"  ! failed: {exc}")
-            response = f"[turn skipped — {persona['provider']} error]"
-
-        transcript.append({
-            "persona": persona_key,
-            "name": persona["name"],
-            "provider": persona["provider"],
-            "model": persona["model"],
-            "length_mode": length_mode,
-            "text": response,
-        })
-        preview = response[:240] + ("…" if len(response) > 240 else "")
-        print(preview)
+        prompt = _build_turn_prompt(
+            persona_key, history, source_context, slot.is_first, slot.is_final, slot.length_mode, pm_mode
+        )
+        call = partial(
+            chat,
+            provider=persona["provider"],
+            model=persona["model"],
+            system=persona["system"],
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=_max_tokens(slot),
+            stage="deep_dive",
+        )
+        if limiter is None:
+            return await asyncio.to_thread(call)
+        # Holds the provider permit until the thread returns, even when the
+        # engine cancels this candidate.
+        return await limiter.call(persona["provider"], call)
+
+    async def on_turn(turn: dict) -> None:
+        n = turn["turn"]
+        tag = "OPEN" if n == 1 else ("CLOSE" if n == total_turns else turn["length_mode"].upper())
+        print(f"\n— Turn {n}/{total_turns} [{tag}]: {turn['name']} ({turn['provider']}/{turn['model']}) —")
+        text = turn["text"]
+        print(text[:240] + ("…" if len(text) > 240 else ""))
+        if prefetch_audio and not text.startswith("["):
+            from pipeline.stages.deep_dive_audio import TTS_CACHE_DIR, VOICE_MAP
+            from app.services.tts_pipeline import Segment, synthesize
+
+            voice = VOICE_MAP.get(turn["persona"])
+            if voice:
+                label = f"{n - 1:02d}-{turn['persona']}"
+                await synthesize([Segment(text.strip(), voice["voice"], label)], TTS_CACHE_DIR)
+
+    speakers = {
+        k: {"name": v["name"], "provider": v["provider"], "model": v["model"]} for k, v in personas.items()
+    }
+    speculate = speculate or config.DEEP_DIVE_SPECULATE
+    report = await run_turns(
+        total_turns,
+        schedule=lambda n, transcript: _schedule_turn(n, total_turns, transcript, speculate),
+        generate=generate,
+        speakers=speakers,
+        transcript_path=live_path,
+        on_turn=on_turn,
+        failure_text=lambda key, error: f"[turn skipped — {personas[key]['provider']} error]",
+    )
+    transcript = report.transcript
+    timing = report.as_dict()
+    print(
+        f"\n  {len(transcript)} turns in {timing['wall_seconds']}s "
+        f"({timing['fallbacks_used']} fallbacks used, {timing['speculative_calls']} speculative calls, "
+        f"{timing['background_seconds']}s of background work)"
+    )
 
     # Save to DB
-    db = SessionLocal()
-    try:
-        participants = [
-            {"persona": k, "name": v["name"], "provider": v["provider"], "model": v["model"]}
-            for k, v in personas.items()
-        ]
-        dd = DeepDive(
-            source_article_id=article_id,
-            topic=topic,
-            format="unpack",
-            participants_json=json.dumps(participants),
-            transcript_json=json.dumps(transcript),
-            status="draft",
-            generated_at=datetime.utcnow(),
-        )
-        db.add(dd)
-        db.commit()
-        dd_id = dd.id
-    finally:
-        db.close()
+    dd_id, participants = await asyncio.to_thread(_save_deep_dive, article_id, topic, personas, transcript)
 
     # Dump JSON for review
-    out_dir = config.PIPELINE_ROOT / "data" / "deep_dives"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-    out_path = out_dir / f"{ts}-{_slugify(topic)}.json"
     out_path.write_text(json.dumps({
         "id": dd_id,
         "topic": topic,
@@ -354,8 +442,10 @@ def run(
         "pm_action_mode": pm_mode,
         "participants": participants,
         "transcript": transcript,
+        "timing": timing,
         "generated_at": datetime.utcnow().isoformat(),
     }, indent=2))
+    live_path.unlink(missing_ok=True)
 
     print(f"\n✓ Saved to DB (id={dd_id}) + {out_path}\n")
     return {
@@ -364,6 +454,7 @@ def run(
         "topic": topic,
         "turns": len(transcript),
         "output_file": str(out_path),
+        "timing": timing,
     }
 
 
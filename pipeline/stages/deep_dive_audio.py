@@ -5,24 +5,36 @@ Voice mapping comes from Narada's config/voices.yaml (top 3 by rating + contrast
   Skeptic  → en-GB-RyanNeural    (gb_ryan, good, UK male)
   Realist  → en-US-AvaNeural     (f_ava, good, US female)
 
+Turns are synthesized concurrently through app.services.tts_pipeline, with
+per-turn retries and a content-addressed cache shared by all episodes, so
+re-rendering an episode only synthesizes turns whose text or voice changed.
+
 Outputs per episode:
   pipeline/data/deep_dives/episode-{id}/
-    ├── segments/{NN-persona}.mp3   ← per-turn TTS files
-    └── episode.mp3                  ← ffmpeg-concatenated final
+    ├── segments/{NN-persona}.mp3   ← per-turn TTS files (linked from the cache)
+    └── episode.mp3                  ← assembled final, one ID3 chapter per turn
+                                       (stream copy when formats match; see
+                                       app/services/audio_assembly.py)
+  pipeline/data/deep_dives/_tts_cache/{sha}.mp3  ← segment cache (pruned after
+                                                   each episode; see prune_cache)
 """
 from __future__ import annotations
 
 import asyncio
 import json
 import shutil
-import subprocess
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from pipeline import config
 
 from app.database import SessionLocal
 from app.models.pipeline_models import DeepDive
+from app.services.audio_assembly import assemble
+from app.services.tts_pipeline import Segment, TTSBackend, link_or_copy, prune_cache, synthesize
+
+TTS_CACHE_DIR = config.PIPELINE_ROOT / "data" / "deep_dives" / "_tts_cache"
 
 
 VOICE_MAP = {
@@ -32,33 +44,9 @@ VOICE_MAP = {
 }
 
 
-async def _synth_turn(text: str, voice: str, out_path: Path) -> None:
-    import edge_tts
-    comm = edge_tts.Communicate(text, voice)
-    await comm.save(str(out_path))
-
-
-def _ffmpeg_concat(segments: List[Path], out_path: Path) -> None:
-    """Concatenate mp3 segments. Re-encodes (not stream copy) so different
-    voices/bitrates concat cleanly."""
-    list_file = out_path.parent / "_concat.txt"
-    # ffmpeg concat needs paths quoted only if they contain spaces; using -safe 0 + absolute paths
-    list_file.write_text("\n".join(f"file '{p.resolve()}'" for p in segments))
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat", "-safe", "0", "-i", str(list_file),
-        "-acodec", "libmp3lame", "-b:a", "128k",
-        str(out_path),
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    list_file.unlink(missing_ok=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"ffmpeg failed: {result.stderr[-500:]}")
-
-
-def run(deep_dive_id: int) -> dict:
-    if not shutil.which("ffmpeg"):
-        return {"stage": "deep_dive_audio", "error": "ffmpeg not on PATH — `brew install ffmpeg`"}
+def run(deep_dive_id: int, backend: Optional[TTSBackend] = None) -> dict:
+    if not (shutil.which("ffmpeg") and shutil.which("ffprobe")):
+        return {"stage": "deep_dive_audio", "error": "ffmpeg/ffprobe not on PATH — `brew install ffmpeg`"}
 
     db = SessionLocal()
     try:
@@ -80,7 +68,8 @@ def run(deep_dive_id: int) -> dict:
     for k, v in VOICE_MAP.items():
         print(f"  {k:<10} → {v['label']}")
 
-    segment_paths: List[Path] = []
+    segments: List[Segment] = []
+    chapter_titles: Dict[str, str] = {}
     for i, turn in enumerate(transcript):
         persona = turn["persona"]
         text = (turn.get("text") or "").strip()
@@ -91,14 +80,25 @@ def run(deep_dive_id: int) -> dict:
         if not cfg:
             print(f"  [{i+1:02d}] {persona}: SKIP (no voice mapped)")
             continue
-        seg_path = seg_dir / f"{i:02d}-{persona}.mp3"
-        preview = text[:60] + ("…" if len(text) > 60 else "")
-        print(f"  [{i+1:02d}] {turn['name']:<14} ({cfg['voice']:<22}) — {preview}")
-        try:
-            asyncio.run(_synth_turn(text, cfg["voice"], seg_path))
-            segment_paths.append(seg_path)
-        except Exception as exc:
-            print(f"      ! TTS failed: {exc}")
+        segments.append(Segment(text, cfg["voice"], f"{i:02d}-{persona}"))
+        chapter_titles[f"{i:02d}-{persona}"] = f"{turn.get('name') or persona.title()} ({persona})"
+
+    started = time.perf_counter()
+    results = asyncio.run(synthesize(segments, TTS_CACHE_DIR, backend=backend))
+    segment_paths: List[Tuple[Path, str]] = []
+    for result in results:
+        seg = result.segment
+        preview = seg.text[:60] + ("…" if len(seg.text) > 60 else "")
+        status = "cached" if result.cached else f"{result.attempts} attempt(s)"
+        print(f"  [{seg.label}] ({seg.voice:<22}) {status:<12} — {preview}")
+        if result.path is None:
+            print(f"      ! TTS failed: {result.error}")
+            continue
+        seg_path = seg_dir / f"{seg.label}.mp3"
+        link_or_copy(result.path, seg_path)
+        segment_paths.append((seg_path, chapter_titles[seg.label]))
+    cached = sum(1 for r in results if r.cached)
+    print(f"  TTS: {len(segment_paths)}/{len(results)} segments ({cached} cached) in {time.perf_counter() - started:.1f}s")
 
     if not segment_paths:
         return {"stage": "deep_dive_audio", "error": "no segments synthesized"}
@@ -106,15 +106,22 @@ def run(deep_dive_id: int) -> dict:
     final_path = out_dir / "episode.mp3"
     print(f"\n  Mixing {len(segment_paths)} segments → {final_path.name}")
     try:
-        _ffmpeg_concat(segment_paths, final_path)
+        assembled = assemble(segment_paths, final_path, title=topic)
     except Exception as exc:
         return {"stage": "deep_dive_audio", "error": str(exc)}
 
-    print(f"  ✓ {final_path}")
+    print(f"  ✓ {final_path} ({assembled.mode}, {len(assembled.chapters)} chapters, {assembled.seconds:.1f}s)")
+    pruned = prune_cache(TTS_CACHE_DIR)
+    if pruned:
+        print(f"  Pruned {pruned} unused segment(s) from the TTS cache")
     return {
         "stage": "deep_dive_audio",
         "deep_dive_id": deep_dive_id,
         "episode_path": str(final_path),
         "segment_count": len(segment_paths),
+        "cached_segments": cached,
+        "assembly": assembled.mode,
+        "duration_ms": assembled.duration_ms,
+        "chapters": len(assembled.chapters),
         "voice_map": {k: v["voice"] for k, v in VOICE_MAP.items()},
     }
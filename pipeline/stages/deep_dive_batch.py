@@ -0,0 +1,180 @@
+"""Stage 6b: deep dives for the top-scored recent articles, unattended.
+
+    python -m pipeline deep-dive --top-n 5 [--with-audio]
+
+Picks the N highest-scored latest ArticleAnalysis rows from the last
+DEEP_DIVE_BATCH_DAYS that have no DeepDive yet, and runs their roundtables
+concurrently (DEEP_DIVE_BATCH_CONCURRENCY at a time). All LLM calls share one
+ProviderLimiter, so OpenAI, xAI and Anthropic each stay under their
+DEEP_DIVE_PROVIDER_LIMITS however many roundtables are in flight. With
+--with-audio each finished transcript queues its own audio render.
+
+Every roundtable and audio render is a row in background_jobs (see
+app.services.job_runner). If the process dies, the next batch re-queues
+what was queued or running and skips articles that already got a DeepDive,
+so re-running the same command resumes instead of starting over.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from pipeline import config
+from pipeline.stages import deep_dive, deep_dive_audio
+
+from app.database import SessionLocal, ensure_pipeline_tables, init_db
+from app.models.feed_article import FeedArticle
+from app.models.pipeline_models import ArticleAnalysis, DeepDive
+from app.services.job_runner import JobRunner
+from app.services.provider_limits import ProviderLimit, ProviderLimiter
+
+ROUNDTABLE_JOB = "deep_dive.roundtable"
+AUDIO_JOB = "deep_dive.audio"
+
+
+def select_articles(top_n: int, days: int) -> List[Tuple[int, str, int]]:
+    """(article_id, title, score) for the top_n best recent analyses without a deep dive."""
+    db = SessionLocal()
+    try:
+        done = db.query(DeepDive.source_article_id).filter(DeepDive.source_article_id.isnot(None))
+        rows = (
+            db.query(ArticleAnalysis.article_id, ArticleAnalysis.display_title, FeedArticle.title, ArticleAnalysis.score)
+            .join(FeedArticle, FeedArticle.id == ArticleAnalysis.article_id)
+            .filter(ArticleAnalysis.is_latest == True)
+            .filter(ArticleAnalysis.score >= config.MIN_PUBLISH_SCORE)
+            .filter(ArticleAnalysis.run_at >= datetime.utcnow() - timedelta(days=days))
+            .filter(FeedArticle.is_dismissed == False)
+            .filter(ArticleAnalysis.article_id.notin_(done))
+            .order_by(ArticleAnalysis.score.desc(), ArticleAnalysis.run_at.desc())
+            .limit(top_n)
+            .all()
+        )
+        return [(row.article_id, row.display_title or row.title, row.score) for row in rows]
+    finally:
+        db.close()
+
+
+def _existing_deep_dive(article_id: int) -> Optional[int]:
+    db = SessionLocal()
+    try:
+        row = db.query(DeepDive.id).filter(DeepDive.source_article_id == article_id).first()
+        return row.id if row else None
+    finally:
+        db.close()
+
+
+async def _run_batch(
+    top_n: int,
+    depth: Optional[str],
+    pm_action: Optional[str],
+    with_audio: bool,
+    concurrency: int,
+) -> dict:
+    started = time.perf_counter()
+    limiter = ProviderLimiter({
+        provider: ProviderLimit(**limit) for provider, limit in config.DEEP_DIVE_PROVIDER_LIMITS.items()
+    })
+    runner = JobRunner(session_factory=SessionLocal, workers=concurrency)
+
+    async def roundtable(params: dict) -> dict:
+        article_id = params["article_id"]
+        # A crash between saving the DeepDive and finishing the job must not
+        # produce a second episode for the same article.
+        dd_id = await asyncio.to_thread(_existing_deep_dive, article_id)
+        result = {"article_id": article_id, "deep_dive_id": dd_id, "resumed": dd_id is not None}
+        if dd_id is None:
+            outcome = await deep_dive.run_async(
+                article_id=article_id,
+                depth=params.get("depth"),
+                pm_action=params.get("pm_action"),
+                prefetch_audio=params.get("with_audio", False),
+                limiter=limiter,
+            )
+            if outcome.get("error"):
+                raise RuntimeError(outcome["error"])
+            result.update(deep_dive_id=outcome["id"], topic=outcome["topic"], timing=outcome["timing"])
+        if params.get("with_audio"):
+            job = await runner.submit(
+                AUDIO_JOB, {"deep_dive_id": result["deep_dive_id"]}, dedupe_key=f"{AUDIO_JOB}:{result['deep_dive_id']}"
+            )
+            result["audio_job"] = job["id"]
+        return result
+
+    async def audio(params: dict) -> dict:
+        # deep_dive_audio runs its own event loop for TTS, so it gets a thread.
+        outcome = await asyncio.to_thread(deep_dive_audio.run, params["deep_dive_id"])
+        if outcome.get("error"):
+            raise RuntimeError(outcome["error"])
+        return outcome
+
+    runner.register(ROUNDTABLE_JOB, roundtable)
+    runner.register(AUDIO_JOB, audio)
+
+    # Re-queue whatever a previous (crashed) batch left unfinished first.
+    job_ids = await runner.start()
+    resumed = len(job_ids)
+    picked = await asyncio.to_thread(select_articles, top_n, config.DEEP_DIVE_BATCH_DAYS)
+    print(f"\n══ DEEP DIVE BATCH: {len(picked)} article(s), {resumed} resumed job(s), {concurrency} at a time ══")
+    for article_id, title, score in picked:
+        print(f"  [{article_id}] score={score}  {title}")
+        job = await runner.submit(
+            ROUNDTABLE_JOB,
+            {"article_id": article_id, "depth": depth, "pm_action": pm_action, "with_audio": with_audio},
+            dedupe_key=f"{ROUNDTABLE_JOB}:{article_id}",
+        )
+        if job["id"] not in job_ids:
+            job_ids.append(job["id"])
+
+    try:
+        await runner.join()
+    finally:
+        await runner.stop()
+
+    jobs = [runner.get(job_id) for job_id in job_ids]
+    audio_ids = [job["result"]["audio_job"] for job in jobs if job and (job["result"] or {}).get("audio_job")]
+    jobs += [runner.get(job_id) for job_id in audio_ids if job_id not in job_ids]
+    summary = {
+        "stage": "deep_dive_batch",
+        "selected": len(picked),
+        "resumed_jobs": resumed,
+        "wall_seconds": round(time.perf_counter() - started, 1),
+        "provider_limits": limiter.stats(),
+        "jobs": [
+            {
+                "kind": job["kind"],
+                "status": job["status"],
+                **{k: v for k, v in (job["result"] or job["params"]).items() if k in ("article_id", "deep_dive_id", "topic")},
+                **({"error": job["error"]} if job["error"] else {}),
+            }
+            for job in jobs if job
+        ],
+    }
+    for kind in (ROUNDTABLE_JOB, AUDIO_JOB):
+        statuses = [job["status"] for job in jobs if job and job["kind"] == kind]
+        summary[kind.split(".")[1]] = {"succeeded": statuses.count("succeeded"), "failed": statuses.count("failed")}
+    return summary
+
+
+def run(
+    top_n: int,
+    depth: Optional[str] = None,
+    pm_action: Optional[str] = None,
+    with_audio: bool = False,
+    concurrency: Optional[int] = None,
+) -> dict:
+    init_db()
+    ensure_pipeline_tables()
+    return asyncio.run(_run_batch(
+        top_n=top_n,
+        depth=depth,
+        pm_action=pm_action,
+        with_audio=with_audio,
+        concurrency=concurrency or config.DEEP_DIVE_BATCH_CONCURRENCY,
+    ))
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(top_n=3), indent=2, default=str))
@@ -2,6 +2,11 @@
 
 No AI. Cached per-article in article_extracts (one row per attempt, latest wins
 in practice — we query with order_by fetched_at desc).
+
+Near-duplicates flagged at fetch time (duplicate_of set) are skipped. Each
+successful extract gets a full-text SimHash; if it lands within
+FULLTEXT_MAX_DISTANCE of an already-extracted article, the article joins that
+cluster so analyse runs once per story.
 """
 from __future__ import annotations
 
@@ -13,6 +18,7 @@ from pipeline import config
 from app.database import SessionLocal, ensure_pipeline_tables, init_db
 from app.models.feed_article import FeedArticle
 from app.models.pipeline_models import ArticleExtract
+from app.services.feed_dedup import FULLTEXT_MAX_DISTANCE, find_near_duplicate, simhash
 
 
 def _extract(url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -46,7 +52,11 @@ def run(limit: Optional[int] = None, re_extract: bool = False) -> dict:
     db = SessionLocal()
     try:
         # Find articles that need extraction
-        query = db.query(FeedArticle).filter(FeedArticle.is_dismissed == False)
+        query = (
+            db.query(FeedArticle)
+            .filter(FeedArticle.is_dismissed == False)
+            .filter(FeedArticle.duplicate_of.is_(None))
+        )
         if not re_extract:
             already_extracted_ids = {
                 row.article_id for row in
@@ -59,9 +69,20 @@ def run(limit: Optional[int] = None, re_extract: bool = False) -> dict:
         if limit:
             articles = articles[:limit]
 
-        ok = failed = 0
+        # (representative article id, full-text fingerprint) for every clustered extract
+        fingerprints = [
+            (row.duplicate_of or row.article_id, row.simhash)
+            for row in db.query(ArticleExtract.article_id, ArticleExtract.simhash, FeedArticle.duplicate_of)
+            .join(FeedArticle, FeedArticle.id == ArticleExtract.article_id)
+            .filter(ArticleExtract.success == True)
+            .filter(ArticleExtract.simhash.isnot(None))
+            .all()
+        ]
+
+        ok = failed = clustered = 0
         for article in articles:
             text, error = _extract(article.url)
+            fingerprint = simhash(text) if text else None
             extract = ArticleExtract(
                 article_id=article.id,
                 full_text=text,
@@ -70,17 +91,33 @@ def run(limit: Optional[int] = None, re_extract: bool = False) -> dict:
                 fetched_at=datetime.utcnow(),
                 success=bool(text),
                 error=error,
+                simhash=fingerprint,
             )
             db.add(extract)
+            others = [(rep, fp) for rep, fp in fingerprints if rep != article.id]
+            duplicate_of = find_near_duplicate(fingerprint, others, FULLTEXT_MAX_DISTANCE)
+            if duplicate_of:
+                article.duplicate_of = duplicate_of
             db.commit()
-            if text:
+            if fingerprint:
+                fingerprints.append((duplicate_of or article.id, fingerprint))
+            if duplicate_of:
+                clustered += 1
+                print(f"  ≈ [{article.id}] near-duplicate of [{duplicate_of}] — {article.title[:60]}")
+            elif text:
                 ok += 1
                 print(f"  ✓ [{article.id}] {len(text)} chars — {article.title[:60]}")
             else:
                 failed += 1
                 print(f"  ✗ [{article.id}] {error} — {article.title[:60]}")
 
-        return {"stage": "extract", "attempted": len(articles), "success": ok, "failed": failed}
+        return {
+            "stage": "extract",
+            "attempted": len(articles),
+            "success": ok,
+            "failed": failed,
+            "clustered": clustered,
+        }
     finally:
         db.close()
 
@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import Optional
 
 from pipeline import config
+from pipeline.llm import chat
 
 from app.database import SessionLocal, ensure_pipeline_tables, init_db
 from app.models.feed_article import FeedArticle
@@ -75,15 +76,14 @@ Now write the editorial piece. Return the JSON object."""
 
 def _call_claude(prompt: str) -> Optional[str]:
     try:
-        from anthropic import Anthropic
-        client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        response = client.messages.create(
-            model=config.REWRITE_MODEL,
+        return chat(
+            "anthropic",
+            config.REWRITE_MODEL,
+            SYSTEM_PROMPT,
+            [{"role": "user", "content": prompt}],
             max_tokens=2500,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            stage="pipeline.rewrite",
         )
-        return response.content[0].text.strip()
     except Exception as exc:
         print(f"  ! Claude call failed: {exc}")
         return None
@@ -0,0 +1,43 @@
+"""pm-interview-coach/alembic/versions/20261019_1200_002_practice_daily_stats.py
+Daily per-category rollup of practice attempts
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 12:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and backfill practice_daily_stats."""
+    op.create_table(
+        "practice_daily_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("scored_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("day", "category"),
+    )
+    op.execute(
+        """
+        INSERT INTO practice_daily_stats (day, category, attempt_count, scored_count, score_sum)
+        SELECT date(a.created_at), q.category, count(a.id), count(a.overall_score),
+               coalesce(sum(a.overall_score), 0)
+        FROM practice_attempts a JOIN questions q ON q.id = a.question_id
+        GROUP BY date(a.created_at), q.category
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop practice_daily_stats."""
+    op.drop_table("practice_daily_stats")
@@ -20,6 +20,15 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
     openai_max_tokens: int = 2000
+    # Seconds between writes of buffered LLM call telemetry (llm_calls table).
+    llm_telemetry_flush_seconds: float = 10.0
+
+    # Evaluation cache: resubmitted (or near-identical, by MinHash
+    # similarity) answers to the same question reuse the evaluation.
+    eval_cache_ttl_seconds: int = 7 * 24 * 3600
+    eval_cache_max_entries: int = 2000
+    # Near-duplicate answer matching (MinHash similarity); 0 = exact matches only.
+    eval_cache_near_threshold: float = 0.0
 
     # Server
     host: str = "0.0.0.0"
@@ -2,6 +2,7 @@
 PM Interview Coach — FastAPI Application
 Main entry point for the application.
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -12,8 +13,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
-from app.database import close_db, init_db
+from app.database import AsyncSessionLocal, close_db, init_db
 from app.routers import api, pages, practice, stats
+from app.services.llm_client import close_llm_clients
+from app.services.llm_telemetry import telemetry
+from app.services.practice_rollup import rebuild_daily_stats
 
 logging.basicConfig(
     level=logging.INFO if not settings.debug else logging.DEBUG,
@@ -30,14 +34,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     try:
         await init_db()
+        async with AsyncSessionLocal() as db:
+            await rebuild_daily_stats(db)
         logger.info("Database initialized successfully")
     except Exception as exc:
         logger.error("Database initialization failed: %s", exc)
         raise
 
+    # Write buffered LLM call telemetry; see app/services/llm_telemetry.py.
+    async def _telemetry_flush_loop() -> None:
+        while True:
+            await asyncio.sleep(settings.llm_telemetry_flush_seconds)
+            await telemetry.flush()
+
+    telemetry_task = asyncio.create_task(_telemetry_flush_loop())
+
     yield
 
     logger.info("Shutting down PM Interview Coach...")
+    telemetry_task.cancel()
+    await telemetry.flush()
+    await close_llm_clients()
     await close_db()
     logger.info("Database connections closed")
 
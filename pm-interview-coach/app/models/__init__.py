@@ -1,6 +1,8 @@
 """pm-interview-coach/app/models/__init__.py"""
 from app.models.attempt import Attempt
+from app.models.daily_stats import DailyCategoryStats
+from app.models.llm_call import LLMCall
 from app.models.question import Question
 from app.models.session import PracticeSession
 
-__all__ = ["Question", "Attempt", "PracticeSession"]
+__all__ = ["Question", "Attempt", "DailyCategoryStats", "LLMCall", "PracticeSession"]
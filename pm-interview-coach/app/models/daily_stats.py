@@ -0,0 +1,31 @@
+"""pm-interview-coach/app/models/daily_stats.py"""
+from datetime import date
+
+from sqlalchemy import Date, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class DailyCategoryStats(Base):
+    """Per-day, per-category rollup of practice attempts.
+
+    Maintained by app.services.practice_rollup in the same transaction as
+    each Attempt insert and rebuilt from practice_attempts at startup, so
+    dashboard stats and the weighted question selector read a few rows per
+    day instead of scanning every attempt.
+    """
+
+    __tablename__ = "practice_daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    category: Mapped[str] = mapped_column(String(50), primary_key=True)
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scored_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    def __repr__(self) -> str:
+        return (
+            "<DailyCategoryStats("
+            f"day={self.day}, category='{self.category}', attempts={self.attempt_count})>"
+        )
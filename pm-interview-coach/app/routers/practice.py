@@ -2,21 +2,22 @@
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db
 from app.models.attempt import Attempt
 from app.models.question import Question
 from app.models.session import PracticeSession
-from app.services.evaluator import EvaluationError, evaluate_answer
+from app.services.evaluator import EvaluationError, EvaluationResult, evaluate_answer, stream_answer
+from app.services.practice_rollup import record_attempt
 from app.services.question_selector import get_random_question
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -76,6 +77,7 @@ async def submit_answer(
             question=question.question_text,
             answer=answer_text,
             time_spent_sec=time_spent_sec,
+            question_id=question.id,
         )
     except EvaluationError as exc:
         return templates.TemplateResponse(
@@ -83,6 +85,77 @@ async def submit_answer(
             _ctx(request, evaluation=None, error_message=str(exc)),
         )
 
+    await _save_attempt(db, question, session_id, answer_text, time_spent_sec, evaluation)
+
+    return templates.TemplateResponse(
+        "partials/feedback.html",
+        _ctx(request, evaluation=evaluation, error_message=None),
+    )
+
+
+def _sse(event: str, data: str) -> str:
+    lines = "".join(f"data: {line}\n" for line in data.split("\n"))
+    return f"event: {event}\n{lines}\n"
+
+
+@router.post("/api/practice/submit/stream")
+async def submit_answer_stream(
+    request: Request,
+    question_id: int = Form(...),
+    session_id: str = Form(...),
+    answer_text: str = Form(...),
+    time_spent_sec: Optional[int] = Form(None),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Server-sent events version of submit: `progress` events carry the
+    evaluation text as the model writes it, then one `result` event carries
+    the rendered feedback partial (also used for errors)."""
+    question = await db.get(Question, question_id)
+    if question is None:
+        raise HTTPException(status_code=404, detail="Question not found")
+    feedback = templates.get_template("partials/feedback.html")
+
+    async def events() -> AsyncIterator[str]:
+        if len(answer_text.strip()) < 50:
+            error = "Answer must be at least 50 characters."
+            yield _sse("result", feedback.render(_ctx(request, evaluation=None, error_message=error)))
+            return
+        evaluation = None
+        try:
+            async for item in stream_answer(
+                category=question.category,
+                question=question.question_text,
+                answer=answer_text,
+                time_spent_sec=time_spent_sec,
+                question_id=question.id,
+            ):
+                if isinstance(item, str):
+                    yield _sse("progress", item)
+                else:
+                    evaluation = item
+        except EvaluationError as exc:
+            yield _sse("result", feedback.render(_ctx(request, evaluation=None, error_message=str(exc))))
+            return
+        # The request's session may already be closed once streaming starts.
+        async with AsyncSessionLocal() as stream_db:
+            await _save_attempt(stream_db, question, session_id, answer_text, time_spent_sec, evaluation)
+        yield _sse("result", feedback.render(_ctx(request, evaluation=evaluation, error_message=None)))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _save_attempt(
+    db: AsyncSession,
+    question: Question,
+    session_id: str,
+    answer_text: str,
+    time_spent_sec: Optional[int],
+    evaluation: EvaluationResult,
+) -> None:
     attempt = Attempt(
         question_id=question.id,
         session_id=session_id,
@@ -100,15 +173,11 @@ async def submit_answer(
         created_at=datetime.now(timezone.utc),
     )
     db.add(attempt)
+    await record_attempt(db, question.category, attempt.created_at, attempt.overall_score)
     await db.commit()
 
     await _update_session_stats(db, session_id)
 
-    return templates.TemplateResponse(
-        "partials/feedback.html",
-        _ctx(request, evaluation=evaluation, error_message=None),
-    )
-
 
 async def _render_practice(
     request: Request,
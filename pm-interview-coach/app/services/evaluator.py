@@ -4,12 +4,14 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import AsyncIterator, List
 
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field, ValidationError
 
 from app.config import settings
+from app.services.evaluation_cache import evaluation_cache
+from app.services.llm_client import get_openai_client
+from app.services.llm_telemetry import telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -53,26 +55,93 @@ class EvaluationError(RuntimeError):
 
 
 async def evaluate_answer(
-    category: str, question: str, answer: str, time_spent_sec: int | None = None
+    category: str,
+    question: str,
+    answer: str,
+    time_spent_sec: int | None = None,
+    question_id: int | None = None,
 ) -> EvaluationResult:
-    """Evaluate a response using OpenAI ChatGPT and return structured results."""
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
-    system_prompt = _build_system_prompt(category)
-    user_prompt = _build_user_prompt(question, answer, time_spent_sec)
+    """Evaluate a response using OpenAI ChatGPT and return structured results.
+
+    With a question_id, resubmitted or near-identical answers to the same
+    question are served from evaluation_cache without a model call.
+    """
+    if question_id is not None:
+        cached = evaluation_cache.get(question_id, answer)
+        if cached is not None:
+            return cached
+    client = get_openai_client(settings.openai_api_key)
 
     try:
-        response = await client.chat.completions.create(
-            model=settings.openai_model,
-            max_tokens=settings.openai_max_tokens,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
+        with telemetry.track("pm_coach.evaluate", "openai", settings.openai_model) as call:
+            response = await client.chat.completions.create(
+                model=settings.openai_model,
+                max_tokens=settings.openai_max_tokens,
+                messages=_build_messages(category, question, answer, time_spent_sec),
+            )
+            if response.usage:
+                call.input_tokens = response.usage.prompt_tokens
+                call.output_tokens = response.usage.completion_tokens
         raw_text = response.choices[0].message.content
+    except Exception as exc:
+        logger.error("Evaluation failed", exc_info=True)
+        raise EvaluationError("Model response invalid") from exc
+
+    result = _parse_evaluation(raw_text)
+    if question_id is not None:
+        evaluation_cache.put(question_id, answer, result)
+    return result
+
+
+async def stream_answer(
+    category: str,
+    question: str,
+    answer: str,
+    time_spent_sec: int | None = None,
+    question_id: int | None = None,
+) -> AsyncIterator[str | EvaluationResult]:
+    """Like evaluate_answer, but yield text deltas as they arrive and the
+    parsed EvaluationResult last."""
+    if question_id is not None:
+        cached = evaluation_cache.get(question_id, answer)
+        if cached is not None:
+            yield cached
+            return
+    client = get_openai_client(settings.openai_api_key)
+    parts: list[str] = []
+
+    try:
+        with telemetry.track("pm_coach.evaluate", "openai", settings.openai_model) as call:
+            chunks = await client.chat.completions.create(
+                model=settings.openai_model,
+                max_tokens=settings.openai_max_tokens,
+                messages=_build_messages(category, question, answer, time_spent_sec),
+                stream=True,
+                stream_options={"include_usage": True},  # usage arrives in a final, choice-less chunk
+            )
+            async for chunk in chunks:
+                if chunk.usage:
+                    call.input_tokens = chunk.usage.prompt_tokens
+                    call.output_tokens = chunk.usage.completion_tokens
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+    except Exception as exc:
+        logger.error("Evaluation failed", exc_info=True)
+        raise EvaluationError("Model response invalid") from exc
+
+    result = _parse_evaluation("".join(parts))
+    if question_id is not None:
+        evaluation_cache.put(question_id, answer, result)
+    yield result
+
+
+def _parse_evaluation(raw_text: str) -> EvaluationResult:
+    try:
         payload = json.loads(raw_text)
         parsed = EvaluationSchema(**payload)
-    except (ValidationError, json.JSONDecodeError, Exception) as exc:
+    except (ValidationError, json.JSONDecodeError, TypeError) as exc:
         logger.error("Evaluation failed", exc_info=True)
         raise EvaluationError("Model response invalid") from exc
 
@@ -89,6 +158,15 @@ async def evaluate_answer(
     )
 
 
+def _build_messages(
+    category: str, question: str, answer: str, time_spent_sec: int | None
+) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": _build_system_prompt(category)},
+        {"role": "user", "content": _build_user_prompt(question, answer, time_spent_sec)},
+    ]
+
+
 def _build_system_prompt(category: str) -> str:
     frameworks = CATEGORY_FRAMEWORKS.get(category, "General PM frameworks")
     return (
@@ -0,0 +1,68 @@
+"""pm-interview-coach/app/services/llm_client.py
+
+One pooled AsyncOpenAI client per API key for the whole process, so
+evaluations reuse kept-alive connections instead of a fresh handshake each.
+The cache is an LRU bounded at MAX_CLIENTS, like the main app's registry;
+evicted clients have their connection pools closed.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import httpx
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+MAX_CLIENTS = 8
+
+_clients: OrderedDict[str, AsyncOpenAI] = OrderedDict()
+_lock = threading.Lock()
+_background: set[asyncio.Task] = set()
+
+_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    evicted = []
+    with _lock:
+        client = _clients.get(key_id)
+        if client is not None:
+            _clients.move_to_end(key_id)
+            return client
+        client = AsyncOpenAI(
+            api_key=api_key, http_client=httpx.AsyncClient(limits=_LIMITS, timeout=_TIMEOUT)
+        )
+        _clients[key_id] = client
+        while len(_clients) > MAX_CLIENTS:
+            evicted.append(_clients.popitem(last=False)[1])
+    for old in evicted:
+        _schedule_close(old)
+    return client
+
+
+def _schedule_close(client: AsyncOpenAI) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # no loop to close on; the pool is released when collected
+    task = loop.create_task(client.close())
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+async def close_llm_clients() -> None:
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception:
+            logger.warning("Closing LLM client failed", exc_info=True)
@@ -0,0 +1,105 @@
+"""pm-interview-coach/app/services/llm_telemetry.py
+
+Token, cost and latency telemetry for the evaluator's OpenAI calls, stored
+in the same llm_calls table layout as the main site's
+code/app/services/llm_telemetry.py:
+
+    with telemetry.track("evaluate", "openai", model) as call:
+        response = await client.chat.completions.create(...)
+        call.input_tokens = response.usage.prompt_tokens
+        call.output_tokens = response.usage.completion_tokens
+
+Tracking only appends to an in-memory buffer; flush() writes it in one
+transaction, from the app lifespan on a timer and at shutdown.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models.llm_call import LLMCall
+
+logger = logging.getLogger(__name__)
+
+# USD per million tokens (input, output); unknown models are recorded at 0.
+PRICING = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
+
+
+@dataclass
+class CallStats:
+    """Filled in by the caller inside track()."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    input_rate, output_rate = PRICING.get(model, (0.0, 0.0))
+    return round((input_tokens * input_rate + output_tokens * output_rate) / 1_000_000, 6)
+
+
+class LLMTelemetry:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        max_buffered: int = 2000,
+    ) -> None:
+        self._session_factory = session_factory
+        self.max_buffered = max_buffered
+        self._pending: list[dict] = []
+
+    @contextmanager
+    def track(self, stage: str, provider: str, model: str) -> Iterator[CallStats]:
+        stats = CallStats()
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            yield stats
+        except BaseException as exc:
+            error = f"{type(exc).__name__}: {exc}"[:500]
+            raise
+        finally:
+            self._pending.append({
+                "created_at": datetime.now(timezone.utc),
+                "stage": stage,
+                "provider": provider,
+                "model": model,
+                "input_tokens": stats.input_tokens,
+                "output_tokens": stats.output_tokens,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                "retries": 0,
+                "cost_usd": calculate_cost(model, stats.input_tokens, stats.output_tokens),
+                "success": error is None,
+                "error": error,
+            })
+            # Bound memory if nothing is flushing (e.g. the DB is down).
+            del self._pending[: max(len(self._pending) - self.max_buffered, 0)]
+
+    async def flush(self) -> int:
+        """Write buffered records in one transaction. Returns rows written."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        try:
+            async with self._session_factory() as db:
+                await db.execute(insert(LLMCall), batch)
+                await db.commit()
+        except Exception:
+            logger.exception("LLM telemetry flush failed; %d records re-queued", len(batch))
+            self._pending[:0] = batch
+            return 0
+        return len(batch)
+
+
+telemetry = LLMTelemetry()
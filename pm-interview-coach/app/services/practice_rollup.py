@@ -0,0 +1,93 @@
+"""pm-interview-coach/app/services/practice_rollup.py
+
+Incremental maintenance of the practice_daily_stats rollup.
+
+record_attempt() upserts the (day, category) row for a new attempt inside
+the caller's transaction; rebuild_daily_stats() recomputes the whole table
+from practice_attempts (run at startup, so the rollup can never drift).
+Days are UTC calendar days of Attempt.created_at.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attempt import Attempt
+from app.models.daily_stats import DailyCategoryStats
+from app.models.question import Question
+
+
+def _utc_day(value: datetime):
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+async def record_attempt(
+    db: AsyncSession, category: str, created_at: datetime, overall_score: float | None
+) -> None:
+    """Count one attempt in the rollup. Call before committing the Attempt."""
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    table = DailyCategoryStats.__table__
+    scored = overall_score is not None
+    stmt = insert(table).values(
+        day=_utc_day(created_at),
+        category=category,
+        attempt_count=1,
+        scored_count=1 if scored else 0,
+        score_sum=overall_score if scored else 0.0,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.day, table.c.category],
+        set_={
+            "attempt_count": table.c.attempt_count + 1,
+            "scored_count": table.c.scored_count + (1 if scored else 0),
+            "score_sum": table.c.score_sum + (overall_score if scored else 0.0),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def rebuild_daily_stats(db: AsyncSession) -> None:
+    """Recompute the rollup from practice_attempts in one statement."""
+    day = func.date(Attempt.created_at)
+    source = (
+        select(
+            day,
+            Question.category,
+            func.count(Attempt.id),
+            func.count(Attempt.overall_score),
+            func.coalesce(func.sum(Attempt.overall_score), 0.0),
+        )
+        .join(Question, Question.id == Attempt.question_id)
+        .group_by(day, Question.category)
+    )
+    await db.execute(delete(DailyCategoryStats))
+    await db.execute(
+        DailyCategoryStats.__table__.insert().from_select(
+            ["day", "category", "attempt_count", "scored_count", "score_sum"], source
+        )
+    )
+    await db.commit()
+
+
+def category_totals_query():
+    """(category, attempts, scored, score_sum) summed over all days."""
+    return (
+        select(
+            DailyCategoryStats.category,
+            func.sum(DailyCategoryStats.attempt_count),
+            func.sum(DailyCategoryStats.scored_count),
+            func.sum(DailyCategoryStats.score_sum),
+        )
+        .group_by(DailyCategoryStats.category)
+    )
+
+
+def average(score_sum: float | None, scored: int | None) -> float | None:
+    return float(score_sum) / scored if scored else None
+
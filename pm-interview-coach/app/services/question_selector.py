@@ -7,8 +7,8 @@ from typing import Optional
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.attempt import Attempt
 from app.models.question import Question
+from app.services.practice_rollup import average, category_totals_query
 
 
 async def get_random_question(
@@ -45,11 +45,5 @@ async def _fetch_categories(db: AsyncSession) -> list[str]:
 
 
 async def _fetch_avg_scores(db: AsyncSession) -> dict[str, float]:
-    query = (
-        select(Question.category, func.avg(Attempt.overall_score))
-        .select_from(Question)
-        .join(Attempt, Attempt.question_id == Question.id, isouter=True)
-        .group_by(Question.category)
-    )
-    result = await db.execute(query)
-    return {row[0]: float(row[1]) if row[1] is not None else 0.0 for row in result.all()}
+    result = await db.execute(category_totals_query())
+    return {row[0]: average(row[3], row[2]) or 0.0 for row in result.all()}
@@ -1,109 +1,105 @@
 """pm-interview-coach/app/services/stats_engine.py"""
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.attempt import Attempt
+from app.models.daily_stats import DailyCategoryStats
 from app.models.question import Question
+from app.services.practice_rollup import average, category_totals_query
 
 
 class StatsEngine:
-    """Compute aggregated practice statistics."""
+    """Compute aggregated practice statistics.
+
+    Everything reads the practice_daily_stats rollup (one row per day and
+    category), never the attempts table.
+    """
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def overview(self) -> dict[str, object]:
-        total = await self._fetch_total_attempts()
-        avg_score = await self._fetch_avg_score()
-        weakest_category = await self._fetch_weakest_category()
+        totals = await self._category_totals()
+        total = sum(attempts for attempts, _, _ in totals.values())
+        scored = sum(count for _, count, _ in totals.values())
+        score_sum = sum(value for _, _, value in totals.values())
+
+        averages = {
+            category: average(value, count)
+            for category, (_, count, value) in totals.items()
+            if count
+        }
+        weakest_category = min(averages, key=averages.get) if averages else None
         streak = await self._calculate_streak()
 
         return {
             "total_practiced": total,
-            "avg_score": avg_score,
+            "avg_score": average(score_sum, scored) or 0.0,
             "streak": streak,
             "weakest_category": weakest_category,
         }
 
     async def by_category(self) -> list[dict[str, object]]:
-        query = (
-            select(Question.category, func.avg(Attempt.overall_score))
-            .select_from(Question)
-            .join(Attempt, Attempt.question_id == Question.id, isouter=True)
-            .group_by(Question.category)
-            .order_by(Question.category)
+        result = await self.db.execute(
+            select(Question.category).distinct().order_by(Question.category)
         )
-        result = await self.db.execute(query)
-        return [
-            {
-                "category": row[0],
-                "avg_score": float(row[1]) if row[1] is not None else 0.0,
-            }
-            for row in result.all()
-        ]
+        totals = await self._category_totals()
+        rows = []
+        for (category,) in result.all():
+            _, scored, score_sum = totals.get(category, (0, 0, 0.0))
+            rows.append({"category": category, "avg_score": average(score_sum, scored) or 0.0})
+        return rows
 
     async def trend(self) -> list[dict[str, object]]:
         query = (
-            select(func.date(Attempt.created_at), func.avg(Attempt.overall_score))
-            .group_by(func.date(Attempt.created_at))
-            .order_by(func.date(Attempt.created_at))
+            select(
+                DailyCategoryStats.day,
+                func.sum(DailyCategoryStats.scored_count),
+                func.sum(DailyCategoryStats.score_sum),
+            )
+            .group_by(DailyCategoryStats.day)
+            .order_by(DailyCategoryStats.day)
         )
         result = await self.db.execute(query)
         return [
-            {
-                "date": str(row[0]),
-                "avg_score": float(row[1]) if row[1] is not None else 0.0,
-            }
+            {"date": str(row[0]), "avg_score": average(row[2], row[1]) or 0.0}
             for row in result.all()
         ]
 
     async def heatmap(self) -> list[dict[str, object]]:
         query = (
-            select(func.date(Attempt.created_at), func.count(Attempt.id))
-            .group_by(func.date(Attempt.created_at))
-            .order_by(func.date(Attempt.created_at))
+            select(DailyCategoryStats.day, func.sum(DailyCategoryStats.attempt_count))
+            .group_by(DailyCategoryStats.day)
+            .order_by(DailyCategoryStats.day)
         )
         result = await self.db.execute(query)
         return [
             {"date": str(row[0]), "count": int(row[1])} for row in result.all()
         ]
 
-    async def _fetch_total_attempts(self) -> int:
-        result = await self.db.execute(select(func.count(Attempt.id)))
-        return int(result.scalar() or 0)
-
-    async def _fetch_avg_score(self) -> float:
-        result = await self.db.execute(select(func.avg(Attempt.overall_score)))
-        value = result.scalar()
-        return float(value) if value is not None else 0.0
+    async def _category_totals(self) -> dict[str, tuple[int, int, float]]:
+        result = await self.db.execute(category_totals_query())
+        return {
+            row[0]: (int(row[1] or 0), int(row[2] or 0), float(row[3] or 0.0))
+            for row in result.all()
+        }
 
-    async def _fetch_weakest_category(self) -> str | None:
+    async def _calculate_streak(self) -> int:
         query = (
-            select(Question.category, func.avg(Attempt.overall_score))
-            .select_from(Question)
-            .join(Attempt, Attempt.question_id == Question.id)
-            .group_by(Question.category)
-            .order_by(func.avg(Attempt.overall_score))
-            .limit(1)
+            select(DailyCategoryStats.day)
+            .distinct()
+            .order_by(DailyCategoryStats.day.desc())
         )
         result = await self.db.execute(query)
-        row = result.first()
-        return row[0] if row else None
-
-    async def _calculate_streak(self) -> int:
-        query = select(func.date(Attempt.created_at)).distinct()
-        result = await self.db.execute(query)
-        dates = sorted({row[0] for row in result.all()}, reverse=True)
-        if not dates:
+        date_set = {self._coerce_date(row[0]) for row in result.all()}
+        if not date_set:
             return 0
 
         streak = 0
-        current = date.today()
-        date_set = {self._coerce_date(item) for item in dates}
+        current = datetime.now(timezone.utc).date()  # rollup days are UTC
         while current in date_set:
             streak += 1
             current -= timedelta(days=1)
@@ -111,8 +107,8 @@ class StatsEngine:
 
     @staticmethod
     def _coerce_date(value: object) -> date:
-        if isinstance(value, date):
-            return value
         if isinstance(value, datetime):
             return value.date()
+        if isinstance(value, date):
+            return value
         return date.fromisoformat(str(value))
@@ -33,15 +33,29 @@
       });
     }
 
-    document.body.addEventListener("htmx:beforeRequest", (event) => {
-      if (!form.contains(event.target)) return;
+    function recordTimeSpent() {
       if (startTime && timeSpentInput) {
         const seconds = Math.round((Date.now() - startTime) / 1000);
         timeSpentInput.value = String(seconds);
       }
+    }
+
+    document.body.addEventListener("htmx:beforeRequest", (event) => {
+      if (!form.contains(event.target)) return;
+      recordTimeSpent();
       if (submitBtn) submitBtn.disabled = true;
     });
 
+    // Stream the evaluation when the browser can read a response body
+    // incrementally; otherwise the form's hx-post runs as before.
+    form.addEventListener("htmx:confirm", (event) => {
+      if (event.target !== form || !window.ReadableStream || !window.TextDecoder) return;
+      event.preventDefault();
+      if (!form.reportValidity()) return;
+      recordTimeSpent();
+      streamSubmit(form, submitBtn);
+    });
+
     document.body.addEventListener("htmx:afterSwap", (event) => {
       if (event.target && event.target.id === "feedback-panel") {
         if (submitBtn) submitBtn.disabled = false;
@@ -49,6 +63,59 @@
     });
   }
 
+  function streamSubmit(form, submitBtn) {
+    const spinner = document.getElementById("submit-spinner");
+    const panel = document.getElementById("feedback-panel");
+    const progress = document.createElement("pre");
+    progress.className = "text-small whitespace-pre-wrap";
+    progress.style.color = "var(--color-text-tertiary)";
+    panel.replaceChildren(progress);
+    if (spinner) spinner.classList.add("htmx-request");
+    if (submitBtn) submitBtn.disabled = true;
+
+    const finish = (html) => {
+      document.getElementById("feedback-panel").outerHTML = html;
+      if (spinner) spinner.classList.remove("htmx-request");
+      if (submitBtn) submitBtn.disabled = false;
+    };
+    const failed = () =>
+      finish(
+        '<div id="feedback-panel" class="rounded-xl border p-6">' +
+          '<p class="text-body" style="color: var(--color-danger);">Evaluation failed. Please try again.</p></div>'
+      );
+
+    fetch("/api/practice/submit/stream", { method: "POST", body: new FormData(form) })
+      .then(async (response) => {
+        if (!response.ok) return failed();
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buffer += decoder.decode(value, { stream: true });
+          let end;
+          while ((end = buffer.indexOf("\n\n")) !== -1) {
+            const block = buffer.slice(0, end);
+            buffer = buffer.slice(end + 2);
+            const event = (block.match(/^event: (.*)$/m) || [])[1];
+            const data = block
+              .split("\n")
+              .filter((line) => line.startsWith("data: "))
+              .map((line) => line.slice(6))
+              .join("\n");
+            if (event === "progress") {
+              progress.textContent += data;
+            } else if (event === "result") {
+              return finish(data);
+            }
+          }
+        }
+        failed();
+      })
+      .catch(failed);
+  }
+
   async function fetchJson(url) {
     const response = await fetch(url);
     if (!response.ok) {
@@ -0,0 +1,18 @@
+"""pm-interview-coach/tests/test_evaluation_cache.py"""
+from app.services.evaluation_cache import EvaluationCache
+
+ANSWER = (
+    "Clarify the goal first: more weekly active planners. Segment students by workload, "
+    "pick the overloaded group, map their pain points around deadlines and clashes, then "
+    "prioritise a conflict-aware weekly view and measure success by plans completed."
+)
+
+
+def test_int_question_ids_and_near_duplicates_share_entries() -> None:
+    cache = EvaluationCache(near_threshold=0.9)
+    cache.put(7, ANSWER, "evaluation")
+
+    assert cache.get("7", ANSWER) == "evaluation"
+    assert cache.get(7, ANSWER.replace("goal first", "goal")) == "evaluation"
+    assert cache.get(7, ANSWER.replace("plans completed", "plans abandoned")) is None
+    assert cache.get(8, ANSWER) is None
@@ -0,0 +1,21 @@
+"""pm-interview-coach/tests/test_llm_client.py"""
+import pytest
+
+from app.services import llm_client
+
+
+@pytest.mark.asyncio
+async def test_client_cache_is_bounded_lru(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm_client, "MAX_CLIENTS", 2)
+    await llm_client.close_llm_clients()
+
+    a = llm_client.get_openai_client("sk-a")
+    llm_client.get_openai_client("sk-b")
+    assert llm_client.get_openai_client("sk-a") is a  # a is now most recent
+    llm_client.get_openai_client("sk-c")
+
+    assert len(llm_client._clients) == 2
+    assert llm_client.get_openai_client("sk-a") is a
+    assert all("sk-" not in key_id for key_id in llm_client._clients)
+    await llm_client.close_llm_clients()
+    assert not llm_client._clients
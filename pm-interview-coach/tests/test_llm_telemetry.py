@@ -0,0 +1,57 @@
+"""pm-interview-coach/tests/test_llm_telemetry.py"""
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import LLMCall
+from app.services import evaluator
+from app.services.llm_telemetry import LLMTelemetry
+
+PAYLOAD = json.dumps({
+    "overall_score": 7, "framework_score": 7, "structure_score": 7, "completeness_score": 7,
+    "strengths": ["Clear"], "improvements": ["Metrics"],
+})
+USAGE = SimpleNamespace(prompt_tokens=1000, completion_tokens=200)
+
+
+class FakeCompletions:
+    async def create(self, stream=False, **kwargs):
+        if not stream:
+            message = SimpleNamespace(content=PAYLOAD)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=USAGE)
+
+        async def chunks():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=PAYLOAD))], usage=None)
+            yield SimpleNamespace(choices=[], usage=USAGE)
+        return chunks()
+
+
+@pytest.mark.asyncio
+async def test_evaluator_calls_are_recorded_with_tokens_and_cost(tmp_path: Path, monkeypatch) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    telemetry = LLMTelemetry(session_factory=session_factory)
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    monkeypatch.setattr(evaluator, "telemetry", telemetry)
+    monkeypatch.setattr(evaluator, "get_openai_client", lambda api_key: fake_client)
+    monkeypatch.setattr(evaluator.settings, "openai_model", "gpt-4o-mini")
+
+    await evaluator.evaluate_answer("strategy", "Q?", "A.")
+    streamed = [item async for item in evaluator.stream_answer("strategy", "Q?", "A.")]
+    assert isinstance(streamed[-1], evaluator.EvaluationResult)
+
+    assert await telemetry.flush() == 2
+    async with session_factory() as db:
+        rows = (await db.execute(select(LLMCall))).scalars().all()
+    await engine.dispose()
+    assert [(r.stage, r.input_tokens, r.output_tokens, r.success) for r in rows] == [
+        ("pm_coach.evaluate", 1000, 200, True),
+    ] * 2
+    assert rows[0].cost_usd == pytest.approx(0.00027)
@@ -0,0 +1,108 @@
+"""pm-interview-coach/tests/test_practice_stream.py"""
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base, get_db
+from app.main import app
+from app.models import Attempt, PracticeSession, Question
+from app.routers import practice
+from app.services.evaluator import EvaluationError, EvaluationResult
+
+ANSWER = "I would start by segmenting users and picking the most painful journey to fix first."
+
+RESULT = EvaluationResult(
+    overall_score=7.5,
+    framework_score=8.0,
+    structure_score=7.0,
+    completeness_score=6.5,
+    strengths=["Clear framing"],
+    improvements=["Missing metrics"],
+    suggested_framework="CIRCLES",
+    example_point=None,
+    raw_json="{}",
+)
+
+
+def _events(body: str) -> list[tuple[str, str]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = block.split("\n")
+        data = "\n".join(line[len("data: "):] for line in lines[1:])
+        events.append((lines[0][len("event: "):], data))
+    return events
+
+
+@pytest_asyncio.fixture
+async def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", future=True)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_factory() as db:
+        db.add(Question(id=1, category="product_design", question_text="Design a parking app", source="test"))
+        db.add(PracticeSession(id="s1", category_filter="product_design"))
+        await db.commit()
+
+    async def override_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    monkeypatch.setattr(practice, "AsyncSessionLocal", session_factory)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        yield http, session_factory
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_progress_then_feedback_and_saves_attempt(client, monkeypatch) -> None:
+    http, session_factory = client
+
+    async def fake_stream(**kwargs):
+        assert kwargs["question_id"] == 1
+        yield '{"overall_score": '
+        yield "7.5,\n..."
+        yield RESULT
+
+    monkeypatch.setattr(practice, "stream_answer", fake_stream)
+    response = await http.post("/api/practice/submit/stream", data={
+        "question_id": "1", "session_id": "s1", "answer_text": ANSWER, "time_spent_sec": "90",
+    })
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert events[:2] == [("progress", '{"overall_score": '), ("progress", "7.5,\n...")]
+    assert events[-1][0] == "result" and "Clear framing" in events[-1][1]
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count(Attempt.id))) == 1
+        assert (await db.get(PracticeSession, "s1")).questions_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_renders_errors_into_the_feedback_panel(client, monkeypatch) -> None:
+    http, session_factory = client
+
+    async def failing_stream(**kwargs):
+        yield "partial"
+        raise EvaluationError("Model response invalid")
+
+    monkeypatch.setattr(practice, "stream_answer", failing_stream)
+    response = await http.post("/api/practice/submit/stream", data={
+        "question_id": "1", "session_id": "s1", "answer_text": ANSWER,
+    })
+    name, html = _events(response.text)[-1]
+    assert name == "result" and "Model response invalid" in html
+
+    short = await http.post("/api/practice/submit/stream", data={
+        "question_id": "1", "session_id": "s1", "answer_text": "too short",
+    })
+    assert "at least 50 characters" in _events(short.text)[0][1]
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count(Attempt.id))) == 0
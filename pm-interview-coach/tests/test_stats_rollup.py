@@ -0,0 +1,91 @@
+"""pm-interview-coach/tests/test_stats_rollup.py"""
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import Attempt, DailyCategoryStats, PracticeSession, Question
+from app.services.practice_rollup import rebuild_daily_stats, record_attempt
+from app.services.question_selector import _fetch_avg_scores
+from app.services.stats_engine import StatsEngine
+
+
+async def _rollup_rows(session: AsyncSession) -> list[tuple]:
+    result = await session.execute(
+        select(
+            DailyCategoryStats.day,
+            DailyCategoryStats.category,
+            DailyCategoryStats.attempt_count,
+            DailyCategoryStats.scored_count,
+            DailyCategoryStats.score_sum,
+        ).order_by(DailyCategoryStats.day, DailyCategoryStats.category)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@pytest.mark.asyncio
+async def test_incremental_rollup_matches_rebuild_and_feeds_stats(tmp_path: Path) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", future=True
+    )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    today = datetime.now(timezone.utc)
+    yesterday = today - timedelta(days=1)
+    attempts = [
+        ("strategy", today, 8.0),
+        ("strategy", today, 6.0),
+        ("strategy", yesterday, None),
+        ("metrics", yesterday, 3.0),
+    ]
+
+    async with session_factory() as session:
+        questions = {
+            category: Question(category=category, question_text=f"{category}?", source="test")
+            for category in ("strategy", "metrics", "design")
+        }
+        session.add_all([*questions.values(), PracticeSession(id="s1")])
+        await session.flush()
+        for category, created_at, score in attempts:
+            session.add(
+                Attempt(
+                    question_id=questions[category].id,
+                    session_id="s1",
+                    answer_text="answer",
+                    overall_score=score,
+                    created_at=created_at,
+                )
+            )
+            await record_attempt(session, category, created_at, score)
+        await session.commit()
+
+        incremental = await _rollup_rows(session)
+        assert (today.date(), "strategy", 2, 2, 14.0) in incremental
+        assert (yesterday.date(), "strategy", 1, 0, 0.0) in incremental
+
+        await rebuild_daily_stats(session)
+        assert await _rollup_rows(session) == incremental
+
+        stats = StatsEngine(session)
+        overview = await stats.overview()
+        assert overview["total_practiced"] == 4
+        assert overview["avg_score"] == pytest.approx(17.0 / 3)
+        assert overview["weakest_category"] == "metrics"
+        assert overview["streak"] == 2
+
+        assert await stats.by_category() == [
+            {"category": "design", "avg_score": 0.0},
+            {"category": "metrics", "avg_score": 3.0},
+            {"category": "strategy", "avg_score": 7.0},
+        ]
+        assert [row["count"] for row in await stats.heatmap()] == [2, 2]
+        assert [row["avg_score"] for row in await stats.trend()] == [3.0, 7.0]
+        assert await _fetch_avg_scores(session) == {"metrics": 3.0, "strategy": 7.0}
+
+    await engine.dispose()
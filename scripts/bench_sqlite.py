@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the SQLite engine layer in app/database.py.
+
+Runs a mixed read/write workload (likes lookups and inserts, the site's
+hottest write path) from several threads against a throwaway database file,
+once with the old engine setup (one StaticPool connection shared by every
+thread, default pragmas) and once with create_db_engine() (pooled
+connections, WAL, synchronous=NORMAL, busy_timeout, mmap, cache_size).
+
+The legacy run holds a lock around each unit of work: a single sqlite3
+connection is not safe to use from several threads at once (concurrent use
+corrupts driver state), so the old setup effectively serialized everything.
+
+Run:
+  python scripts/bench_sqlite.py
+  python scripts/bench_sqlite.py --threads 16 --seconds 10 --write-ratio 0.2
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import nullcontext
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "code"))
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, create_db_engine
+from app.models.like import Like
+
+SLUGS = [f"post-{i}" for i in range(50)]
+
+
+def legacy_engine(url: str):
+    return create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+
+def seed(engine, rows: int) -> None:
+    Base.metadata.create_all(bind=engine, tables=[Like.__table__])
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add_all(Like(blog_post_slug=random.choice(SLUGS), user_id=str(uuid.uuid4())) for _ in range(rows))
+        db.commit()
+
+
+def worker(Session, gate, deadline: float, write_ratio: float, results: dict, lock: threading.Lock) -> None:
+    reads, writes, errors = [], [], 0
+    rng = random.Random()
+    while time.perf_counter() < deadline:
+        slug = rng.choice(SLUGS)
+        started = time.perf_counter()
+        try:
+            with gate, Session() as db:
+                if rng.random() < write_ratio:
+                    db.add(Like(blog_post_slug=slug, user_id=str(uuid.uuid4())))
+                    db.commit()
+                    writes.append(time.perf_counter() - started)
+                else:
+                    db.execute(select(func.count()).select_from(Like).where(Like.blog_post_slug == slug)).scalar()
+                    reads.append(time.perf_counter() - started)
+        except Exception:
+            errors += 1
+    with lock:
+        results["reads"].extend(reads)
+        results["writes"].extend(writes)
+        results["errors"] += errors
+
+
+def run(name: str, engine, args, serialize: bool) -> None:
+    Session = sessionmaker(bind=engine)
+    results = {"reads": [], "writes": [], "errors": 0}
+    lock = threading.Lock()
+    gate = threading.Lock() if serialize else nullcontext()
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(target=worker, args=(Session, gate, deadline, args.write_ratio, results, lock))
+        for _ in range(args.threads)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.dispose()
+
+    def pct(values, q):
+        return statistics.quantiles(values, n=100)[q - 1] * 1000 if len(values) >= 2 else float("nan")
+
+    total = len(results["reads"]) + len(results["writes"])
+    print(f"\n{name}")
+    print(f"  ops/s        {total / args.seconds:10.0f}   (errors: {results['errors']})")
+    print(f"  reads        {len(results['reads']):10d}   p50 {pct(results['reads'], 50):7.2f} ms   p95 {pct(results['reads'], 95):7.2f} ms")
+    print(f"  writes       {len(results['writes']):10d}   p50 {pct(results['writes'], 50):7.2f} ms   p95 {pct(results['writes'], 95):7.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mixed read/write SQLite benchmark")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--rows", type=int, default=20000, help="likes seeded before each run")
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads, {args.seconds:.0f}s, {args.write_ratio:.0%} writes, {args.rows} seeded rows")
+    for name, factory, serialize in (
+        ("legacy: StaticPool, default pragmas", legacy_engine, True),
+        ("tuned: create_db_engine()", create_db_engine, False),
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            seed(factory(url), args.rows)
+            run(name, factory(url), args, serialize)
+
+
+if __name__ == "__main__":
+    main()
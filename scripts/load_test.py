@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Concurrent load test for the site's hot routes: home, feed, blog list/detail,
+like toggles and the JoSAA page.
+
+Fires requests with N concurrent clients and reports latency percentiles per
+route. Run in-process (default) it also samples event-loop lag: a probe task
+asks to wake every 10 ms and records how late it actually ran. Any sync DB
+call made on the loop shows up directly as lag and as p99 latency on every
+concurrent request, not just its own.
+
+Needs httpx (pip install httpx).
+
+Run:
+  python scripts/load_test.py                          # in-process, against ./fullstackpm.db
+  python scripts/load_test.py --concurrency 64 --requests 2000
+  python scripts/load_test.py --url http://localhost:8001   # against a running server
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "code"))
+os.chdir(Path(__file__).resolve().parent.parent / "code")
+
+import httpx
+
+LAG_INTERVAL = 0.01
+
+
+def percentile(values, q):
+    if not values:
+        return float("nan")
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+async def lag_probe(samples: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(time.perf_counter() - started - LAG_INTERVAL)
+
+
+async def run(client: httpx.AsyncClient, routes, total: int, concurrency: int) -> dict:
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(routes[i % len(routes)])
+
+    async def worker() -> None:
+        while True:
+            try:
+                method, path = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path)
+                if response.status_code >= 500:
+                    errors[path] += 1
+            except httpx.HTTPError:
+                errors[path] += 1
+            latencies[f"{method} {path}"].append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {"latencies": latencies, "errors": errors}
+
+
+def report(result: dict, elapsed: float, lag: list) -> None:
+    all_latencies = [v for values in result["latencies"].values() for v in values]
+    print(f"\n{len(all_latencies)} requests in {elapsed:.2f}s ({len(all_latencies) / elapsed:.0f} req/s)\n")
+    print(f"{'route':42s} {'n':>6s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'max ms':>8s} {'5xx':>5s}")
+    for route, values in sorted(result["latencies"].items()):
+        ms = [v * 1000 for v in values]
+        print(
+            f"{route:42s} {len(ms):6d} {percentile(ms, 50):8.1f} {percentile(ms, 95):8.1f} "
+            f"{percentile(ms, 99):8.1f} {max(ms):8.1f} {result['errors'].get(route.split(' ', 1)[1], 0):5d}"
+        )
+    if lag:
+        ms = [v * 1000 for v in lag]
+        print(f"\nevent-loop lag: p50 {percentile(ms, 50):.1f} ms  p99 {percentile(ms, 99):.1f} ms  max {max(ms):.1f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent load test for hot routes")
+    parser.add_argument("--url", help="Base URL of a running server; omit to run the app in-process")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=30)
+        lifespan = None
+    else:
+        from app.main import app
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver", timeout=30)
+        lifespan = app.router.lifespan_context(app)
+
+    async with client:
+        if lifespan is not None:
+            await lifespan.__aenter__()
+        try:
+            blog = await client.get("/blog")
+            match = re.search(r'href="/blog/([\w-]+)"', blog.text)
+            slug = match.group(1) if match else "missing"
+            routes = [
+                ("GET", "/"),
+                ("GET", "/feed"),
+                ("GET", "/blog"),
+                ("GET", f"/blog/{slug}"),
+                ("POST", f"/api/blog/{slug}/like"),
+                ("GET", "/tools/josaa-top-25"),
+            ]
+            print(f"{args.requests} requests, {args.concurrency} concurrent, {len(routes)} routes")
+
+            lag: list = []
+            stop = asyncio.Event()
+            probe = asyncio.create_task(lag_probe(lag, stop)) if lifespan is not None else None
+            started = time.perf_counter()
+            result = await run(client, routes, args.requests, args.concurrency)
+            elapsed = time.perf_counter() - started
+            stop.set()
+            if probe:
+                await probe
+            report(result, elapsed, lag)
+        finally:
+            if lifespan is not None:
+                await lifespan.__aexit__(None, None, None)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
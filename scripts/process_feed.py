@@ -15,6 +15,7 @@ Run:
   python scripts/process_feed.py               # full pipeline + sync
   python scripts/process_feed.py --no-sync     # process locally only, don't push to Render
   python scripts/process_feed.py --sync-only   # skip processing, just push existing local DB to Render
+  python scripts/process_feed.py --full-sync   # resend every article, not just new/changed ones
 """
 
 import argparse
@@ -35,6 +36,7 @@ from app.database import SessionLocal, init_db, ensure_feed_layer2_columns
 from app.models.feed_article import FeedArticle
 from app.services.feed_service import feed_service
 from app.services.ai_processing_service import ai_processing_service
+from app.services import feed_sync
 
 RENDER_URL = os.environ.get("RENDER_URL", "https://fullstackpm.tech")
 EDITORIAL_TOKEN = os.environ.get("EDITORIAL_TOKEN", "fspm-editorial-2026")
@@ -61,6 +63,7 @@ def generate_analyses(db):
         .filter(FeedArticle.ai_processed_at.isnot(None))
         .filter(FeedArticle.ai_article_analysis.is_(None))
         .filter(FeedArticle.is_dismissed == False)
+        .filter(FeedArticle.duplicate_of.is_(None))
         .order_by(FeedArticle.ai_score.desc().nullslast())
         .limit(MAX_ANALYSIS_PER_RUN)
         .all()
@@ -75,53 +78,47 @@ def generate_analyses(db):
     return done
 
 
-def serialize(a: FeedArticle) -> dict:
-    return {
-        "url": a.url,
-        "title": a.title,
-        "display_title": a.display_title,
-        "excerpt": a.excerpt,
-        "source_name": a.source_name,
-        "source_category": a.source_category,
-        "published_at": a.published_at.isoformat() if a.published_at else None,
-        "ai_score": a.ai_score,
-        "ai_score_reason": a.ai_score_reason,
-        "ai_summary": a.ai_summary,
-        "first_principle": a.first_principle,
-        "key_insight": a.key_insight,
-        "ai_insight": a.ai_insight,
-        "ai_article_analysis": a.ai_article_analysis,
-        "ai_processed_at": a.ai_processed_at.isoformat() if a.ai_processed_at else None,
-    }
-
-
-def sync_to_render(db):
+def _request(method, path, data=None, headers=None, timeout=60):
+    url = f"{RENDER_URL}{path}?token={urllib.parse.quote(EDITORIAL_TOKEN)}"
+    req = urllib.request.Request(url, data=data, headers=headers or {}, method=method)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def sync_to_render(db, full=False):
+    """Push new or changed articles as gzip'd NDJSON chunks (see app/services/feed_sync.py)."""
+    manifest = {} if full else _request("GET", "/api/feed/sync/manifest")["hashes"]
     articles = (
         db.query(FeedArticle)
         .filter(FeedArticle.is_dismissed == False)
-        .all()
+        .filter(FeedArticle.duplicate_of.is_(None))
+        .yield_per(200)
     )
-    payload = json.dumps({"articles": [serialize(a) for a in articles]}).encode()
-    url = f"{RENDER_URL}/api/feed/sync?token={urllib.parse.quote(EDITORIAL_TOKEN)}"
-    print(f"  Syncing {len(articles)} articles to {RENDER_URL}...")
+    chunks = feed_sync.ndjson_chunks(feed_sync.changed_payloads(articles, manifest))
+    print(f"  Syncing to {RENDER_URL} ({len(manifest)} articles already there)...")
+    sent = inserted = updated = 0
     try:
-        req = urllib.request.Request(
-            url, data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            result = json.loads(resp.read())
-        print(f"  Sync complete: {result}")
+        for count, body in chunks:
+            result = _request(
+                "POST", "/api/feed/sync", data=body,
+                headers={"Content-Type": feed_sync.NDJSON_MEDIA_TYPE, "Content-Encoding": "gzip"},
+            )
+            sent += count
+            inserted += result.get("inserted", 0)
+            updated += result.get("updated", 0)
+            print(f"    chunk: {count} articles, {len(body) // 1024} KiB -> {result}")
     except Exception as exc:
-        print(f"  Sync failed: {exc}")
+        # Applied chunks are committed server-side; the next run resends only the rest.
+        print(f"  Sync failed after {sent} articles: {exc}")
         raise
+    print(f"  Sync complete: {sent} sent, {inserted} inserted, {updated} updated")
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--no-sync", action="store_true", help="Skip pushing to Render")
     parser.add_argument("--sync-only", action="store_true", help="Skip processing, just sync")
+    parser.add_argument("--full-sync", action="store_true", help="Resend every article, ignoring the server manifest")
     args = parser.parse_args()
 
     if not os.environ.get("ANTHROPIC_API_KEY") and not args.sync_only:
@@ -144,7 +141,7 @@ def main():
 
         if not args.no_sync:
             print("\n[3/3] Sync to Render")
-            sync_to_render(db)
+            sync_to_render(db, full=args.full_sync)
         else:
             print("\n[skip] Sync skipped (--no-sync)")
 
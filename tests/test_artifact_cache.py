@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import gzip
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+from starlette.requests import Request
+
+from app.services.artifact_cache import ArtifactCache, file_stamp, stamp_time
+
+
+def _request(**headers: str) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/feed.xml", "headers": raw})
+
+
+def test_gzip_and_identity_bodies_have_their_own_etags() -> None:
+    cache = ArtifactCache()
+    artifact = cache.get_or_build("feed", 1, lambda: "<rss/>" * 50)
+
+    zipped = cache.respond(_request(accept_encoding="br, gzip;q=0.8"), artifact)
+    plain = cache.respond(_request(accept_encoding="gzip;q=0, deflate"), artifact)
+    starred = cache.respond(_request(accept_encoding="*;q=0.5"), artifact)
+
+    assert zipped.headers["content-encoding"] == "gzip" and gzip.decompress(zipped.body) == artifact.body
+    assert "content-encoding" not in plain.headers and plain.body == artifact.body
+    assert starred.headers["content-encoding"] == "gzip"
+    assert zipped.headers["etag"] == artifact.gzip_etag != plain.headers["etag"] == artifact.etag
+    assert zipped.headers["vary"] == plain.headers["vary"] == "Accept-Encoding"
+
+    # A validator only matches the representation it was issued for.
+    assert cache.respond(_request(accept_encoding="gzip", if_none_match=artifact.gzip_etag), artifact).status_code == 304
+    assert cache.respond(_request(if_none_match=artifact.gzip_etag), artifact).status_code == 200
+    assert cache.respond(_request(if_none_match=f"W/{artifact.etag}"), artifact).status_code == 304
+
+
+def test_last_modified_is_the_newest_source_mtime(tmp_path: Path) -> None:
+    old, new = tmp_path / "a.json", tmp_path / "b.json"
+    old.write_text("a")
+    new.write_text("b")
+    os.utime(old, (1_700_000_000, 1_700_000_000))
+    os.utime(new, (1_750_000_000, 1_750_000_000))
+    stamp = file_stamp(old, new, tmp_path / "missing.json")
+    cache = ArtifactCache()
+
+    artifact = cache.get_or_build("feed", stamp, lambda: "<rss>1</rss>", last_modified=stamp_time(stamp))
+    assert artifact.last_modified == datetime.fromtimestamp(1_750_000_000, tz=timezone.utc)
+    since = format_datetime(artifact.last_modified, usegmt=True)
+    assert cache.respond(_request(if_modified_since=since), artifact).status_code == 304
+
+    # Output changed with no newer source (e.g. a scheduled post went live):
+    # Last-Modified still moves forward so If-Modified-Since clients refetch.
+    changed = cache.get_or_build("feed", (stamp, 2), lambda: "<rss>2</rss>", last_modified=stamp_time(stamp))
+    assert changed.last_modified > artifact.last_modified
+    assert cache.respond(_request(if_modified_since=since), changed).status_code == 200
+    assert stamp_time(file_stamp(tmp_path / "missing.json")) is None
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+from app.services.audio_assembly import assemble, ffmetadata, plan_chapters
+
+
+class FakeFFmpeg:
+    """Answers ffprobe from a table and 'encodes' by writing the output file."""
+
+    def __init__(self, formats: dict) -> None:
+        self.formats = formats
+        self.commands: list = []
+        self.metadata: list = []
+
+    def __call__(self, cmd, capture_output=True, text=True):
+        self.commands.append(cmd)
+        if cmd[0] == "ffprobe":
+            codec, rate, channels, bit_rate, seconds = self.formats[Path(cmd[-1]).name]
+            stdout = json.dumps({
+                "streams": [{"codec_name": codec, "sample_rate": str(rate), "channels": channels, "bit_rate": str(bit_rate)}],
+                "format": {"duration": str(seconds)},
+            })
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+        for index, arg in enumerate(cmd):
+            if arg == "-i" and cmd[index + 1].endswith(".ffmeta"):
+                self.metadata.append(Path(cmd[index + 1]).read_text())
+        Path(cmd[-1]).write_bytes(b"audio")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+
+def _segments(tmp_path: Path, names: list) -> list:
+    segments = []
+    for name in names:
+        path = tmp_path / f"{name}.mp3"
+        path.write_bytes(b"x")
+        segments.append((path, name.title()))
+    return segments
+
+
+def test_matching_segments_are_stream_copied_with_chapters(tmp_path: Path) -> None:
+    edge = ("mp3", 24000, 1, 48000, 2.0)
+    ffmpeg = FakeFFmpeg({"believer.mp3": edge, "skeptic.mp3": edge, "realist.mp3": edge,
+                         "gap.mp3": ("mp3", 24000, 1, 48000, 0.336)})
+    out = tmp_path / "episode.mp3"
+
+    result = assemble(_segments(tmp_path, ["believer", "skeptic", "realist"]), out, runner=ffmpeg)
+
+    assert result.mode == "copy"
+    encodes = [cmd for cmd in ffmpeg.commands if cmd[0] == "ffmpeg"]
+    assert len(encodes) == 2  # the gap clip, then one stream copy
+    assert "copy" in encodes[1] and "libmp3lame" not in encodes[1]
+    assert [(c.start_ms, c.end_ms) for c in result.chapters] == [(0, 2336), (2336, 4672), (4672, 6672)]
+    assert ffmpeg.metadata[0].count("[CHAPTER]") == 3 and "title=Skeptic" in ffmpeg.metadata[0]
+    assert out.read_bytes() == b"audio"
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".assemble-")] == []
+
+
+def test_mismatched_segments_use_one_normalizing_filter_graph(tmp_path: Path) -> None:
+    ffmpeg = FakeFFmpeg({
+        "host.mp3": ("mp3", 24000, 1, 48000, 1.5),
+        "guest.mp3": ("mp3", 44100, 2, 128000, 3.0),
+        "outro.mp3": ("aac", 48000, 2, 96000, 1.0),
+    })
+
+    result = assemble(_segments(tmp_path, ["host", "guest", "outro"]), tmp_path / "ep.mp3", gap_ms=500, runner=ffmpeg)
+
+    assert result.mode == "reencode"
+    [encode] = [cmd for cmd in ffmpeg.commands if cmd[0] == "ffmpeg"]
+    graph = encode[encode.index("-filter_complex") + 1]
+    assert graph.count("loudnorm=") == 3 and graph.count("apad=pad_dur=0.500") == 2
+    assert "concat=n=3:v=0:a=1[out]" in graph and "channel_layouts=stereo" in graph
+    assert result.duration_ms == 1500 + 500 + 3000 + 500 + 1000
+
+
+def test_chapter_metadata_escapes_titles() -> None:
+    chapters = plan_chapters([1000], ["Q&A; part=1"], gap_ms=300)
+    assert chapters[0].end_ms == 1000
+    assert "title=Q&A\\; part\\=1" in ffmetadata(chapters)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.services.content import ContentService
+
+
+def _write_post(blog_dir: Path, name: str, title: str, body: str) -> Path:
+    path = blog_dir / name
+    path.write_text(f"---\ntitle: {title}\ndate: 2026-01-05\ntags: [pm]\n---\n{body}\n")
+    return path
+
+
+def _make_content(tmp_path: Path) -> Path:
+    (tmp_path / "blog").mkdir()
+    (tmp_path / "projects").mkdir()
+    _write_post(tmp_path / "blog", "2026-01-05-first.md", "First", "Hello *world*")
+    _write_post(tmp_path / "blog", "2026-01-05-second.md", "Second", "Second body")
+    return tmp_path
+
+
+def test_bundle_round_trip_matches_fresh_parse(tmp_path: Path) -> None:
+    content_dir = _make_content(tmp_path)
+    fresh = ContentService(content_dir)
+    fresh.load()
+
+    assert ContentService(content_dir).build_bundle() == 2
+
+    bundled = ContentService(content_dir)
+    bundled.load()
+    assert [p.model_dump() for p in bundled.get_posts()[0]] == [p.model_dump() for p in fresh.get_posts()[0]]
+    assert bundled.get_post_by_slug("first").html_content == "<p>Hello <em>world</em></p>"
+
+
+def test_changed_file_is_reparsed_not_served_from_bundle(tmp_path: Path) -> None:
+    content_dir = _make_content(tmp_path)
+    ContentService(content_dir).build_bundle()
+    _write_post(content_dir / "blog", "2026-01-05-first.md", "First (edited)", "Edited body")
+
+    service = ContentService(content_dir)
+    service.load()
+    post = service.get_post_by_slug("first")
+    assert post.title == "First (edited)"
+    assert post.html_content == "<p>Edited body</p>"
+
+
+def test_indexes_cover_slug_tag_and_month_lookups(tmp_path: Path) -> None:
+    content_dir = _make_content(tmp_path)
+    (content_dir / "blog" / "2025-12-30-third.md").write_text(
+        "---\ntitle: Third\ndate: 2025-12-30\ntags: [PM, AI]\n---\nBody\n"
+    )
+    service = ContentService(content_dir)
+    service.load()
+
+    assert service.get_post_by_slug("third").title == "Third"
+    assert service.get_post_by_slug("missing") is None
+    posts, total = service.get_posts_by_tag("pm")
+    assert total == 3
+    assert [p.slug for p in posts][-1] == "third"
+    assert [p.slug for p in service.get_posts_by_tag("ai")[0]] == ["third"]
+    assert [g["month"] for g in service.get_posts_by_month()] == ["January 2026", "December 2025"]
+
+
+def test_refresh_reparses_changed_files_and_promotes_scheduled_posts(tmp_path: Path) -> None:
+    content_dir = _make_content(tmp_path)
+    scheduled = content_dir / "blog" / "2099-01-01-later.md"
+    scheduled.write_text("---\ntitle: Later\ndate: 2099-01-01\n---\nSoon\n")
+    service = ContentService(content_dir)
+    service.load()
+    before = service.get_post_by_slug("first")
+
+    assert service.get_post_by_slug("later") is None
+    assert service.seconds_until_next_publish() > 0
+    assert service.refresh() is False
+
+    _write_post(content_dir / "blog", "2026-02-01-new.md", "New", "Fresh")
+    scheduled.write_text("---\ntitle: Later\ndate: 2026-01-01\n---\nNow\n")
+    assert service.refresh() is True
+    assert service.get_post_by_slug("new").title == "New"
+    assert service.get_post_by_slug("later").html_content == "<p>Now</p>"
+    assert service.get_post_by_slug("first") is before  # unchanged file not re-parsed
+    assert service.seconds_until_next_publish() is None
+
+    (content_dir / "blog" / "2026-02-01-new.md").unlink()
+    assert service.refresh() is True
+    assert service.get_post_by_slug("new") is None
+
+
+def test_refresh_without_rescan_only_publishes_due_posts(tmp_path: Path) -> None:
+    content_dir = _make_content(tmp_path)
+    service = ContentService(content_dir)
+    service.load()
+
+    _write_post(content_dir / "blog", "2026-02-01-new.md", "New", "Fresh")
+    assert service.refresh(rescan=False) is False
+    assert service.get_post_by_slug("new") is None
+    assert service.refresh() is True
+    assert service.get_post_by_slug("new").title == "New"
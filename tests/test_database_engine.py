@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.database import create_db_engine
+
+
+def test_sqlite_engine_applies_pragmas_and_pools_connections(tmp_path: Path) -> None:
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'site.db'}")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        with engine.connect() as other:
+            assert other.connection.dbapi_connection is not conn.connection.dbapi_connection
+    engine.dispose()
+
+
+def test_read_only_engine_rejects_writes(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'site.db'}"
+    writer = create_db_engine(url)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    reader = create_db_engine(url, read_only=True)
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+    reader.dispose()
+    writer.dispose()
+
+
+def test_async_engine_uses_async_driver_and_same_pragmas(tmp_path: Path) -> None:
+    import asyncio
+
+    from app.database import _async_url, create_async_db_engine
+
+    assert _async_url("sqlite:///./x.db") == "sqlite+aiosqlite:///./x.db"
+    assert _async_url("postgres://u@h/db") == "postgresql+asyncpg://u@h/db"
+    with pytest.raises(ValueError, match="mysql"):
+        _async_url("mysql://u@h/db")
+
+    async def check() -> tuple:
+        engine = create_async_db_engine(f"sqlite:///{tmp_path / 'site.db'}")
+        try:
+            async with engine.connect() as conn:
+                mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+        finally:
+            await engine.dispose()
+        return mode, timeout
+
+    assert asyncio.run(check()) == ("wal", 5000)
+
+
+def test_async_engine_is_created_on_first_session(monkeypatch) -> None:
+    from app import database
+
+    monkeypatch.setattr(database, "_async_engines", {})
+    monkeypatch.setattr(database.settings, "database_url", "mysql://u@h/db")
+    sessions = database._LazyAsyncSessionmaker()  # no engine yet, so nothing to fail
+    assert database._async_engines == {}
+    with pytest.raises(ValueError, match="mysql"):
+        sessions()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.like import Like
+from app.models.post_stats import PostStats
+from app.services.engagement import LikeBuffer, get_counts, record_comment
+
+
+def _session_factory(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'engagement.db'}")
+    Base.metadata.create_all(bind=engine, tables=[Like.__table__, PostStats.__table__])
+    return sessionmaker(bind=engine)
+
+
+def test_toggles_are_buffered_coalesced_and_flushed_in_one_batch(tmp_path: Path) -> None:
+    Session = _session_factory(tmp_path)
+    buffer = LikeBuffer(session_factory=Session)
+    db = Session()
+
+    assert buffer.toggle(db, "post", "alice") == (1, True)
+    assert buffer.toggle(db, "post", "bob") == (2, True)
+    assert buffer.toggle(db, "post", "carol") == (3, True)
+    assert buffer.toggle(db, "post", "carol") == (2, False)  # coalesced away
+    assert db.query(Like).count() == 0
+
+    assert buffer.flush() == 2
+    db.expire_all()
+    assert db.query(Like).count() == 2
+    assert get_counts(db, ["post", "other"]) == {"post": (2, 0), "other": (0, 0)}
+    assert buffer.state(db, "post", "alice") == (2, True)
+
+    assert buffer.toggle(db, "post", "alice") == (1, False)
+    assert buffer.flush() == 1
+    db.expire_all()
+    assert get_counts(db, ["post"])["post"] == (1, 0)
+    assert buffer.state(db, "post", "alice") == (1, False)
+    db.close()
+
+
+def test_buffer_flushes_when_full_and_counts_comments(tmp_path: Path) -> None:
+    Session = _session_factory(tmp_path)
+    buffer = LikeBuffer(session_factory=Session, max_pending=2)
+    db = Session()
+
+    buffer.toggle(db, "post", "a")
+    buffer.toggle(db, "post", "b")  # hits max_pending -> flushed inline
+    assert db.query(Like).count() == 2
+
+    record_comment(db, "post")
+    db.commit()
+    assert get_counts(db, ["post"])["post"] == (2, 1)
+    db.close()
+
+
+def test_bulk_state_merges_counts_and_visitor_likes(tmp_path: Path) -> None:
+    Session = _session_factory(tmp_path)
+    buffer = LikeBuffer(session_factory=Session)
+    db = Session()
+
+    buffer.toggle(db, "a", "me")
+    buffer.toggle(db, "b", "someone")
+    buffer.flush()
+    buffer.toggle(db, "b", "me")  # still buffered
+    record_comment(db, "c")
+    db.commit()
+
+    state = buffer.bulk_state(db, ["a", "b", "c", "a"], "me")
+    assert list(state) == ["a", "b", "c"]
+    assert state["a"] == {"like_count": 1, "comment_count": 0, "liked": True}
+    assert state["b"] == {"like_count": 2, "comment_count": 0, "liked": True}
+    assert state["c"] == {"like_count": 0, "comment_count": 1, "liked": False}
+    assert buffer.bulk_state(db, ["a"], None)["a"]["liked"] is False
+    db.close()
+
+
+def test_concurrent_writers_do_not_lose_counts(tmp_path: Path) -> None:
+    Session = _session_factory(tmp_path)
+    Session().close()
+
+    def comment_writer() -> None:
+        for _ in range(25):
+            db = Session()
+            record_comment(db, "post")
+            db.commit()
+            db.close()
+
+    def like_writer(worker: int) -> None:
+        buffer = LikeBuffer(session_factory=Session)
+        db = Session()
+        for visitor in range(10):
+            buffer.toggle(db, "post", f"{worker}-{visitor}")
+            buffer.flush()
+        db.close()
+
+    threads = [threading.Thread(target=comment_writer) for _ in range(8)]
+    threads += [threading.Thread(target=like_writer, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    db = Session()
+    assert get_counts(db, ["post"])["post"] == (40, 200)
+    db.close()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from app.services.episode_catalogue import EpisodeCatalogue
+
+
+def _write_manifest(path: Path, slugs: list[str], mtime_ns: int) -> None:
+    episodes = [
+        {"slug": slug, "title": slug.title(), "date": f"2026-0{8 - i}-01", "tags": ["AI"] if i else ["pm"]}
+        for i, slug in enumerate(slugs)
+    ]
+    path.write_text(json.dumps({"episodes": episodes}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_snapshot_indexes_and_neighbours(tmp_path: Path) -> None:
+    manifest = tmp_path / "episodes.json"
+    _write_manifest(manifest, ["newest", "middle", "oldest"], 1_000_000_000)
+    snap = EpisodeCatalogue(manifest).snapshot()
+
+    assert snap.get("middle")["title"] == "Middle"
+    assert snap.get("missing") is None
+    previous, following = snap.neighbours("middle")
+    assert previous["slug"] == "oldest" and following["slug"] == "newest"
+    assert snap.neighbours("newest") == (snap.get("middle"), None)
+    assert snap.tags == ("AI", "pm")
+
+
+def test_snapshot_reloads_only_when_manifest_changes(tmp_path: Path) -> None:
+    manifest = tmp_path / "episodes.json"
+    _write_manifest(manifest, ["one"], 1_000_000_000)
+    catalogue = EpisodeCatalogue(manifest)
+    first = catalogue.snapshot()
+    assert catalogue.snapshot() is first
+
+    _write_manifest(manifest, ["one", "two"], 2_000_000_000)
+    second = catalogue.snapshot()
+    assert second is not first and second.get("two") is not None
+
+    manifest.write_text("{not json")
+    survivor = catalogue.snapshot()
+    assert survivor.get("two") is not None  # last good episodes survive a bad write
+    assert catalogue.snapshot() is survivor  # ...and the bad file is not re-read
+
+    manifest.write_text("[]")
+    os.utime(manifest, ns=(3_000_000_000, 3_000_000_000))
+    assert catalogue.snapshot().get("two") is not None
+
+
+def test_missing_or_malformed_manifest_is_empty(tmp_path: Path) -> None:
+    snap = EpisodeCatalogue(tmp_path / "nope.json").snapshot()
+    assert snap.episodes == () and snap.get("x") is None
+
+    manifest = tmp_path / "episodes.json"
+    manifest.write_text('"just a string"')
+    assert EpisodeCatalogue(manifest).snapshot().episodes == ()
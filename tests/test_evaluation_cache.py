@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+
+from app.services.evaluation_cache import EvaluationCache, answer_fingerprint, minhash, similarity
+
+ANSWER = (
+    "I would start by clarifying the goal, which is helping hungry users find restaurants "
+    "they have not tried yet. Then I would segment users into explorers and loyalists, pick "
+    "explorers, list their pain points, and prioritise a personalised discovery feed measured "
+    "by first orders from new restaurants."
+)
+
+
+def test_fingerprint_ignores_case_punctuation_and_whitespace() -> None:
+    assert answer_fingerprint("Hello,   World!") == answer_fingerprint("hello world")
+    assert answer_fingerprint("hello world") != answer_fingerprint("hello there world")
+
+
+def test_exact_and_near_duplicate_hits_are_per_question() -> None:
+    cache = EvaluationCache(near_threshold=0.9)
+    cache.put("pd_1", ANSWER, "evaluation")
+
+    assert cache.get("pd_1", ANSWER.upper()) == "evaluation"
+    assert cache.get("pd_1", ANSWER.replace("tried yet", "tried before")) == "evaluation"
+    assert cache.get("pd_2", ANSWER) is None
+    assert cache.get("pd_1", "A completely different answer about pricing strategy.") is None
+    assert (cache.hits, cache.near_hits, cache.misses) == (1, 1, 2)
+
+
+def test_changed_conclusion_or_length_is_not_a_near_match() -> None:
+    cache = EvaluationCache(near_threshold=0.9)
+    cache.put("pd_1", ANSWER, "evaluation")
+
+    flipped = ANSWER.replace("first orders from new restaurants", "first orders from old restaurants")
+    assert similarity(minhash(flipped), minhash(ANSWER)) >= 0.8
+    assert cache.get("pd_1", flipped) is None
+    padded = ANSWER.replace("Then I would", "Then, after some quick research on the market, I would")
+    assert cache.get("pd_1", padded) is None
+
+
+def test_near_matching_is_off_by_default_and_short_answers_never_near_match() -> None:
+    exact_only = EvaluationCache()
+    exact_only.put("pd_1", ANSWER, "evaluation")
+    assert exact_only.get("pd_1", ANSWER.replace("tried yet", "tried before")) is None
+
+    assert minhash("too short to compare") is None
+    signature = minhash(ANSWER)
+    assert similarity(signature, signature) == 1.0
+
+
+def test_entries_expire_and_least_recently_used_is_evicted() -> None:
+    cache = EvaluationCache(ttl_seconds=0.05, max_entries=2)
+    cache.put("q", "first answer", 1)
+    time.sleep(0.06)
+    assert cache.get("q", "first answer") is None
+    assert len(cache) == 0
+
+    cache = EvaluationCache(max_entries=2)
+    cache.put("q", "a", 1)
+    cache.put("q", "b", 2)
+    cache.get("q", "a")
+    cache.put("q", "c", 3)
+    assert cache.get("q", "b") is None
+    assert (cache.get("q", "a"), cache.get("q", "c")) == (1, 3)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from app.services.feed_dedup import (
+    article_fingerprint,
+    canonical_url,
+    find_near_duplicate,
+    hamming,
+    simhash,
+)
+
+
+def test_canonical_url_strips_tracking_and_host_variants() -> None:
+    a = canonical_url("http://www.example.com/post/?utm_source=rss&utm_medium=feed&id=7#comments")
+    b = canonical_url("https://example.com/post?id=7&fbclid=abc")
+    assert a == b == "https://example.com/post?id=7"
+
+
+def test_canonical_url_collapses_medium_mirrors() -> None:
+    a = canonical_url("https://medium.com/product-coalition/why-roadmaps-fail-1a2b3c4d5e6f?source=rss")
+    b = canonical_url("https://productcoalition.medium.com/why-roadmaps-fail-1a2b3c4d5e6f")
+    assert a == b == "https://medium.com/p/1a2b3c4d5e6f"
+
+
+def test_simhash_is_stable_and_close_for_near_duplicates() -> None:
+    text = (
+        "Amazon Web Services announced a new serverless vector database today, "
+        "aimed at teams building retrieval augmented generation into their products "
+        "without running their own clusters or managing index shards by hand."
+    )
+    edited = text.replace("today", "this week")
+    unrelated = "Ten lessons from running discovery interviews with enterprise buyers in regulated industries."
+
+    assert simhash(text) == simhash(text)
+    assert hamming(simhash(text), simhash(edited)) < hamming(simhash(text), simhash(unrelated))
+    assert simhash("") is None
+
+
+def test_find_near_duplicate_picks_closest_within_threshold() -> None:
+    fp = article_fingerprint("OpenAI ships new reasoning model", "The model beats prior benchmarks on math.")
+    candidates = [
+        (1, article_fingerprint("Ten lessons from discovery interviews", "Enterprise buyers are different.")),
+        (2, fp),
+        (3, None),
+    ]
+    assert find_near_duplicate(fp, candidates) == 2
+    assert find_near_duplicate(fp, candidates[:1]) is None
+    assert find_near_duplicate(None, candidates) is None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import gzip
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.feed_article import FeedArticle
+from app.services import feed_sync
+
+
+def _session(tmp_path: Path, name: str):
+    engine = create_engine(f"sqlite:///{tmp_path / name}")
+    Base.metadata.create_all(bind=engine, tables=[FeedArticle.__table__])
+    return sessionmaker(bind=engine)()
+
+
+def _article(n: int, analysis: str = "analysis") -> FeedArticle:
+    return FeedArticle(
+        title=f"Story {n}",
+        url=f"https://example.com/{n}",
+        source_name="Example",
+        source_category="pm",
+        ai_score=7,
+        ai_article_analysis=analysis,
+        ai_processed_at=datetime(2026, 10, 1, 9, 30),
+    )
+
+
+def _push(local, server, manifest) -> int:
+    sent = 0
+    for count, body in feed_sync.ndjson_chunks(
+        feed_sync.changed_payloads(local.query(FeedArticle), manifest), max_articles=2
+    ):
+        articles = feed_sync.decode_body(body, feed_sync.NDJSON_MEDIA_TYPE, "gzip")
+        feed_sync.apply_articles(server, articles)
+        sent += count
+    return sent
+
+
+def test_only_new_or_changed_articles_are_resent(tmp_path: Path) -> None:
+    local = _session(tmp_path, "local.db")
+    server = _session(tmp_path, "server.db")
+    local.add_all([_article(n) for n in range(5)])
+    local.commit()
+
+    assert _push(local, server, feed_sync.sync_manifest(server)) == 5
+    assert server.query(FeedArticle).count() == 5
+    assert server.query(FeedArticle).first().ai_processed_at == datetime(2026, 10, 1, 9, 30)
+
+    # Editorial state set on the server survives later syncs.
+    server.query(FeedArticle).filter_by(url="https://example.com/3").one().is_editors_pick = True
+    server.commit()
+
+    assert _push(local, server, feed_sync.sync_manifest(server)) == 0
+
+    local.query(FeedArticle).filter_by(url="https://example.com/3").one().ai_article_analysis = "rewritten"
+    local.add(_article(9))
+    local.commit()
+    assert _push(local, server, feed_sync.sync_manifest(server)) == 2
+
+    server.expire_all()
+    edited = server.query(FeedArticle).filter_by(url="https://example.com/3").one()
+    assert edited.ai_article_analysis == "rewritten"
+    assert edited.is_editors_pick is True
+    assert server.query(FeedArticle).count() == 6
+
+
+def test_chunks_are_bounded_and_bodies_validated() -> None:
+    payloads = [{"url": f"u{n}", "ai_article_analysis": "x" * 400} for n in range(10)]
+    chunks = list(feed_sync.ndjson_chunks(payloads, max_articles=4, max_bytes=1000))
+    assert [count for count, _ in chunks] == [2, 2, 2, 2, 2]
+
+    legacy = b'{"articles": [{"url": "u1"}]}'
+    assert feed_sync.decode_body(legacy, "application/json") == [{"url": "u1"}]
+
+    with pytest.raises(feed_sync.SyncPayloadError):
+        feed_sync.decode_body(b"not gzip", feed_sync.NDJSON_MEDIA_TYPE, "gzip")
+    with pytest.raises(feed_sync.SyncPayloadError):
+        bomb = gzip.compress(b"\n" * (feed_sync.MAX_SYNC_BODY_BYTES + 1))
+        feed_sync.decode_body(bomb, feed_sync.NDJSON_MEDIA_TYPE, "gzip")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.intensive_progress import IntensiveActivity, IntensiveNote, IntensiveProgress
+from app.services import intensive_progress as intensive
+
+TABLES = [IntensiveProgress, IntensiveActivity, IntensiveNote]
+
+
+def _session_factory(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'intensive.db'}")
+    Base.metadata.create_all(bind=engine, tables=[model.__table__ for model in TABLES])
+    return sessionmaker(bind=engine)
+
+
+def test_logs_accumulate_and_activity_is_trimmed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(intensive, "ACTIVITY_RETENTION", 5)
+    factory = _session_factory(tmp_path)
+    # Separate sessions, as concurrent requests would have.
+    for _ in range(8):
+        db = factory()
+        progress = intensive.log_progress(db, "u1", problems=2, apps=1, interviews=0)
+        db.close()
+    intensive.log_progress(factory(), "u2", problems=1, apps=0, interviews=1)
+
+    assert progress["problemsSolved"] == 16
+    assert progress["applicationsSubmitted"] == 8
+    assert len(progress["recentActivity"]) == 5
+    db = factory()
+    assert db.query(IntensiveActivity).filter_by(user_key="u1").count() == 5
+    assert intensive.get_progress(db, "u2")["problemsSolved"] == 1
+
+    first, cursor = intensive.list_activity(db, "u1", limit=3)
+    rest, end = intensive.list_activity(db, "u1", limit=3, before=cursor)
+    ids = [item["id"] for item in first + rest]
+    assert ids == sorted(ids, reverse=True) and len(set(ids)) == 5 and end is None
+
+
+def test_notes_page_backwards_oldest_first(tmp_path: Path) -> None:
+    db = _session_factory(tmp_path)()
+    created = [intensive.create_note(db, "u1", {"content": f"n{i}", "week": 1}) for i in range(5)]
+
+    page, cursor = intensive.list_notes(db, "u1", limit=2)
+    assert [note["content"] for note in page] == ["n3", "n4"]
+    older, cursor = intensive.list_notes(db, "u1", limit=2, before=cursor)
+    assert [note["content"] for note in older] == ["n1", "n2"] and cursor is not None
+
+    assert intensive.delete_note(db, "u1", created[0]["id"])
+    assert not intensive.delete_note(db, "u2", created[1]["id"])
+    assert intensive.list_notes(db, "u1", limit=2, before=cursor) == ([], None)
+
+
+def test_legacy_files_import_once(tmp_path: Path) -> None:
+    factory = _session_factory(tmp_path)
+    (tmp_path / "intensive_progress_7.json").write_text(json.dumps({
+        "problemsSolved": 12,
+        "weeklyStats": {"1": {"problems": 12}},
+        "recentActivity": [{"message": "Logged", "timestamp": "2026-10-01T09:00:00"}],
+    }))
+    (tmp_path / "intensive_notes_7.json").write_text(json.dumps([
+        {"id": "a", "category": "win", "week": 2, "content": "first", "timestamp": "2026-10-01T09:00:00"},
+        {"id": "b", "category": "blocker", "week": "", "content": "second", "timestamp": "2026-10-02T09:00:00"},
+    ]))
+
+    assert intensive.import_legacy_files(factory, tmp_path) == 2
+    assert intensive.import_legacy_files(factory, tmp_path) == 0
+    assert sorted(p.name for p in tmp_path.glob("*.imported")) == [
+        "intensive_notes_7.json.imported", "intensive_progress_7.json.imported",
+    ]
+
+    db = factory()
+    progress = intensive.get_progress(db, "7")
+    assert progress["problemsSolved"] == 12 and progress["weeklyStats"] == {"1": {"problems": 12}}
+    assert [item["message"] for item in progress["recentActivity"]] == ["Logged"]
+    notes, _ = intensive.list_notes(db, "7")
+    assert [(n["id"], n["week"]) for n in notes] == [("a", "2"), ("b", None)]
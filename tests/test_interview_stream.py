@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import interview_coach
+from app.services.interview_evaluator import EvaluationResult
+
+client = TestClient(app)
+
+RESULT = EvaluationResult(
+    overall_score=7.5,
+    framework_score=8.0,
+    structure_score=7.0,
+    completeness_score=6.5,
+    strengths=["Clear framing"],
+    improvements=["Missing metrics"],
+    suggested_framework="CIRCLES",
+    example_point=None,
+    raw_json="{}",
+)
+
+
+class _Session:
+    added: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def add(self, row) -> None:
+        self.added.append(row)
+
+    async def commit(self) -> None:
+        return None
+
+
+def _events(body: str) -> list:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = block.split("\n")
+        name = lines[0][len("event: "):]
+        data = "\n".join(line[len("data: "):] for line in lines[1:])
+        events.append((name, data))
+    return events
+
+
+def test_submit_stream_sends_progress_then_rendered_feedback(monkeypatch) -> None:
+    async def fake_stream(**kwargs):
+        assert kwargs["question_id"] == "pd_1"
+        yield '{"overall_score": '
+        yield "7.5,\n..."
+        yield RESULT
+
+    monkeypatch.setattr(interview_coach, "stream_interview_answer", fake_stream)
+    monkeypatch.setattr(interview_coach, "AsyncSessionLocal", _Session)
+
+    response = client.post("/api/interview-coach/submit/stream", data={
+        "session_id": "s1", "question_id": "pd_1", "category": "product_design",
+        "answer_text": "Start with the users.", "time_spent_sec": "90",
+    })
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert events[:2] == [("progress", '{"overall_score": '), ("progress", "7.5,\n...")]
+    assert events[-1][0] == "result" and "Clear framing" in events[-1][1]
+    assert _Session.added[-1].session_id == "s1" and _Session.added[-1].time_spent_sec == 90
+
+
+def test_submit_stream_reports_missing_fields_as_an_error_event() -> None:
+    response = client.post("/api/interview-coach/submit/stream", data={"session_id": "s1"})
+    assert _events(response.text) == [("error", "Missing required fields")]
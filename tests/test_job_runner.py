@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.background_job import BackgroundJob
+from app.services.job_runner import JobRunner
+
+
+def _session_factory(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine, tables=[BackgroundJob.__table__])
+    return sessionmaker(bind=engine)
+
+
+def test_concurrent_submissions_collapse_into_one_run(tmp_path: Path) -> None:
+    runs = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def refresh(params):
+            runs.append(params)
+            await release.wait()
+            return {"new_articles": 3}
+
+        async def broken(params):
+            raise RuntimeError("feed down")
+
+        runner = JobRunner(session_factory=_session_factory(tmp_path), workers=2)
+        runner.register("refresh", refresh)
+        runner.register("broken", broken)
+        await runner.start()
+
+        jobs = await asyncio.gather(*(runner.submit("refresh") for _ in range(5)))
+        assert len({job["id"] for job in jobs}) == 1
+        assert sum(not job["deduplicated"] for job in jobs) == 1
+
+        failed = await runner.submit("broken")
+        await asyncio.sleep(0.05)
+        release.set()
+        await runner.join()
+        await runner.stop()
+
+        done = runner.get(jobs[0]["id"])
+        assert done["status"] == "succeeded"
+        assert done["result"] == {"new_articles": 3}
+        assert runner.get(failed["id"])["error"] == "RuntimeError: feed down"
+
+        # Once finished, the same kind can be queued again.
+        again = await runner.submit("refresh")
+        assert again["id"] != jobs[0]["id"] and not again["deduplicated"]
+
+    asyncio.run(scenario())
+    assert len(runs) == 1
+
+
+def test_unfinished_jobs_survive_a_restart(tmp_path: Path) -> None:
+    Session = _session_factory(tmp_path)
+    ran = []
+
+    async def handler(params):
+        ran.append(params["n"])
+
+    async def scenario():
+        before = JobRunner(session_factory=Session)
+        before.register("work", handler)
+        first = await before.submit("work", {"n": 1}, dedupe_key="a")
+        await before.submit("work", {"n": 2}, dedupe_key="b")
+
+        # Simulate a process that died mid-run.
+        db = Session()
+        db.get(BackgroundJob, first["id"]).status = "running"
+        db.commit()
+        db.close()
+
+        # Another process's job kind, which this runner has no handler for.
+        other = JobRunner(session_factory=Session)
+        other.register("elsewhere", handler)
+        foreign = await other.submit("elsewhere", {"n": 3})
+
+        after = JobRunner(session_factory=Session)
+        after.register("work", handler)
+        recovered_ids = await after.start()
+        await after.join()
+        await after.stop()
+        assert len(recovered_ids) == 2 and foreign["id"] not in recovered_ids
+        return after.get(first["id"]), after.get(foreign["id"])
+
+    recovered, foreign = asyncio.run(scenario())
+    assert sorted(ran) == [1, 2]
+    assert recovered["status"] == "succeeded"
+    assert foreign["status"] == "queued"
+
+
+def test_job_interrupted_too_often_is_failed_not_requeued(tmp_path: Path) -> None:
+    Session = _session_factory(tmp_path)
+    ran = []
+
+    async def handler(params):
+        ran.append(params)
+
+    async def scenario():
+        runner = JobRunner(session_factory=Session, max_attempts=2)
+        runner.register("work", handler)
+        poison = await runner.submit("work", dedupe_key="poison")
+        retry = await runner.submit("work", dedupe_key="retry")
+
+        # Both died mid-run; the poison job has already been claimed twice.
+        db = Session()
+        for job_id, attempts in ((poison["id"], 2), (retry["id"], 1)):
+            job = db.get(BackgroundJob, job_id)
+            job.status, job.attempts = "running", attempts
+        db.commit()
+        db.close()
+
+        recovered_ids = await runner.start()
+        await runner.join()
+        await runner.stop()
+        assert recovered_ids == [retry["id"]]
+        return runner.get(poison["id"]), runner.get(retry["id"])
+
+    poison, retry = asyncio.run(scenario())
+    assert len(ran) == 1
+    assert poison["status"] == "failed" and "not retried" in poison["error"]
+    assert retry["status"] == "succeeded" and retry["attempts"] == 2
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.services.llm_clients import LLMClientRegistry
+
+
+class _FakeClient:
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_clients_are_reused_per_provider_and_key() -> None:
+    registry = LLMClientRegistry()
+    first = registry.get("openai", "sk-a", _FakeClient)
+
+    assert registry.get("openai", "sk-a", _FakeClient) is first
+    assert registry.get("openai", "sk-b", _FakeClient) is not first
+    assert registry.get("anthropic", "sk-a", _FakeClient) is not first
+    assert len(registry) == 3
+    assert all("sk-a" not in key_id for _, key_id in registry._clients)
+
+
+def test_least_recently_used_client_is_evicted_and_closed() -> None:
+    async def scenario() -> None:
+        registry = LLMClientRegistry(max_clients=2)
+        a = registry.get("openai", "a", _FakeClient)
+        b = registry.get("openai", "b", _FakeClient)
+        registry.get("openai", "a", _FakeClient)  # a is now most recent
+        registry.get("openai", "c", _FakeClient)
+        await asyncio.sleep(0)
+
+        assert b.closed and not a.closed
+        assert registry.get("openai", "a", _FakeClient) is a
+        await registry.aclose()
+        assert a.closed and len(registry) == 0
+
+    asyncio.run(scenario())
+
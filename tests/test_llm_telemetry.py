@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.llm_call import LLMCall
+from app.services.llm_pricing import calculate_cost
+from app.services.llm_telemetry import LLMTelemetry, percentile
+
+
+def test_cost_uses_per_million_prices_and_dated_model_ids() -> None:
+    assert calculate_cost("openai", "gpt-4o-mini", 1_000_000, 1_000_000) == pytest.approx(0.75)
+    assert calculate_cost("anthropic", "claude-haiku-4-5-20251001", 2000, 500) == pytest.approx(0.0045)
+    assert calculate_cost("anthropic", "unknown-model", 2000, 500) == 0.0
+
+
+def test_tracked_calls_are_buffered_flushed_and_summarised(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'telemetry.db'}")
+    Session = sessionmaker(bind=engine)
+    telemetry = LLMTelemetry(session_factory=Session)
+
+    for latency in (100, 200, 300, 400):
+        telemetry.record("pipeline.analyse", "anthropic", "claude-haiku-4-5-20251001",
+                         input_tokens=1000, output_tokens=200, latency_ms=latency)
+    with telemetry.track("interview_coach", "openai", "gpt-4o-mini") as call:
+        call.input_tokens, call.output_tokens, call.retries = 500, 100, 1
+    with pytest.raises(RuntimeError):
+        with telemetry.track("interview_coach", "openai", "gpt-4o-mini"):
+            raise RuntimeError("rate limited")
+
+    assert telemetry.flush() == 6
+    assert telemetry.flush() == 0
+
+    with Session() as db:
+        failed = db.query(LLMCall).filter(LLMCall.success.is_(False)).one()
+        assert "rate limited" in failed.error
+        report = {row["stage"]: row for row in telemetry.summary(db)}
+
+    analyse = report["pipeline.analyse"]
+    assert analyse["calls"] == 4 and analyse["errors"] == 0
+    assert (analyse["p50_ms"], analyse["p95_ms"]) == (200, 400)
+    assert analyse["cost_usd"] == pytest.approx(4 * 0.002, abs=1e-4)
+    coach = report["interview_coach"]
+    assert (coach["calls"], coach["errors"], coach["retries"]) == (2, 1, 1)
+
+
+def test_percentile_is_nearest_rank() -> None:
+    assert percentile([], 50) == 0.0
+    assert percentile([5.0], 95) == 5.0
+    assert percentile(list(range(1, 101)), 95) == 95
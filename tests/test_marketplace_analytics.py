@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+
+from app.services import analytics
+from app.services.analytics import get_snapshot
+
+
+def _reference_category_revenue(date_range_days: int) -> dict:
+    """Row-at-a-time recomputation from the scale-1 mock rows."""
+    start, end = analytics._resolve_range(date_range_days)
+    sellers, listings, sales = analytics._load_mock_data(end)
+    category_of = {listing.id: listing.category for listing in listings}
+    revenue: dict = {}
+    for sale in sales:
+        if start <= sale.timestamp <= end:
+            category = category_of[sale.listing_id]
+            revenue[category] = revenue.get(category, 0.0) + sale.amount
+    return revenue
+
+
+def test_cube_snapshot_matches_row_level_totals() -> None:
+    snapshot = get_snapshot(date_range_days=90, category="all", sort_by="revenue", sort_dir="desc", scale=1)
+    expected = _reference_category_revenue(90)
+
+    for row in snapshot.categories:
+        assert math.isclose(row.revenue, expected.get(row.category, 0.0), abs_tol=1e-6)
+    assert math.isclose(snapshot.overview.total_revenue, sum(expected.values()), abs_tol=1e-6)
+    assert [row.revenue for row in snapshot.categories] == sorted(
+        (row.revenue for row in snapshot.categories), reverse=True
+    )
+
+
+def test_category_filter_and_synthetic_scale_are_consistent() -> None:
+    snapshot = get_snapshot(date_range_days=365, category="Home", sort_by="category", sort_dir="asc", scale=20)
+
+    assert snapshot.engine.sales > 10_000
+    assert [row.category for row in snapshot.categories] == ["Home"]
+    assert math.isclose(snapshot.categories[0].revenue, snapshot.overview.total_revenue, rel_tol=1e-9)
+
+    # The last four weekly buckets cover exactly the last 28 days.
+    last_28_days = get_snapshot(date_range_days=27, category="Home", sort_by="revenue", sort_dir="desc", scale=20)
+    assert math.isclose(
+        sum(point.revenue for point in snapshot.trends[-4:]), last_28_days.overview.total_revenue, rel_tol=1e-6
+    )
+
+    unknown = get_snapshot(date_range_days=30, category="Unknown", sort_by="revenue", sort_dir="desc", scale=20)
+    assert unknown.overview.total_revenue == 0.0
+    assert unknown.categories == []
+
+
+def test_cohorts_come_from_the_cube_and_snapshots_are_memoized() -> None:
+    snapshot = get_snapshot(date_range_days=365, category="all", sort_by="revenue", sort_dir="desc", scale=1)
+    assert get_snapshot(date_range_days=365, category="all", sort_by="revenue", sort_dir="desc", scale=1) is snapshot
+
+    start, end = analytics._resolve_range(365)
+    sellers, listings, sales = analytics._load_mock_data(end)
+    signup = {seller.id: seller.signup_date for seller in sellers}
+    seller_of = {listing.id: listing.seller_id for listing in listings}
+    expected: dict = {}
+    for sale in sales:
+        if not start <= sale.timestamp <= end:
+            continue
+        signed_up = signup[seller_of[sale.listing_id]]
+        cohort = expected.setdefault(signed_up.strftime("%b %Y"), [0.0, 0.0])
+        days = (sale.timestamp - signed_up).days
+        if 0 <= days < 30:
+            cohort[0] += sale.amount
+        elif 30 <= days < 60:
+            cohort[1] += sale.amount
+
+    assert {row.cohort for row in snapshot.cohorts} == set(expected)
+    for row in snapshot.cohorts:
+        assert math.isclose(row.month1_revenue, expected[row.cohort][0], abs_tol=1e-6)
+        assert math.isclose(row.month2_revenue, expected[row.cohort][1], abs_tol=1e-6)
+
+
+def test_cache_hits_report_their_own_timing() -> None:
+    filters = dict(date_range_days=180, category="all", sort_by="revenue", sort_dir="asc", scale=1)
+    analytics._SNAPSHOT_CACHE.clear()
+    first, computed = analytics.get_snapshot_timed(**filters)
+    again, hit = analytics.get_snapshot_timed(**filters)
+
+    assert again is first and not computed.cache_hit and hit.cache_hit
+    assert computed.served_ms >= first.engine.compute_ms
+    assert hit.served_ms < first.engine.compute_ms
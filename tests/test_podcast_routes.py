@@ -62,3 +62,40 @@ def test_api_requires_auth() -> None:
         files={"audio": ("episode.mp3", BytesIO(b"audio"), "audio/mpeg")},
     )
     assert response.status_code == 401
+
+
+def test_feed_xml_supports_conditional_get_and_gzip() -> None:
+    first = client.get("/podcast/feed.xml", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    cached = client.get("/podcast/feed.xml", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    plain = client.get("/podcast/feed.xml", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.text == first.text
+
+
+def test_audio_serves_ranges_and_conditional_requests() -> None:
+    url = "/podcast/audio/2026-05-10.mp3"
+    full = client.get(url)
+    assert full.status_code == 200
+    etag = full.headers["etag"]
+
+    partial = client.get(url, headers={"Range": "bytes=0-99"})
+    assert partial.status_code == 206
+    assert partial.content == full.content[:100]
+    assert partial.headers["content-range"] == f"bytes 0-99/{len(full.content)}"
+
+    multi = client.get(url, headers={"Range": "bytes=0-9,-10"})
+    assert multi.status_code == 206
+    assert multi.headers["content-type"].startswith("multipart/byteranges")
+    assert full.content[-10:] in multi.content
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'}).status_code == 200
+    assert client.get(url, headers={"Range": f"bytes={len(full.content)}-"}).status_code == 416
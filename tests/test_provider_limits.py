@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from app.services.provider_limits import ProviderLimit, ProviderLimiter
+
+
+def test_concurrency_and_rate_are_capped_per_provider() -> None:
+    limiter = ProviderLimiter({
+        "xai": ProviderLimit(concurrency=2),
+        "openai": ProviderLimit(concurrency=10, per_minute=600),  # one start per 0.1s
+    })
+    active = {"xai": 0, "openai": 0, "local": 0}
+    peak = dict(active)
+    starts = []
+
+    async def call(provider: str) -> None:
+        async with limiter.slot(provider):
+            if provider == "openai":
+                starts.append(time.monotonic())
+            active[provider] += 1
+            peak[provider] = max(peak[provider], active[provider])
+            await asyncio.sleep(0.05)
+            active[provider] -= 1
+
+    async def scenario() -> None:
+        await asyncio.gather(*(call(p) for p in ["xai"] * 6 + ["openai"] * 4 + ["local"] * 5))
+
+    asyncio.run(scenario())
+
+    assert peak == {"xai": 2, "openai": 1, "local": 5}
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 4 and min(gaps) >= 0.09
+    assert limiter.stats()["xai"]["calls"] == 6 and "local" not in limiter.stats()
+
+
+def test_cancelled_calls_keep_their_permit_until_the_thread_returns() -> None:
+    limiter = ProviderLimiter({"xai": ProviderLimit(concurrency=1)})
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def request() -> str:
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(0.1)  # a blocking HTTP call cancellation cannot interrupt
+        with lock:
+            in_flight["now"] -= 1
+        return "ok"
+
+    async def scenario() -> list:
+        losers = [asyncio.create_task(limiter.call("xai", request)) for _ in range(3)]
+        await asyncio.sleep(0.02)
+        for task in losers:
+            task.cancel()  # as the roundtable engine does with losing speculations
+        results = await asyncio.gather(*(limiter.call("xai", request) for _ in range(2)))
+        await asyncio.gather(*losers, return_exceptions=True)
+        return results
+
+    assert asyncio.run(scenario()) == ["ok", "ok"]
+    assert in_flight["peak"] == 1
+    assert limiter.stats()["xai"]["calls"] == 3  # two losers never got a permit
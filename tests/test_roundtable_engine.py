@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from app.services.roundtable_engine import TurnSlot, run_turns
+
+SPEAKERS = {key: {"name": key.title()} for key in ("believer", "skeptic", "realist")}
+
+
+class FakeProvider:
+    """Replies "<speaker>@<turn>" after a delay; speakers in `down` raise."""
+
+    def __init__(self, delay: float = 0.05, down: tuple = ()) -> None:
+        self.delay = delay
+        self.down = set(down)
+        self.calls: list = []
+
+    async def generate(self, speaker: str, slot: TurnSlot, history: list) -> str:
+        self.calls.append((slot.index, speaker, len(history)))
+        await asyncio.sleep(self.delay)
+        if speaker in self.down:
+            raise ConnectionError(f"{speaker} provider down")
+        return f"{speaker}@{slot.index}"
+
+
+def _rotation(speculate: int = 1):
+    def schedule(index: int, transcript: list) -> TurnSlot:
+        order = ["believer", "skeptic", "realist"]
+        picked = order[index % 3]
+        return TurnSlot(index, (picked,) + tuple(p for p in order if p != picked)[:1], speculate=speculate)
+    return schedule
+
+
+def test_speculated_runner_up_stands_in_when_the_picked_provider_fails(tmp_path: Path) -> None:
+    provider = FakeProvider(down=("skeptic",))
+    live = tmp_path / "episode.live.jsonl"
+
+    report = asyncio.run(run_turns(4, _rotation(speculate=2), provider.generate, SPEAKERS, transcript_path=live))
+
+    assert [t["text"] for t in report.transcript] == ["believer@0", "believer@1", "realist@2", "believer@3"]
+    assert report.transcript[1]["name"] == "Believer"
+    assert report.fallbacks_used == 1 and report.speculative_calls == 4
+    # Both candidates of a turn saw the same history and ran side by side.
+    assert {(i, n) for i, _, n in provider.calls} == {(0, 0), (1, 1), (2, 2), (3, 3)}
+    assert report.wall_seconds < 4 * provider.delay + 0.15
+
+    lines = [json.loads(line) for line in live.read_text().splitlines()]
+    assert [line["turn"] for line in lines] == [1, 2, 3, 4]
+
+    alone = asyncio.run(run_turns(
+        1, lambda i, t: TurnSlot(i, ("skeptic",)), provider.generate, SPEAKERS,
+        failure_text=lambda speaker, error: f"[{speaker} skipped: {error}]",
+    ))
+    assert alone.transcript[0]["text"] == "[skeptic skipped: ConnectionError: skeptic provider down]"
+
+
+def test_runner_ups_start_only_after_a_failure_by_default() -> None:
+    provider = FakeProvider(down=("skeptic",))
+
+    report = asyncio.run(run_turns(4, _rotation(), provider.generate, SPEAKERS))
+
+    assert [t["text"] for t in report.transcript] == ["believer@0", "believer@1", "realist@2", "believer@3"]
+    assert report.speculative_calls == 0 and report.fallbacks_used == 1
+    # One call per turn, plus the fallback for the failed one.
+    assert [(i, speaker) for i, speaker, _ in provider.calls] == [
+        (0, "believer"), (1, "skeptic"), (1, "believer"), (2, "realist"), (3, "believer"),
+    ]
+
+
+def test_background_work_overlaps_the_next_turn() -> None:
+    provider = FakeProvider(delay=0.1)
+    rendered = []
+
+    async def render(turn: dict) -> None:
+        await asyncio.sleep(0.1)
+        rendered.append(turn["turn"])
+
+    report = asyncio.run(run_turns(
+        5, lambda i, t: TurnSlot(i, ("realist",)), provider.generate, SPEAKERS, on_turn=render,
+    ))
+
+    assert rendered == [1, 2, 3, 4, 5]
+    assert report.speculative_calls == 0
+    assert report.background_seconds >= 0.5
+    # Timing covers the turn loop only: renders overlap it instead of extending it.
+    assert 0.5 <= report.wall_seconds < 0.7
+    assert "saved_seconds" not in report.as_dict()
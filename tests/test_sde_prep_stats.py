@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 — registers users for the foreign keys
+from app.database import Base
+from app.models.sde_prep import (
+    BehavioralStory,
+    DailyLog,
+    DifficultyEnum,
+    LeetCodeProblem,
+    ProblemCategoryEnum,
+    ProblemStatusEnum,
+    SystemDesignStatusEnum,
+    SystemDesignTopic,
+    WeekPlan,
+)
+from app.services.sde_prep_stats import STREAK_WINDOW_DAYS, StatsCache, compute_stats
+
+TODAY = date(2026, 10, 19)
+TABLES = [LeetCodeProblem, SystemDesignTopic, BehavioralStory, WeekPlan, DailyLog]
+
+
+def _seed(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'sde.db'}")
+    Base.metadata.create_all(bind=engine, tables=[model.__table__ for model in TABLES])
+    db = sessionmaker(bind=engine)()
+    problems = [
+        (DifficultyEnum.EASY, ProblemStatusEnum.COMPLETED, True),
+        (DifficultyEnum.EASY, ProblemStatusEnum.COMPLETED, False),
+        (DifficultyEnum.MEDIUM, ProblemStatusEnum.IN_PROGRESS, True),
+        (DifficultyEnum.HARD, ProblemStatusEnum.COMPLETED, True),
+        (DifficultyEnum.HARD, ProblemStatusEnum.NOT_STARTED, False),
+    ]
+    for number, (difficulty, status, blind) in enumerate(problems, start=1):
+        db.add(LeetCodeProblem(
+            user_id=1, number=number, title=f"P{number}", difficulty=difficulty, status=status,
+            category=ProblemCategoryEnum.ARRAYS, url="https://leetcode.com", is_blind_75=blind,
+        ))
+    db.add(LeetCodeProblem(
+        user_id=2, number=99, title="Other user", difficulty=DifficultyEnum.EASY, url="https://leetcode.com",
+        status=ProblemStatusEnum.COMPLETED, category=ProblemCategoryEnum.ARRAYS,
+    ))
+    for status in (SystemDesignStatusEnum.CONFIDENT, SystemDesignStatusEnum.PRACTICING):
+        db.add(SystemDesignTopic(user_id=1, title=status.value, status=status))
+    db.add(BehavioralStory(user_id=1, title="S", category="Ownership", is_ready=True))
+    for number, pct, done in [(1, 100.0, True), (2, 40.0, False), (3, 0.0, False)]:
+        db.add(WeekPlan(user_id=1, week_number=number, title=f"Week {number}", completion_percentage=pct, is_completed=done))
+    # A streak longer than one window, then a gap, then an older log.
+    streak = STREAK_WINDOW_DAYS + 10
+    for offset in list(range(streak)) + [streak + 5]:
+        db.add(DailyLog(user_id=1, date=TODAY - timedelta(days=offset), study_hours=offset % 4))
+    db.commit()
+    return engine, db
+
+
+def test_stats_come_from_grouped_queries(tmp_path: Path) -> None:
+    engine, db = _seed(tmp_path)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    stats = compute_stats(db, user_id=1, today=TODAY)
+
+    assert stats["leetcode"] == {
+        "solved": 3, "total": 5, "percentage": 60.0, "blind_75_count": 3,
+        "by_difficulty": {"EASY": 2, "MEDIUM": 1, "HARD": 2},
+    }
+    assert stats["system_design"] == {"confident": 1, "total": 2, "percentage": 50.0}
+    assert stats["behavioral"] == {"ready": 1, "total": 1, "percentage": 100.0}
+    assert stats["current_week"] == {"title": "Week 2", "percentage": 40.0}
+    assert [w["week"] for w in stats["charts_data"]["weekly_progress"]] == [1, 2, 3]
+    assert stats["streak_days"] == STREAK_WINDOW_DAYS + 10
+    assert stats["charts_data"]["study_hours"]["values"][-3:] == [2, 1, 0]
+    # Five aggregate queries plus one extra window for the long streak.
+    assert len(statements) == 6
+
+
+def test_cache_serves_until_invalidated(tmp_path: Path) -> None:
+    _, db = _seed(tmp_path)
+    cache = StatsCache(ttl_seconds=60)
+
+    first = cache.get(db, 1)
+    assert cache.get(db, 1) is first and cache.hits == 1
+
+    db.query(BehavioralStory).update({"is_ready": False})
+    db.commit()
+    assert cache.get(db, 1)["behavioral"]["ready"] == 1  # still cached
+    cache.invalidate(1)
+    assert cache.get(db, 1)["behavioral"]["ready"] == 0
+    assert cache.get(db, 2)["leetcode"]["total"] == 1
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+from app.services.tts_pipeline import Segment, concat_mp3, split_script, synthesize
+
+
+class FakeTTS:
+    """Writes "voice:text" after a delay; fails the first `flaky` calls per text."""
+
+    name = "fake"
+
+    def __init__(self, delay: float = 0.05, flaky: int = 0) -> None:
+        self.delay = delay
+        self.flaky = flaky
+        self.calls: list = []
+        self.active = self.peak = 0
+
+    async def synthesize(self, text: str, voice: str, out_path: Path) -> None:
+        self.calls.append(text)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.calls.count(text) <= self.flaky:
+                raise ConnectionError("transient")
+            out_path.write_bytes(f"{voice}:{text}|".encode())
+        finally:
+            self.active -= 1
+
+
+def _turns(n: int) -> list:
+    return [Segment(f"Turn {i} text.", "en-US-AvaNeural", f"{i:02d}") for i in range(n)]
+
+
+def test_segments_render_concurrently_and_are_cached(tmp_path: Path) -> None:
+    backend = FakeTTS(delay=0.1)
+    started = time.perf_counter()
+    results = asyncio.run(synthesize(_turns(12), tmp_path, backend=backend, concurrency=12))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6  # serial would be 1.2s
+    assert backend.peak == 12
+    assert [r.segment.label for r in results] == [f"{i:02d}" for i in range(12)]
+    assert all(r.path and not r.cached for r in results)
+
+    edited = _turns(12)
+    edited[5] = Segment("Turn 5, rewritten.", "en-US-AvaNeural", "05")
+    again = asyncio.run(synthesize(edited, tmp_path, backend=backend, concurrency=12))
+    assert len(backend.calls) == 13
+    assert [r.cached for r in again].count(False) == 1
+
+    out = tmp_path / "episode.mp3"
+    concat_mp3([r.path for r in again[:2]], out)
+    assert out.read_bytes() == b"en-US-AvaNeural:Turn 0 text.|en-US-AvaNeural:Turn 1 text.|"
+
+
+def test_retries_bounded_concurrency_and_shared_duplicates(tmp_path: Path) -> None:
+    backend = FakeTTS(delay=0.01, flaky=1)
+    segments = _turns(6) + [Segment("Turn 0 text.", "en-US-AvaNeural", "dup")]
+    results = asyncio.run(
+        synthesize(segments, tmp_path, backend=backend, concurrency=2, retries=1, backoff_seconds=0)
+    )
+
+    assert backend.peak <= 2
+    assert all(r.path is not None and r.attempts == 2 for r in results)
+    assert results[-1].segment.label == "dup" and results[-1].path == results[0].path
+    assert len(backend.calls) == 12  # six texts, each failed once
+
+    failing = FakeTTS(delay=0, flaky=5)
+    [failed] = asyncio.run(
+        synthesize([Segment("Never works.", "v")], tmp_path, backend=failing, retries=2, backoff_seconds=0)
+    )
+    assert failed.path is None and failed.attempts == 3 and "transient" in failed.error
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_split_script_keeps_sentences_whole() -> None:
+    script = "One sentence here. " * 40
+    chunks = split_script(script, max_chars=100)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert " ".join(chunks) == script.strip()
+
+
+def test_empty_brief_script_produces_no_audio(tmp_path: Path) -> None:
+    from app.services.brief_service import BriefService
+
+    out = tmp_path / "brief.mp3"
+    assert asyncio.run(BriefService()._generate_audio("   ", out)) is False
+    assert not out.exists()